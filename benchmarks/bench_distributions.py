@@ -0,0 +1,150 @@
+from functools import partial
+from typing import Callable
+import numpy as np
+from scipy import stats
+
+from benchmarks.harness import register, time_call
+from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+from sdatools.distributions.abstract.distribution import Distribution
+from sdatools.distributions.continuous.affine import AffineDistribution
+from sdatools.distributions.continuous.beta import BetaDistribution
+from sdatools.distributions.continuous.convolution import ConvolutionDistribution
+from sdatools.distributions.continuous.egb2 import EGB2Distribution
+from sdatools.distributions.continuous.empirical import EmpiricalDistribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.irwin_hall import IrwinHallDistribution
+from sdatools.distributions.continuous.jsu import JohnsonSUDistribution
+from sdatools.distributions.continuous.kde import KDEDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.mixture import MixtureDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.skewnormal import SkewNormalDistribution
+from sdatools.distributions.continuous.truncated import TruncatedDistribution
+from sdatools.distributions.continuous.uniform import UniformDistribution
+from sdatools.distributions.continuous.weibull import WeibullDistribution
+from sdatools.distributions.discrete.bernoulli import BernoulliDistribution
+from sdatools.distributions.discrete.binomial import BinomialDistribution
+from sdatools.distributions.discrete.geometric import GeometricDistribution
+from sdatools.distributions.discrete.poisson import PoissonDistribution
+from sdatools.distributions.discrete.uniform import DiscreteUniformDistribution
+
+
+# Numbers of elements evaluated or sampled per call. Sizes above QUICK_MAX_SIZE are skipped by quick runs.
+SIZES: tuple[int, ...] = (1, 10 ** 3, 10 ** 5, 10 ** 7)
+QUICK_MAX_SIZE: int = 10 ** 5
+
+# Largest size timed for methods that only accept scalars, which are timed element by element
+SCALAR_MAX_SIZE: int = 10 ** 3
+
+# One representative instance of every distribution, built on first use
+DISTRIBUTIONS: dict[str, Callable[[], Distribution]] = {
+    "Affine": lambda: AffineDistribution(GammaDistribution(2.0, 1.0), scale=2.0, shift=1.0),
+    "Beta": lambda: BetaDistribution(2.0, 5.0),
+    "Convolution": lambda: ConvolutionDistribution([GammaDistribution(2.0, 1.0), WeibullDistribution(1.5, 1.0)]),
+    "EGB2": lambda: EGB2Distribution(0.0, 1.0, 2.0, 3.0),
+    "Empirical": lambda: EmpiricalDistribution(np.random.default_rng(0).normal(size=10_000)),
+    "Exponential": lambda: ExponentialDistribution(2.0),
+    "Gamma": lambda: GammaDistribution(2.5, 2.0),
+    "IrwinHall": lambda: IrwinHallDistribution(12),
+    "JohnsonSU": lambda: JohnsonSUDistribution(0.5, 1.5, 0.0, 1.0),
+    "KDE": lambda: KDEDistribution(np.random.default_rng(0).normal(size=10_000)),
+    "LogNormal": lambda: LogNormalDistribution(0.1, 0.5),
+    "Mixture": lambda: MixtureDistribution([NormalDistribution(-1.0, 0.5), NormalDistribution(1.0, 1.0)], [0.3, 0.7]),
+    "Normal": lambda: NormalDistribution(0.5, 2.0),
+    "SkewNormal": lambda: SkewNormalDistribution(0.0, 1.0, 3.0),
+    "Truncated": lambda: TruncatedDistribution(NormalDistribution(0.0, 1.0), -1.0, 2.0),
+    "Uniform": lambda: UniformDistribution(-1.0, 3.0),
+    "Weibull": lambda: WeibullDistribution(1.5, 2.0),
+    "Bernoulli": lambda: BernoulliDistribution(0.3),
+    "Binomial": lambda: BinomialDistribution(20, 0.3),
+    "Geometric": lambda: GeometricDistribution(0.2),
+    "Poisson": lambda: PoissonDistribution(4.0),
+    "DiscreteUniform": lambda: DiscreteUniformDistribution(1, 6),
+}
+
+
+# scipy.stats equivalents of distributions implemented without scipy, to time them against on SCIPY_SIZE elements
+SCIPY_REFERENCES: dict[str, Callable[[], object]] = {
+    "Beta": lambda: stats.beta(2.0, 5.0),
+}
+SCIPY_METHODS: dict[str, str] = {"cdf": "cdf", "inverse_cdf": "ppf"}
+SCIPY_SIZE: int = 10 ** 5
+
+
+def probabilities(size: int) -> np.ndarray:
+    """
+    size probabilities spread evenly over (0, 1)
+    """
+    return (np.arange(size) + 0.5) / size
+
+
+def points(dist: Distribution, size: int) -> np.ndarray:
+    """
+    size points spread over the bulk of the distribution, from its 0.1% to 99.9% quantiles where
+    inverse_cdf is implemented, or its median +/- 10 half-interquartile ranges (clipped to the domain) where not
+    """
+    try:
+        lo, hi = (float(q) for q in dist.inverse_cdf(np.array([0.001, 0.999])))
+    except NotImplementedError:
+        centre, scale = dist._location_scale()
+        lo, hi = max(centre - 10 * scale, float(dist.domain[0])), min(centre + 10 * scale, float(dist.domain[-1]))
+    x = np.linspace(lo, hi, size) if size > 1 else np.array([(lo + hi) / 2])
+    return x if isinstance(dist, ContinuousDistribution) else np.round(x).astype(np.int64)
+
+
+def method_setup(factory: Callable[[], Distribution], method: str, size: int) -> Callable:
+    dist = factory()
+    if method == "density":
+        method = "pdf" if isinstance(dist, ContinuousDistribution) else "pmf"
+    func = getattr(dist, method)
+    x = probabilities(size) if method == "inverse_cdf" else points(dist, size)
+    try:
+        func(x[:1])  # Raises NotImplementedError (skipping the benchmark) before any timing
+    except (TypeError, ValueError):
+        # Scalar-only methods (e.g. the Binomial pmf) are timed as a loop over the elements, at small sizes
+        if size > SCALAR_MAX_SIZE:
+            raise NotImplementedError(f"{type(dist).__name__}.{method} does not accept arrays.")
+        values = x.tolist()
+        return lambda: [func(value) for value in values]
+    return partial(func, x)
+
+
+def scipy_benchmark(name: str, method: str) -> tuple[Callable, Callable]:
+    """
+    Setup and metrics timing a method against its scipy.stats equivalent on the same SCIPY_SIZE elements. The
+    metrics are scipy's time per call and the ratio of the two times, which is comparable across machines.
+    """
+    state = {}
+    def setup():
+        dist, reference = DISTRIBUTIONS[name](), SCIPY_REFERENCES[name]()
+        x = probabilities(SCIPY_SIZE) if method == "inverse_cdf" else points(dist, SCIPY_SIZE)
+        ours, theirs = partial(getattr(dist, method), x), partial(getattr(reference, SCIPY_METHODS[method]), x)
+        seconds, scipy_seconds = time_call(ours)[0], time_call(theirs)[0]
+        state.update(scipy_seconds=scipy_seconds, ratio_to_scipy=seconds / scipy_seconds)
+        return ours
+    return setup, lambda: dict(state)
+
+
+def sample_setup(factory: Callable[[], Distribution], size: int) -> Callable:
+    dist = factory()
+    rng = np.random.default_rng(0)
+    return partial(dist.sample, size, rng=rng)
+
+
+# pdf (or pmf), cdf, inverse_cdf and sample of every distribution, at every size. Sizes are the outer loop so that
+# the 10^7-element benchmarks run last, and quick and full runs time the smaller sizes in the same conditions.
+
+for size in SIZES:
+    quick = size <= QUICK_MAX_SIZE
+    for name, factory in DISTRIBUTIONS.items():
+        for method in ("density", "cdf", "inverse_cdf"):
+            register(f"distributions.{name}.{method}.n{size}", partial(method_setup, factory, method, size), quick=quick)
+        register(f"distributions.{name}.sample.n{size}", partial(sample_setup, factory, size), quick=quick)
+
+
+# Distributions implemented without scipy, against scipy.stats
+
+for name in SCIPY_REFERENCES:
+    for method in SCIPY_METHODS:
+        register(f"distributions.{name}.{method}.vs_scipy", *scipy_benchmark(name, method))
@@ -0,0 +1,50 @@
+from contextlib import redirect_stdout
+from functools import partial
+from io import StringIO
+from typing import Callable
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from benchmarks.harness import register
+from sdatools.distributions.abstract.distribution import Distribution
+from sdatools.distributions.continuous.beta import BetaDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.parameter_estimation.method_of_moments import MethodOfMoments
+from sdatools.validation.goodness_of_fit.ks_test import KSTest
+
+
+SIZES: tuple[int, ...] = (10 ** 3, 10 ** 5)
+
+# Distributions fitted by MethodOfMoments, with the distribution the data are drawn from
+FITTED: dict[str, Distribution] = {
+    "Normal": NormalDistribution(0.5, 2.0),
+    "Gamma": GammaDistribution(2.5, 2.0),
+    "LogNormal": LogNormalDistribution(0.1, 0.5),
+    "Beta": BetaDistribution(2.0, 5.0),
+}
+
+
+def method_of_moments_setup(dist: Distribution, size: int) -> Callable:
+    data = dist.sample(size, rng=np.random.default_rng(0))
+    return lambda: MethodOfMoments(data).fit(type(dist))
+
+
+def ks_test_setup(size: int) -> Callable:
+    dist = NormalDistribution(0.0, 1.0)
+    data = dist.sample(size, rng=np.random.default_rng(0))
+    def run():
+        # KSTest prints its result and plots the empirical against the theoretical cdf
+        with redirect_stdout(StringIO()):
+            KSTest(data).test(dist)
+        plt.close("all")
+    return run
+
+
+for size in SIZES:
+    for name, dist in FITTED.items():
+        register(f"estimation.MethodOfMoments.{name}.n{size}", partial(method_of_moments_setup, dist, size))
+    register(f"validation.KSTest.Normal.n{size}", partial(ks_test_setup, size))
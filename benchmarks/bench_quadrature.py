@@ -0,0 +1,136 @@
+from functools import partial
+from math import cos, exp, log10, sin
+from typing import Callable
+import numpy as np
+
+from benchmarks.harness import register
+from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule
+from sdatools.numerical_methods.quadrature.double_exponential import DoubleExponentialIntegrator
+from sdatools.numerical_methods.quadrature.quadrature_engine import QuadratureEngine
+from sdatools.numerical_methods.quadrature.romberg import RombergIntegrator
+from sdatools.numerical_methods.quadrature.rules.boole import BooleRule
+from sdatools.numerical_methods.quadrature.rules.composite import CompositeRule
+from sdatools.numerical_methods.quadrature.rules.gauss_kronrod import GaussKronrodRule
+from sdatools.numerical_methods.quadrature.rules.gaussian import GaussHermiteRule, GaussLaguerreRule, GaussLegendreRule
+from sdatools.numerical_methods.quadrature.rules.simpson import Simpson38Rule, SimpsonRule
+from sdatools.numerical_methods.quadrature.rules.trapezium import TrapeziumRule
+
+
+# Reference integrand: exp(x) cos(3x) over [0, 2], with antiderivative exp(x) (cos(3x) + 3 sin(3x)) / 10
+A, B = 0.0, 2.0
+EXACT: float = (exp(B) * (cos(3 * B) + 3 * sin(3 * B)) - exp(A) * (cos(3 * A) + 3 * sin(3 * A))) / 10
+
+# Relative error targeted by the accuracy benchmarks, and the most subintervals tried to reach it
+TARGET: float = 1e-12
+MAX_SUBINTERVALS: int = 2 ** 20
+
+RULES: dict[str, QuadratureRule] = {
+    "TrapeziumRule": TrapeziumRule(),
+    "SimpsonRule": SimpsonRule(),
+    "Simpson38Rule": Simpson38Rule(),
+    "BooleRule": BooleRule(),
+    "GaussKronrodRule": GaussKronrodRule(),
+    "GaussLegendreRule(5)": GaussLegendreRule(5),
+    "GaussLegendreRule(20)": GaussLegendreRule(20),
+}
+
+
+def f(x: np.ndarray) -> np.ndarray:
+    return np.exp(x) * np.cos(3 * x)
+
+
+class CountingIntegrand:
+    """
+    f, counting the number of points it is evaluated at
+    """
+    def __init__(self):
+        self.evaluations = 0
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        self.evaluations += np.size(x)
+        return f(x)
+
+
+def accuracy_metrics(value: float, evaluations: int) -> dict[str, float]:
+    """
+    Evaluations, correct significant digits (capped at 16) and evaluations per digit of an estimate of EXACT
+    """
+    digits = min(16.0, -log10(max(abs(value / EXACT - 1), 1e-16)))
+    return {"evaluations": evaluations, "digits": digits, "evaluations_per_digit": evaluations / max(digits, 1.0)}
+
+
+def digits_benchmark(rule: QuadratureRule) -> tuple[Callable, Callable]:
+    """
+    Setup and metrics for the cheapest CompositeRule(rule, m), m a power of two, meeting the TARGET error
+    """
+    state = {}
+    def setup():
+        m = 1
+        while True:
+            counter = CountingIntegrand()
+            value = CompositeRule(rule, m).integrate(counter, A, B)
+            if abs(value / EXACT - 1) <= TARGET or m >= MAX_SUBINTERVALS:
+                break
+            m *= 2
+        composite = CompositeRule(rule, m)
+        state.update(accuracy_metrics(value, counter.evaluations), subintervals=m)
+        return lambda: composite.integrate(f, A, B)
+    return setup, lambda: dict(state)
+
+
+def engine_benchmark(integrator) -> tuple[Callable, Callable]:
+    state = {}
+    def setup():
+        counter = CountingIntegrand()
+        state.update(accuracy_metrics(integrator.integrate(counter, A, B).value, counter.evaluations))
+        return lambda: integrator.integrate(f, A, B)
+    return setup, lambda: dict(state)
+
+
+# Setups, returning the callable to time
+
+def rule_setup(rule: QuadratureRule) -> Callable:
+    return lambda: rule.integrate(f, A, B)
+
+
+def composite_setup(rule: QuadratureRule, m: int) -> Callable:
+    composite = CompositeRule(rule, m)
+    return lambda: composite.integrate(f, A, B)
+
+
+def batch_setup(rule: QuadratureRule, problems: int) -> Callable:
+    rates = np.linspace(0.1, 10.0, problems)
+    return lambda: rule.integrate_batch(lambda x, s: np.exp(-s * x), 0.0, 1.0, rates)
+
+
+def cumulative_setup(rule: QuadratureRule, points: int) -> Callable:
+    grid = np.linspace(A, B, points)
+    return lambda: rule.integrate_cumulative(f, grid)
+
+
+def expect_setup(rule: QuadratureRule, *params: float) -> Callable:
+    return lambda: rule.expect(np.cos, *params)
+
+
+# Single applications, composite rules, and vectorised batch and cumulative integration of each rule
+
+for name, rule in RULES.items():
+    register(f"quadrature.rule.{name}", partial(rule_setup, rule))
+    register(f"quadrature.composite.{name}.m1024", partial(composite_setup, rule, 1024))
+    register(f"quadrature.digits.{name}", *digits_benchmark(rule))
+    register(f"quadrature.batch.{name}.p10000", partial(batch_setup, rule, 10_000))
+    register(f"quadrature.cumulative.{name}.n10000", partial(cumulative_setup, rule, 10_000))
+
+
+# Weighted Gaussian rules
+
+register("quadrature.rule.GaussHermiteRule(32).expect", partial(expect_setup, GaussHermiteRule(32), 0.5, 2.0))
+register("quadrature.rule.GaussLaguerreRule(32, 1.5).expect", partial(expect_setup, GaussLaguerreRule(32, 1.5), 2.0))
+
+
+# Adaptive integrators, to the TARGET tolerance
+
+register("quadrature.engine.QuadratureEngine", *engine_benchmark(QuadratureEngine(abs_tol=0.0, rel_tol=TARGET)))
+register("quadrature.engine.RombergIntegrator", *engine_benchmark(RombergIntegrator(abs_tol=0.0, rel_tol=TARGET)))
+register("quadrature.engine.DoubleExponentialIntegrator",
+         *engine_benchmark(DoubleExponentialIntegrator(abs_tol=0.0, rel_tol=TARGET)))
@@ -0,0 +1,221 @@
+from __future__ import annotations
+import json
+import platform
+import re
+from time import perf_counter
+from typing import Callable, NamedTuple
+import numpy as np
+import scipy
+
+
+# Deterministic metrics where larger values are regressions, gated with the same threshold as wall time
+GATED_METRICS: tuple[str, ...] = ("evaluations", "evaluations_per_digit")
+
+# Timing differences below this many seconds per call are treated as noise, whatever the relative change
+NOISE_FLOOR: float = 2e-6
+
+
+class Benchmark(NamedTuple):
+    """
+    A named benchmark. setup() prepares its inputs (untimed) and returns the callable to time, and metrics(),
+    if given, returns extra measurements, e.g. the number of integrand evaluations used.
+    """
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    metrics: Callable[[], dict[str, float]] | None = None
+    quick: bool = True
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    Best wall time per call over the repeats, the number of calls per repeat, any extra metrics, and the spread
+    of the repeats (the slowest over the fastest, minus one).
+    """
+    name: str
+    seconds: float
+    number: int
+    repeats: int
+    metrics: dict[str, float]
+    spread: float = 0.0
+
+
+class Comparison(NamedTuple):
+    """
+    A result compared with its baseline: the ratio of current to baseline, and whether it is a regression.
+    A baseline entry with no current result (e.g. its setup now raises NotImplementedError) has measure
+    "missing", a NaN current value and ratio, and is always a regression.
+    """
+    name: str
+    measure: str
+    baseline: float
+    current: float
+    ratio: float
+    regression: bool
+
+
+# Registry of all benchmarks, filled by the bench_* modules on import
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def register(name: str,
+             setup: Callable[[], Callable[[], object]],
+             metrics: Callable[[], dict[str, float]] | None = None,
+             quick: bool = True) -> None:
+    """
+    Register a benchmark. Those with quick=False (e.g. on 10^7 elements) are skipped by quick runs.
+    """
+    if name in BENCHMARKS:
+        raise ValueError(f"Benchmark {name} is already registered.")
+    BENCHMARKS[name] = Benchmark(name, setup, metrics, quick)
+
+
+def select(pattern: str | None = None, quick: bool = False) -> list[Benchmark]:
+    """
+    The registered benchmarks whose names match the regular expression pattern, in registration order.
+    """
+    return [bench for name, bench in BENCHMARKS.items()
+            if (pattern is None or re.search(pattern, name)) and (bench.quick or not quick)]
+
+
+# Running
+
+def time_call(func: Callable[[], object], min_time: float = 0.1, max_repeats: int = 5,
+              budget: float = 2.0) -> tuple[float, int, int, float]:
+    """
+    Best time per call of func, like timeit: the number of calls per repeat is increased until a repeat takes
+    at least min_time, and further repeats are run while the total stays within budget (up to max_repeats).
+    The minimum over repeats is the least affected by other load on the machine, and the spread of the
+    repeats measures how noisy the timing is.
+
+    Returns:
+        tuple: (seconds per call, calls per repeat, repeats, spread)
+    """
+    number = 1
+    while True:
+        elapsed = _run(func, number)
+        if elapsed >= min_time or number >= 10 ** 6:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = [elapsed]
+    while len(times) < max_repeats and (len(times) + 1) * elapsed <= budget:
+        times.append(_run(func, number))
+    best = min(times)
+    return best / number, number, len(times), max(times) / best - 1 if best > 0 else 0.0
+
+
+def run(benchmarks: list[Benchmark], min_time: float = 0.1, log: Callable[[str], None] = print) -> dict[str, BenchmarkResult]:
+    """
+    Run each benchmark. Those whose setup or call raises NotImplementedError (e.g. a distribution with no
+    inverse_cdf) are skipped, and have no result.
+    """
+    results: dict[str, BenchmarkResult] = {}
+    for bench in benchmarks:
+        try:
+            func = bench.setup()
+            seconds, number, repeats, spread = time_call(func, min_time=min_time)
+        except NotImplementedError as error:
+            log(f"{bench.name:<60} skipped ({error or 'not implemented'})")
+            continue
+        metrics = bench.metrics() if bench.metrics is not None else {}
+        results[bench.name] = BenchmarkResult(bench.name, seconds, number, repeats, metrics, spread)
+        extra = "".join(f"  {key}={value:.4g}" for key, value in metrics.items())
+        log(f"{bench.name:<60} {_format_seconds(seconds):>10}{extra}")
+    return results
+
+
+def _run(func: Callable[[], object], number: int) -> float:
+    start = perf_counter()
+    for _ in range(number):
+        func()
+    return perf_counter() - start
+
+
+# Baselines
+
+def environment() -> dict[str, str]:
+    """
+    The machine and library versions, stored with the baselines since timings are only comparable on the same
+    machine and versions
+    """
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def save(results: dict[str, BenchmarkResult], path: str, existing: dict | None = None) -> None:
+    """
+    Write the results to a JSON baseline file, keeping the entries of an existing baseline that were not rerun.
+    """
+    entries = dict(existing["results"]) if existing else {}
+    entries.update({name: {"seconds": r.seconds, "number": r.number, "repeats": r.repeats, "spread": r.spread,
+                           "metrics": r.metrics}
+                    for name, r in results.items()})
+    with open(path, "w") as file:
+        json.dump({"environment": environment(), "results": dict(sorted(entries.items()))}, file, indent=1)
+        file.write("\n")
+
+
+def load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(results: dict[str, BenchmarkResult], baseline: dict, threshold: float = 0.25,
+            selected: list[str] | None = None, gate_time: bool = True) -> list[Comparison]:
+    """
+    Compare results with a baseline. A benchmark regresses if its time per call exceeds the baseline by more
+    than the fraction threshold plus the spread of the repeats (the larger of the current and baseline
+    spreads), and by more than NOISE_FLOOR; if one of the GATED_METRICS exceeds the baseline by more than the
+    threshold; or if it has a baseline entry, is among the selected names, and has no result. With
+    gate_time=False, times are compared for information only. Benchmarks missing from the baseline are not
+    compared.
+    """
+    comparisons = []
+    for name in selected or ():
+        reference = baseline["results"].get(name)
+        if reference is not None and name not in results:
+            comparisons.append(Comparison(name, "missing", reference["seconds"], np.nan, np.nan, True))
+    for name, result in results.items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        ratio = result.seconds / reference["seconds"]
+        allowance = threshold + max(result.spread, reference.get("spread", 0.0))
+        regression = (gate_time and ratio > 1 + allowance
+                      and result.seconds - reference["seconds"] > NOISE_FLOOR)
+        comparisons.append(Comparison(name, "seconds", reference["seconds"], result.seconds, ratio, regression))
+        for key in GATED_METRICS:
+            if key in result.metrics and key in reference["metrics"]:
+                base, current = reference["metrics"][key], result.metrics[key]
+                ratio = current / base if base else (1.0 if current == base else np.inf)
+                comparisons.append(Comparison(name, key, base, current, ratio, ratio > 1 + threshold))
+    return comparisons
+
+
+def report(comparisons: list[Comparison], log: Callable[[str], None] = print) -> int:
+    """
+    Print the comparisons, with regressions marked, and return the number of regressions.
+    """
+    for c in comparisons:
+        if c.measure == "missing":
+            log(f"{c.name:<60} {'seconds':<22} {_format_seconds(c.baseline):>10} -> {'no result':>10}  MISSING")
+            continue
+        if c.measure == "seconds":
+            base, current = _format_seconds(c.baseline), _format_seconds(c.current)
+        else:
+            base, current = f"{c.baseline:.4g}", f"{c.current:.4g}"
+        flag = "REGRESSION" if c.regression else ("faster" if c.ratio < 1 / 1.25 else "")
+        log(f"{c.name:<60} {c.measure:<22} {base:>10} -> {current:>10}  x{c.ratio:5.2f}  {flag}")
+    return sum(c.regression for c in comparisons)
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
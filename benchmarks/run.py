@@ -0,0 +1,84 @@
+"""
+Run the benchmark suite, optionally saving the results as baselines or gating them against stored baselines.
+
+    python -m benchmarks.run                                  # run everything and print the timings
+    python -m benchmarks.run --quick --filter quadrature      # skip 10^7-element benchmarks, run matching names
+    python -m benchmarks.run --save benchmarks/baselines.json # record (or update) baselines
+    python -m benchmarks.run --compare benchmarks/baselines.json --threshold 0.25
+
+With --compare, the exit status is 1 if any benchmark is slower than its baseline by more than the threshold
+(25% by default) plus the spread of its repeats, or uses more integrand evaluations by more than the threshold,
+or if a selected benchmark with a baseline no longer produces a result. Benchmarks flagged as slower are rerun
+(--retries times) and their best time kept before failing, so that a burst of load on the machine does not fail
+the comparison. --no-gate-time reports the timings without gating them, e.g. against baselines recorded on
+another machine.
+"""
+from __future__ import annotations
+import argparse
+import sys
+
+# Registration order is run order: the quadrature benchmarks run first, before the 10^7-element arrays of the
+# distribution benchmarks change the state of the memory allocator
+from benchmarks import bench_quadrature, bench_estimation, bench_distributions  # noqa: F401 (registration)
+from benchmarks.harness import BENCHMARKS, compare, environment, load, report, run, save, select
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Run the sdatools benchmarks.")
+    parser.add_argument("--filter", help="regular expression selecting benchmarks by name")
+    parser.add_argument("--quick", action="store_true", help="skip benchmarks on more than 10^5 elements")
+    parser.add_argument("--min-time", type=float, default=0.1, help="least time per repeat, in seconds")
+    parser.add_argument("--save", metavar="PATH", help="write the results to a baseline file")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="fractional increase above which a benchmark fails the comparison")
+    parser.add_argument("--no-gate-time", dest="gate_time", action="store_false",
+                        help="report timings without failing the comparison on them (evaluation counts and "
+                             "missing results are still gated)")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="times to rerun benchmarks slower than the threshold before reporting a regression")
+    parser.add_argument("--list", action="store_true", help="list the selected benchmarks without running them")
+    args = parser.parse_args(argv)
+
+    benchmarks = select(args.filter, quick=args.quick)
+    if args.list:
+        print("\n".join(bench.name for bench in benchmarks))
+        return 0
+
+    baseline = load(args.compare) if args.compare else None
+    if baseline is not None and baseline["environment"] != environment():
+        print(f"Warning: baselines were recorded on {baseline['environment']}, timings may not be comparable.")
+
+    results = run(benchmarks, min_time=args.min_time)
+    names = [bench.name for bench in benchmarks]
+    if baseline is not None and args.gate_time:
+        for _ in range(args.retries):
+            slower = [c.name for c in compare(results, baseline, args.threshold, gate_time=True)
+                      if c.regression and c.measure == "seconds"]
+            if not slower:
+                break
+            print(f"\nRerunning {len(slower)} benchmark(s) slower than the baseline")
+            for name, result in run([BENCHMARKS[name] for name in slower], min_time=args.min_time).items():
+                if result.seconds < results[name].seconds:
+                    results[name] = result._replace(spread=max(result.spread, results[name].seconds / result.seconds - 1))
+
+    if args.save:
+        try:
+            existing = load(args.save)
+        except FileNotFoundError:
+            existing = None
+        save(results, args.save, existing)
+        print(f"Saved {len(results)} results to {args.save}")
+
+    if baseline is not None:
+        print()
+        regressions = report(compare(results, baseline, args.threshold, selected=names, gate_time=args.gate_time))
+        if regressions:
+            print(f"{regressions} regression(s) beyond the {args.threshold:.0%} threshold, or missing result(s)")
+            return 1
+        print(f"No regressions beyond the {args.threshold:.0%} threshold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
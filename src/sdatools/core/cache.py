@@ -0,0 +1,148 @@
+from __future__ import annotations
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Hashable, NamedTuple
+import numpy as np
+
+from sdatools.core.types import ArrayLike
+
+
+class CacheInfo(NamedTuple):
+    """
+    Hit, miss and eviction counts, with the current number of entries and their size in bytes.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+class EvaluationCache:
+    """
+    Size-bounded LRU cache of distribution function evaluations (pdf, cdf, inverse_cdf, ...).
+
+    Entries are keyed on (distribution, method name, fingerprint of the input array). The distribution
+    part of the key uses the distribution's __hash__ and __eq__, i.e. its parameters, so two equal fitted
+    distributions share entries. The fingerprint is the input's shape, dtype and a 128-bit BLAKE2 digest
+    of its bytes, which is far cheaper to compute than most pdf or cdf evaluations.
+
+    Results are stored read-only and returned as read-only views, so a cached array cannot be modified
+    by one caller and then seen by another. The total size of the stored results is kept below max_bytes
+    by evicting the least recently used entries; a result larger than max_bytes is returned but not stored.
+
+    The cache is opt-in. Evaluate through it directly,
+
+        cache = EvaluationCache(max_bytes=64 * 2 ** 20)
+        y = cache.evaluate(dist, "cdf", x)
+
+    or activate it for a block of code, during which KSTest and Histogram.overlay_pdf use it:
+
+        with EvaluationCache() as cache:
+            ...
+        print(cache.info())
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2 ** 20):
+        if max_bytes <= 0:
+            raise ValueError("Memory limit max_bytes must be positive.")
+        self._max_bytes: int = int(max_bytes)
+        self._entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._nbytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._previous: EvaluationCache | None = None
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"EvaluationCache(max_bytes={self._max_bytes}, entries={len(self._entries)}, nbytes={self._nbytes})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> EvaluationCache:
+        global _active_cache
+        self._previous, _active_cache = _active_cache, self
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        global _active_cache
+        _active_cache, self._previous = self._previous, None
+
+    # Properties
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    # Cache operations
+
+    def evaluate(self, dist: Hashable, method: str, x: ArrayLike) -> np.ndarray:
+        """
+        Return getattr(dist, method)(x), from the cache if the same evaluation has been seen before.
+
+        Args:
+            dist (Distribution): Distribution (or any hashable object) whose method is evaluated
+            method (str): Name of the method, e.g. "pdf", "cdf" or "inverse_cdf"
+            x (ArrayLike): Input points
+
+        Returns:
+            np.ndarray: Read-only array of results
+        """
+        x = np.asarray(x)
+        key = (dist, method, _fingerprint(x))
+        result = self._entries.get(key)
+        if result is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return result.view()
+
+        self._misses += 1
+        result = np.array(getattr(dist, method)(x))
+        result.flags.writeable = False
+        if result.nbytes <= self._max_bytes:
+            self._entries[key] = result
+            self._nbytes += result.nbytes
+            while self._nbytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self._evictions += 1
+        return result.view()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._evictions, len(self._entries), self._nbytes, self._max_bytes)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the statistics.
+        """
+        self._entries.clear()
+        self._nbytes = 0
+        self._hits = self._misses = self._evictions = 0
+
+
+# The cache used by evaluate(), set while an EvaluationCache is active as a context manager
+_active_cache: EvaluationCache | None = None
+
+
+def evaluate(dist: Any, method: str, x: ArrayLike) -> np.ndarray:
+    """
+    Evaluate getattr(dist, method)(x) through the active EvaluationCache, or directly if none is active.
+    """
+    if _active_cache is None:
+        return np.asarray(getattr(dist, method)(x))
+    return _active_cache.evaluate(dist, method, x)
+
+
+def _fingerprint(x: np.ndarray) -> tuple[tuple[int, ...], str, bytes]:
+    """
+    Shape, dtype and a 128-bit digest of the contents of x.
+    """
+    return x.shape, x.dtype.str, blake2b(np.ascontiguousarray(x).tobytes(), digest_size=16).digest()
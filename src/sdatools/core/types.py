@@ -8,3 +8,6 @@ ArrayLike = Union[int, float, np.ndarray, pd.Series, pd.DataFrame]
 
 # sdatools global type for 1D arrays
 SeriesLike = Union[list[int], list[float], np.ndarray, pd.Series]
+
+# sdatools global type for random number generator inputs (seed, SeedSequence or Generator)
+RNGLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
@@ -3,7 +3,7 @@ import pandas as pd
 from functools import wraps
 from typing import Callable
 
-from sdatools.core.types import ArrayLike, SeriesLike
+from sdatools.core.types import ArrayLike, SeriesLike, RNGLike
 
 
 def vectorise_input(func: Callable) -> Callable:
@@ -79,6 +79,24 @@ def max_SeriesLike(data: SeriesLike) -> float:
 
 # Validation helper functions
 
-def validate_probability(p: float) -> None:
-    if not (0 <= p <= 1):
+def validate_probability(p: ArrayLike) -> None:
+    p = np.asarray(p)
+    if np.any((p < 0) | (p > 1)) or np.any(np.isnan(p)):
         raise ValueError("Probability p must be in the range [0, 1].")
+
+
+# Random number generation helper functions
+
+def get_rng(rng: RNGLike = None) -> np.random.Generator:
+    """
+    Return a numpy Generator from a seed, SeedSequence or existing Generator
+
+    Args:
+        rng (RNGLike): None (fresh OS entropy), an integer seed, a SeedSequence or a Generator
+
+    Returns:
+        np.random.Generator: the input Generator itself, or a new Generator seeded from the input
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
@@ -2,6 +2,7 @@ import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 
+from sdatools.core.cache import evaluate
 from sdatools.core.types import SeriesLike
 from sdatools.core.utils import max_SeriesLike, min_SeriesLike
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
@@ -16,9 +17,9 @@ class Histogram:
             data: SeriesLike,
             bins: int = 50
             ):
-        if not all(isinstance(x, (int, float)) for x in data):
-            raise TypeError("Data must be numeric")
         self.data: np.ndarray = np.asarray(data)
+        if not np.issubdtype(self.data.dtype, np.number):
+            raise TypeError("Data must be numeric")
         self.min: float = min_SeriesLike(data)
         self.max: float = max_SeriesLike(data)
         self.bins: int = bins
@@ -46,9 +47,27 @@ class Histogram:
                     lw: int = 2):
         """
         Overlay the PDF of the given distribution on the histogram
+
+        Distributions without a density (e.g. EmpiricalDistribution) are overlaid as the probability of each
+        histogram bin divided by its width, from the cdf at the bin edges.
         """
         pdf_x_values: np.ndarray = np.linspace(self.min, self.max, 100)
-        pdf_y_values: np.ndarray = np.asarray([distribution.pdf(val) for val in pdf_x_values])
+        try:
+            pdf_y_values: np.ndarray = evaluate(distribution, "pdf", pdf_x_values)
+        except NotImplementedError:
+            edges: np.ndarray = np.histogram_bin_edges(self.data, bins=self.bins)
+            # The first bin is closed on the left, as in np.histogram
+            cdf_values: np.ndarray = evaluate(distribution, "cdf", np.append(np.nextafter(edges[0], -np.inf), edges[1:]))
+            self._ax.stairs(
+                np.diff(cdf_values) / np.diff(edges),
+                edges,
+                color=color,
+                linestyle=linestyle,
+                lw=lw,
+                label='Bin density'
+            )
+            plt.draw()
+            return
         self._ax.plot(
             pdf_x_values,
             pdf_y_values,
@@ -1,8 +1,22 @@
 from abc import abstractmethod
+import warnings
+from typing import Callable
 import numpy as np
 
-from sdatools.core.types import ArrayLike, SeriesLike
+from sdatools.core.types import ArrayLike, RNGLike
+from sdatools.core.utils import get_rng, validate_probability
 from sdatools.distributions.abstract.distribution import Distribution
+from sdatools.distributions.sampling.parallel import parallel_sample
+from sdatools.distributions.sampling.variance_reduction import sample_uniforms
+from sdatools.numerical_methods.quadrature.double_exponential import DoubleExponentialIntegrator
+
+
+# Integrator used by expect(), and so by the default numeric moments
+EXPECT_INTEGRATOR: DoubleExponentialIntegrator = DoubleExponentialIntegrator(abs_tol=1e-14, rel_tol=1e-12)
+
+# Relative error estimate above which an unconverged expect() warns. Smaller errors come from rounding (e.g. a pdf
+# evaluated far from zero) rather than from a divergent or badly resolved integral.
+EXPECT_WARN_TOL: float = 1e-8
 
 
 class ContinuousDistribution(Distribution):
@@ -12,23 +26,25 @@ class ContinuousDistribution(Distribution):
     Subclasses must implement:
     --------------------------
     - domain          : Domain of the distribution.
-    - mean            : Mean of the distribution.
-    - variance        : Variance of the distribution.
-    - skewness        : Skewness of the distribution.
-    - kurtosis        : Excess kurtosis of the distribution.
-    - pdf(x)          : Probability density function.
-    - cdf(x)          : Cumulative distribution function.
-    - sample(size=1)  : Generate n (n=size) samples from the distribution.
+    - pdf(x)          : Probability density function (vectorised over x).
+    - cdf(x)          : Cumulative distribution function (vectorised over x).
     - __repr__        : String representation of the distribution.
     - __hash__        : Hash representation of the distribution.
 
     Optional further implementations:
     ---------------------------------
-    - inverse_cdf()   : Inverse cumulative distribution function.
+    - mean, variance, skewness, kurtosis : Moments (default to numeric integration of the pdf, cached per instance).
+    - logpdf(x)       : Log of the probability density function (defaults to log(pdf(x))).
+    - inverse_cdf(p)  : Inverse cumulative distribution function (vectorised over p).
+    - sf(x), isf(q)   : Survival function 1 - cdf(x) and its inverse (default to cdf and inverse_cdf; override
+                        where the upper tail can be computed without cancellation).
+    - _sample(size, rng) : Generate n (n=size) i.i.d. samples using a numpy Generator.
 
     Provided by base class:
     -----------------------
     - stddev          : Standard deviation of the distribution.
+    - expect(g, lower, upper) : Expectation E[g(X); lower <= X <= upper], by double-exponential quadrature against the pdf.
+    - sample(size=1, method="iid", rng=None, n_jobs=None) : Generate n (n=size) samples from the distribution.
     - __str__         : Shortened string representation (defaults to __repr__).
     - __eq__          : Check if two distributions are equal
     - __ne__          : Check if two distributions are not equal.
@@ -36,43 +52,148 @@ class ContinuousDistribution(Distribution):
     Notes:
     ------
     - If inverse_cdf() is implemented, then sample() is auto-implemented using the inverse CDF.
+    - Variance-reduction sampling (method="antithetic", "stratified" or "lhs") requires inverse_cdf().
     """
  
     # Distribution functions
     
     @abstractmethod
-    def pdf(self, x: float) -> float:
+    def pdf(self, x: ArrayLike) -> ArrayLike:
         """
         Probability density function.
+
+        Implementations should accept scalar or array input x.
         """
         pass
 
     @abstractmethod
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayLike) -> ArrayLike:
         """
         Cumulative distribution function.
+
+        Implementations should accept scalar or array input x.
         """
         pass
 
-    def inverse_cdf(self, p: float) -> float:
+    def logpdf(self, x: ArrayLike) -> ArrayLike:
+        """
+        Natural logarithm of the probability density function.
+
+        Defaults to log(pdf(x)); override where a closed form avoids underflow in the tails.
+        """
+        with np.errstate(divide='ignore'):
+            return np.log(self.pdf(x))
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
         """
         Inverse cumulative distribution function.
+
+        Implementations should accept scalar or array input p.
         """
         raise NotImplementedError(f"{self.__class__.__name__} does not implement inverse_cdf().")
 
+    def sf(self, x: ArrayLike) -> ArrayLike:
+        """
+        Survival function P(X > x) = 1 - cdf(x).
+
+        The default loses all relative accuracy once cdf(x) rounds to 1; override with a direct upper-tail formula.
+        """
+        return (1 - np.asarray(self.cdf(x)))[()]
+
+    def isf(self, q: ArrayLike) -> ArrayLike:
+        """
+        Inverse survival function, the x with sf(x) = q. Defaults to inverse_cdf(1 - q).
+        """
+        validate_probability(q)
+        return self.inverse_cdf(1 - np.asarray(q))
+
+    def expect(self, g: Callable | None = None, lower: float = float('-inf'), upper: float = float('inf')) -> float | np.ndarray:
+        """
+        Expectation E[g(X); lower <= X <= upper] = ∫ g(x) f(x) dx over [lower, upper] (clipped to the domain).
+
+        The transform is chosen from the limits, as tanh-sinh on a finite interval, exp-sinh on a half-line and
+        sinh-sinh on the real line (see DoubleExponentialIntegrator). Infinite limits are mapped using the
+        median c and a scale s: the larger of the distance from a finite limit to the median and half the
+        interquartile range (see _location_scale). Tail expectations and integrable singularities of the pdf at
+        a finite limit therefore converge exponentially, with no truncation of the domain. g and the pdf are
+        called once per refinement level, on the array of new nodes.
+
+        A RuntimeWarning is raised if the quadrature does not converge (beyond rounding, see EXPECT_WARN_TOL),
+        which is how divergent expectations (e.g. E[1 / X] for X ~ U[0, 1]) show up: the partial sums keep
+        growing as nodes approach the singularity or run out into the tail.
+
+        Args:
+            g (Callable or None): Vectorised function of x; may return an array whose last axis runs over x.
+                If None, P(lower <= X <= upper) is returned.
+            lower (float): Lower limit of integration
+            upper (float): Upper limit of integration
+
+        Returns:
+            float or np.ndarray: The expectation (an array if g returns one)
+        """
+        lower, upper = max(float(lower), float(self.domain[0])), min(float(upper), float(self.domain[-1]))
+        if not lower < upper:
+            return 0.0
+        centre, scale = self._location_scale()
+        if np.isfinite(lower) and not np.isfinite(upper):
+            scale = max(centre - lower, scale)
+        elif np.isfinite(upper) and not np.isfinite(lower):
+            scale = max(upper - centre, scale)
+
+        def integrand(x: np.ndarray) -> np.ndarray:
+            density = np.asarray(self.pdf(x))
+            return density if g is None else np.asarray(g(x)) * density
+
+        result = EXPECT_INTEGRATOR.integrate(integrand, lower, upper, centre=centre, scale=scale)
+        finite = bool(np.all(np.isfinite(result.value)))
+        tolerance = max(EXPECT_INTEGRATOR.abs_tol, EXPECT_WARN_TOL * float(np.max(np.abs(result.value))))
+        if not result.converged and not (finite and result.error <= tolerance):
+            warnings.warn(f"{self.__class__.__name__}.expect() did not converge (error estimate {result.error:.3g}); "
+                          "the expectation may not exist, or g may need splitting at a kink or singularity.",
+                          RuntimeWarning, stacklevel=2)
+        return result.value
 
     # Sampling
 
-    def sample(self, size: int = 1) -> SeriesLike:
+    def sample(self, size: int = 1, method: str = "iid", rng: RNGLike = None, n_jobs: int | None = None) -> np.ndarray:
         """
         Generate n (n=size) samples from the distribution.
 
-        If inverse_cdf() has been implemented, samples will be generated using the inverse CDF.
+        Args:
+            size (int): Number of samples
+            method (str): "iid" for independent draws, or one of the variance-reduction methods
+                "antithetic", "stratified" or "lhs" (Latin hypercube)
+            rng (RNGLike): Seed or Generator, for reproducible samples
+            n_jobs (int or None): If given, split i.i.d. sampling into chunks with independent
+                SeedSequence streams, drawn by n_jobs processes (-1 for all cores)
+
+        Variance-reduction methods transform correlated U[0, 1) variates through the vectorised inverse_cdf().
+
+        With n_jobs set (including n_jobs=1), the output is bit-identical for any number of jobs given the same
+        seed. It differs from the output with n_jobs=None, which draws from a single stream of rng.
         """
         if size <= 0:
             raise ValueError("Sample size must be a positive integer.")
+        if n_jobs is not None:
+            if method != "iid":
+                raise ValueError("Parallel sampling (n_jobs) only supports method='iid'.")
+            return parallel_sample(self, size, n_jobs=n_jobs, rng=rng)
+        rng = get_rng(rng)
+        if method == "iid":
+            return self._sample(size, rng)
+        u: np.ndarray = sample_uniforms(size, method, rng)
+        try:
+            return self.inverse_cdf(u)
+        except NotImplementedError:
+            raise NotImplementedError(f"{self.__class__.__name__} must implement inverse_cdf() to sample with method='{method}'.")
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generate n (n=size) i.i.d. samples from the distribution using the given Generator.
+
+        If inverse_cdf() has been implemented, samples will be generated using the inverse CDF.
+        """
         try:
-            u: np.ndarray = np.random.random(size)
-            return np.array([self.inverse_cdf(ui) for ui in u])
+            return self.inverse_cdf(rng.random(size))
         except NotImplementedError:
-            raise NotImplementedError(f"{self.__class__.__name__} must override sample() or inverse_cdf().")
+            raise NotImplementedError(f"{self.__class__.__name__} must override _sample() or inverse_cdf().")
@@ -1,7 +1,12 @@
 from abc import abstractmethod
-from random import choices
+from typing import Callable
+import numpy as np
 
+from sdatools.core.types import ArrayLike, RNGLike
+from sdatools.core.utils import get_rng, validate_probability
 from sdatools.distributions.abstract.distribution import Distribution
+from sdatools.distributions.sampling.parallel import parallel_sample
+from sdatools.distributions.sampling.variance_reduction import sample_uniforms
 
 
 class DiscreteDistribution(Distribution):
@@ -11,19 +16,21 @@ class DiscreteDistribution(Distribution):
     Subclasses must implement:
     --------------------------
     - domain          : Domain of the distribution.
-    - mean            : Mean of the distribution.
-    - variance        : Variance of the distribution.
-    - skewness        : Skewness of the distribution.
-    - kurtosis        : Excess kurtosis of the distribution.
     - pmf(x)          : Probability mass function.
     - cdf(x)          : Cumulative distribution function.
     - __repr__        : String representation of the distribution.
     - __hash__        : Hash representation of the distribution.
 
+    Optional further implementations:
+    ---------------------------------
+    - mean, variance, skewness, kurtosis : Moments (default to sums over the pmf table, cached per instance).
+
     Provided by base class:
     -----------------------
     - stddev          : Standard deviation of the distribution.
-    - sample(size=1)  : Generate n (n=size) samples from the distribution.
+    - expect(g, lower, upper) : Expectation E[g(X); lower <= X <= upper], by summation of the pmf over the domain.
+    - inverse_cdf(p)  : Inverse CDF, by search of the cumulative PMF over the domain (override if a closed form exists).
+    - sample(size=1, method="iid", rng=None, n_jobs=None) : Generate n (n=size) samples from the distribution.
     - __str__         : Shortened string representation (defaults to __repr__).
     - __eq__          : Check if two distributions are equal
     - __ne__          : Check if two distributions are not equal.
@@ -45,17 +52,71 @@ class DiscreteDistribution(Distribution):
         """
         pass
 
+    def inverse_cdf(self, p: ArrayLike) -> np.ndarray:
+        """
+        Inverse cumulative distribution function, the smallest k in the domain with cdf(k) >= p.
+
+        Defaults to a search of the cumulative pmf table over the domain; override where a closed form exists.
+        """
+        validate_probability(p)
+        return self._inverse_cdf_from_domain(np.asarray(p, dtype=float))
+
+    def expect(self, g: Callable | None = None, lower: float = float('-inf'), upper: float = float('inf')) -> float | np.ndarray:
+        """
+        Expectation E[g(X); lower <= X <= upper] = Σ g(k) * P(X = k) over the domain points in [lower, upper].
+
+        g is called once, with the array of domain points, and may return an array whose last axis runs over
+        the points. If g is None, the probability P(lower <= X <= upper) is returned.
+        """
+        points: np.ndarray = np.asarray(self.domain, dtype=np.int64)
+        points = points[(points >= lower) & (points <= upper)]
+        if points.size == 0:
+            return 0.0
+        weights: np.ndarray = np.array([self.pmf(int(k)) for k in points], dtype=float)
+        integral = weights.sum() if g is None else np.asarray(g(points)) @ weights
+        return float(integral) if np.ndim(integral) == 0 else integral
+
     # Sampling
 
-    # TODO: Determine a better way to sample for discrete distributions.
-    # The current implementation uses the domain and PMF to generate samples.
-    # For e.g. Poisson, where terms in the PMF are very large/small, we get an overflow error.
-    def sample(self, size: int = 1) -> list[float]:
+    def sample(self, size: int = 1, method: str = "iid", rng: RNGLike = None, n_jobs: int | None = None) -> np.ndarray:
         """
-        Generate a list of n (n=size) samples from the discrete distribution
+        Generate an integer array of n (n=size) samples from the discrete distribution
+
+        method selects i.i.d. ("iid") or variance-reduction ("antithetic", "stratified", "lhs") sampling,
+        and rng (a seed or numpy Generator) makes the samples reproducible.
+
+        If n_jobs is given, i.i.d. sampling is split across n_jobs processes with independent
+        SeedSequence streams per chunk (see sampling/parallel.py). The output is then the same for any
+        n_jobs, including 1, but differs from n_jobs=None, which draws from a single stream of rng.
         """
         if size <= 0:
             raise ValueError("Sample size must be a positive integer.")
-        probabilities = [self.pmf(k) for k in self.domain] # TODO: ensure discrete domain is an iterable
-        return choices(population=self.domain, weights=probabilities, k=size)
-    
\ No newline at end of file
+        if n_jobs is not None:
+            if method != "iid":
+                raise ValueError("Parallel sampling (n_jobs) only supports method='iid'.")
+            return parallel_sample(self, size, n_jobs=n_jobs, rng=rng, dtype=np.int64)
+        rng = get_rng(rng)
+        if method == "iid":
+            return self._sample(size, rng)
+        return self.inverse_cdf(sample_uniforms(size, method, rng))
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generate n (n=size) i.i.d. samples from the distribution using the given Generator.
+
+        Subclasses with a direct sampler (or a closed-form inverse_cdf) should override this, since the
+        default builds a cumulative pmf table over the whole domain.
+        """
+        return self.inverse_cdf(rng.random(size))
+
+    # TODO: Determine a better way to sample for discrete distributions without a closed-form inverse CDF.
+    # The current implementation uses the domain and PMF to generate samples.
+    # For e.g. Poisson, where terms in the PMF are very large/small, we get an overflow error.
+    def _inverse_cdf_from_domain(self, u: np.ndarray) -> np.ndarray:
+        """
+        Map uniform variates to the domain by searching the cumulative PMF table.
+        """
+        domain: list[int] = self.domain # TODO: ensure discrete domain is an iterable
+        cumulative: np.ndarray = np.cumsum([self.pmf(k) for k in domain])
+        index: np.ndarray = np.searchsorted(cumulative, u * cumulative[-1], side="left")
+        return np.asarray(domain, dtype=np.int64)[np.minimum(index, len(domain) - 1)]
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 from math import sqrt
+from typing import Callable, Iterator
+import numpy as np
 
-from sdatools.core.types import SeriesLike
+from sdatools.core.types import SeriesLike, RNGLike
+from sdatools.distributions.sampling.streaming import STREAM_CHUNK_SIZE, sample_iter, sample_to_file
 
 
 class Distribution(ABC):
@@ -11,17 +14,20 @@ class Distribution(ABC):
     Subclasses must implement:
     --------------------------
     - domain          : Domain of the distribution.
-    - mean            : Mean of the distribution.
-    - variance        : Variance of the distribution.
-    - skewness        : Skewness of the distribution.
-    - kurtosis        : Excess kurtosis of the distribution.
-    - sample(size=1)  : Generate n (n=size) samples from the distribution.
+    - sample(size=1, method="iid", rng=None, n_jobs=None) : Generate n (n=size) samples from the distribution.
     - __repr__        : String representation of the distribution.
     - __hash__        : Hash representation of the distribution.
 
+    Optional further implementations:
+    ---------------------------------
+    - mean, variance, skewness, kurtosis : Moments (default to numeric moments computed with expect()).
+    - expect(g, lower, upper) : Expectation E[g(X); lower <= X <= upper] (implemented by the continuous and discrete bases).
+
     Provided by base class:
     -----------------------
     - stddev          : Standard deviation of the distribution.
+    - sample_iter(total, chunk_size, rng)          : Stream samples in fixed-size chunks.
+    - sample_to_file(path, total, chunk_size, rng) : Stream samples into a memory-mapped .npy file.
     - __str__         : Shortened string representation (defaults to __repr__).
     - __eq__          : Check if two distributions are equal
     - __ne__          : Check if two distributions are not equal.
@@ -37,7 +43,7 @@ class Distribution(ABC):
         """
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self.__dict__ == other.__dict__
+        return _parameters(self) == _parameters(other)
     
     def __ne__(self, other: object) -> bool:
         """
@@ -75,6 +81,69 @@ class Distribution(ABC):
         If not overridden, __repr__ is used.
         """
         return self.__repr__()
+
+
+    # Distribution algebra
+
+    # Defer to the operators below when combined with numpy scalars
+    __array_ufunc__ = None
+
+    def __add__(self, other: 'Distribution | float') -> 'Distribution':
+        """
+        Distribution of X + Y for independent X and Y, or X + c for a scalar c.
+
+        Closed-form results are looked up in the distribution algebra registry (see algebra/rules.py).
+        """
+        from sdatools.distributions.algebra.registry import add
+        return add(self, other)
+
+    def __radd__(self, other: float) -> 'Distribution':
+        """
+        Right addition to allow scalar + Distribution.
+        """
+        return self.__add__(other)
+
+    def __sub__(self, other: 'Distribution | float') -> 'Distribution':
+        """
+        Distribution of X - Y = X + (-1) * Y for independent X and Y, or X - c for a scalar c.
+        """
+        from sdatools.distributions.algebra.registry import add, affine
+        if isinstance(other, Distribution):
+            return add(self, affine(other, -1.0))
+        return add(self, -other)
+
+    def __rsub__(self, other: float) -> 'Distribution':
+        """
+        Right subtraction to allow scalar - Distribution.
+        """
+        from sdatools.distributions.algebra.registry import affine
+        return affine(self, -1.0, other)
+
+    def __neg__(self) -> 'Distribution':
+        from sdatools.distributions.algebra.registry import affine
+        return affine(self, -1.0)
+
+    def __mul__(self, other: 'Distribution | float') -> 'Distribution':
+        """
+        Distribution of c * X for a scalar c, or X * Y for independent X and Y.
+        """
+        from sdatools.distributions.algebra.registry import multiply
+        return multiply(self, other)
+
+    def __rmul__(self, other: float) -> 'Distribution':
+        """
+        Right multiplication to allow scalar * Distribution.
+        """
+        return self.__mul__(other)
+
+    def __truediv__(self, scalar: float) -> 'Distribution':
+        """
+        Divide the distribution by a non-zero scalar, X / c = (1 / c) * X.
+        """
+        from sdatools.distributions.algebra.registry import affine, is_scalar
+        if not is_scalar(scalar) or scalar == 0:
+            raise ValueError("Can only divide by a non-zero scalar (int or float).")
+        return affine(self, 1.0 / scalar)
     
 
     # Domain
@@ -94,9 +163,11 @@ class Distribution(ABC):
     
 
     # Moments
-    
+
+    # Moments default to numeric integration with expect(); subclasses with closed forms override them.
+    # The numeric moments are computed together on first use and cached on the instance.
+
     @property
-    @abstractmethod
     def mean(self) -> float:
         """
         Mean of the distribution.
@@ -109,10 +180,9 @@ class Distribution(ABC):
         mean = Σ x * P(X = x),
         where P(X = x) is the probability mass function.
         """
-        pass
+        return self._numeric_moments()[0]
 
     @property
-    @abstractmethod
     def variance(self) -> float:
         """
         Variance of the distribution.
@@ -120,7 +190,7 @@ class Distribution(ABC):
         variance = E[(X - mu) ** 2] = E[X ** 2] - mu ** 2,
         where mu is the mean of the distribution.
         """
-        pass
+        return self._numeric_moments()[1]
 
     @property
     def stddev(self) -> float:
@@ -132,7 +202,6 @@ class Distribution(ABC):
         return sqrt(self.variance)
 
     @property
-    @abstractmethod
     def skewness(self) -> float:
         """
         Skewness of the distribution.
@@ -140,10 +209,9 @@ class Distribution(ABC):
         skewness = E[(X - mu) ** 3] / sigma ** 3,
         where mu is the mean and sigma is the standard deviation.
         """
-        pass
+        return self._numeric_moments()[2]
 
     @property
-    @abstractmethod
     def kurtosis(self) -> float:
         """
         Excess kurtosis of the distribution.
@@ -151,17 +219,92 @@ class Distribution(ABC):
         kurtosis = E[(X - mu) ** 4] / sigma ** 4 - 3,
         where mu is the mean and sigma is the standard deviation.
         """
-        pass
+        return self._numeric_moments()[3]
+
+    def expect(self, g: Callable | None = None, lower: float = float('-inf'), upper: float = float('inf')) -> float | np.ndarray:
+        """
+        Expectation E[g(X); lower <= X <= upper], i.e. the integral of g against the distribution over [lower, upper].
+
+        g must be vectorised over an array of points, and may return an array whose last axis runs over the points
+        (the result then has the leading shape). If g is None, the probability P(lower <= X <= upper) is returned.
+
+        For example, E[max(X - K, 0)] = expect(lambda x: x - K, lower=K).
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement expect().")
 
     
     # Sampling
 
     @abstractmethod
-    def sample(self, size: int = 1) -> SeriesLike:
+    def sample(self, size: int = 1, method: str = "iid", rng: RNGLike = None, n_jobs: int | None = None) -> SeriesLike:
         """
         Generate n (n=size) samples from the distribution.
+
+        method selects i.i.d. ("iid") or variance-reduction ("antithetic", "stratified", "lhs") sampling,
+        and rng (a seed or numpy Generator) makes the samples reproducible.
+
+        n_jobs splits i.i.d. sampling into independent streams drawn in parallel processes; the output is the
+        same for any n_jobs (including 1), but not the same as with n_jobs=None, which uses a single stream.
         """
         pass
+
+    def sample_iter(self, total: int, chunk_size: int = STREAM_CHUNK_SIZE, rng: RNGLike = None) -> Iterator[np.ndarray]:
+        """
+        Yield n (n=total) i.i.d. samples in arrays of chunk_size draws, so memory use is independent of total.
+
+        Chunks can be reduced as they arrive, e.g. with sampling.streaming.RunningMoments.
+        """
+        return sample_iter(self, total, chunk_size, rng)
+
+    def sample_to_file(self, path: str, total: int, chunk_size: int = STREAM_CHUNK_SIZE, rng: RNGLike = None) -> str:
+        """
+        Write n (n=total) i.i.d. samples to a .npy file through a memory map, one chunk at a time.
+        """
+        return sample_to_file(self, path, total, chunk_size, rng)
+
+    def _sample_into(self, out: np.ndarray, rng: np.random.Generator) -> None:
+        """
+        Fill a preallocated array with i.i.d. samples, using the subclass's _sample(size, rng).
+
+        Subclasses with an in-place sampler can override this to avoid allocating a temporary array.
+        """
+        out[...] = self._sample(out.size, rng)
+
+    # Helper functions
+
+    def _numeric_moments(self) -> tuple[float, float, float, float]:
+        """
+        Mean, variance, skewness and excess kurtosis from a single call to expect().
+
+        The raw moments E[(X - c)^k], k = 0, ..., 4, are integrated together about the median c (so that the
+        central moments do not suffer from cancellation when the mean is large relative to the spread), then
+        normalised by the k = 0 term and converted to central moments. The result is cached on the instance.
+        """
+        moments = self.__dict__.get("_numeric_moments_cache")
+        if moments is None:
+            centre: float = self._location_scale()[0]
+            powers = np.arange(5)[:, None]
+            raw = np.asarray(self.expect(lambda x: (np.asarray(x, dtype=float) - centre) ** powers), dtype=float)
+            m1, m2, m3, m4 = raw[1:] / raw[0]
+            variance = m2 - m1 ** 2
+            mu3 = m3 - 3 * m1 * m2 + 2 * m1 ** 3
+            mu4 = m4 - 4 * m1 * m3 + 6 * m1 ** 2 * m2 - 3 * m1 ** 4
+            moments = (float(centre + m1), float(variance), float(mu3 / variance ** 1.5), float(mu4 / variance ** 2 - 3))
+            self.__dict__["_numeric_moments_cache"] = moments
+        return moments
+
+    def _location_scale(self) -> tuple[float, float]:
+        """
+        Median and half the interquartile range, used to centre and scale numeric integrals.
+
+        Falls back to (0, 1) if inverse_cdf() is not implemented.
+        """
+        try:
+            q1, median, q3 = np.asarray(self.inverse_cdf(np.array([0.25, 0.5, 0.75])), dtype=float)
+        except NotImplementedError:
+            return 0.0, 1.0
+        scale = 0.5 * (q3 - q1)
+        return float(median), float(scale) if np.isfinite(scale) and scale > 0 else 1.0
     
     # TODO: Implement sample mean distribution
     # def sample_mean_distribution(self, n):
@@ -170,3 +313,10 @@ class Distribution(ABC):
     # TODO: Implement sample variance distribution
     # def sample_variance_distribution(self, n):
     #     pass
+
+
+def _parameters(dist: Distribution) -> dict:
+    """
+    Instance attributes compared by __eq__, i.e. __dict__ without the cached numeric moments.
+    """
+    return {key: value for key, value in dist.__dict__.items() if key != "_numeric_moments_cache"}
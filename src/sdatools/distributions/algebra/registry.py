@@ -0,0 +1,199 @@
+from __future__ import annotations
+from numbers import Real
+from typing import TYPE_CHECKING, Callable
+import numpy as np
+
+if TYPE_CHECKING:
+    from sdatools.distributions.abstract.distribution import Distribution
+
+
+# Closed-form rules, keyed by the distribution types they apply to.
+# A rule returns a Distribution, or None if the parameters do not admit a closed form (e.g. Gamma
+# distributions with different scale parameters), in which case dispatch falls back to a numeric result.
+_SUM_RULES: dict[tuple[type, type], Callable] = {}
+_PRODUCT_RULES: dict[tuple[type, type], Callable] = {}
+_AFFINE_RULES: dict[type, Callable] = {}
+
+_rules_loaded: bool = False
+
+
+# Registration
+
+def register_sum(type_x: type, type_y: type) -> Callable:
+    """
+    Decorator registering a closed-form rule for X + Y, where X and Y are independent.
+
+    The rule is called as rule(x, y) and is registered for both argument orders.
+    """
+    def decorator(rule: Callable) -> Callable:
+        _SUM_RULES[(type_x, type_y)] = rule
+        if type_x is not type_y:
+            _SUM_RULES[(type_y, type_x)] = lambda y, x: rule(x, y)
+        return rule
+    return decorator
+
+
+def register_product(type_x: type, type_y: type) -> Callable:
+    """
+    Decorator registering a closed-form rule for X * Y, where X and Y are independent.
+
+    The rule is called as rule(x, y) and is registered for both argument orders.
+    """
+    def decorator(rule: Callable) -> Callable:
+        _PRODUCT_RULES[(type_x, type_y)] = rule
+        if type_x is not type_y:
+            _PRODUCT_RULES[(type_y, type_x)] = lambda y, x: rule(x, y)
+        return rule
+    return decorator
+
+
+def register_affine(dist_type: type) -> Callable:
+    """
+    Decorator registering a closed-form rule for the affine map scale * X + shift.
+
+    The rule is called as rule(x, scale, shift), with scale != 0.
+    """
+    def decorator(rule: Callable) -> Callable:
+        _AFFINE_RULES[dist_type] = rule
+        return rule
+    return decorator
+
+
+# Dispatch
+
+def add(x: Distribution, y: Distribution | Real) -> Distribution:
+    """
+    Distribution of X + Y for independent X and Y (or X + c for a scalar c).
+
+    Uses a registered closed-form rule where one exists, otherwise a numeric result.
+    """
+    if is_scalar(y):
+        return affine(x, 1.0, float(y))
+    _check_distribution(y, "add")
+    rule: Callable | None = _lookup(_SUM_RULES, type(x), type(y))
+    result = rule(x, y) if rule is not None else None
+    return result if result is not None else _numeric_sum(x, y)
+
+
+def multiply(x: Distribution, y: Distribution | Real) -> Distribution:
+    """
+    Distribution of X * Y for independent X and Y (or c * X for a scalar c).
+
+    Uses a registered closed-form rule where one exists, otherwise a numeric result.
+    """
+    if is_scalar(y):
+        return affine(x, float(y), 0.0)
+    _check_distribution(y, "multiply")
+    rule: Callable | None = _lookup(_PRODUCT_RULES, type(x), type(y))
+    result = rule(x, y) if rule is not None else None
+    return result if result is not None else _numeric_product(x, y)
+
+
+def affine(x: Distribution, scale: float, shift: float = 0.0) -> Distribution:
+    """
+    Distribution of scale * X + shift.
+
+    Location-scale families map to themselves; other continuous distributions are wrapped in an AffineDistribution.
+    """
+    if scale == 0:
+        raise ValueError("Scalar must be non-zero.")
+    if scale == 1 and shift == 0:
+        return x
+    _load_rules()
+    for dist_type in type(x).__mro__:
+        if dist_type in _AFFINE_RULES:
+            result = _AFFINE_RULES[dist_type](x, scale, shift)
+            if result is not None:
+                return result
+            break
+    return _affine_fallback(x, scale, shift)
+
+
+# Fallbacks
+
+def _numeric_sum(x: Distribution, y: Distribution) -> Distribution:
+    """
+    A ConvolutionDistribution if either term is continuous, otherwise the exact convolution of the pmfs on
+    the integer lattice.
+    """
+    from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+    from sdatools.distributions.continuous.convolution import ConvolutionDistribution
+    from sdatools.distributions.discrete.lattice import LatticeDistribution
+    if isinstance(x, ContinuousDistribution) or isinstance(y, ContinuousDistribution):
+        return ConvolutionDistribution([x, y])
+    x, y = LatticeDistribution.from_distribution(x), LatticeDistribution.from_distribution(y)
+    return LatticeDistribution(np.convolve(x.probabilities, y.probabilities), x.offset + y.offset)
+
+
+def _numeric_product(x: Distribution, y: Distribution) -> Distribution:
+    """
+    A ProductDistribution if either factor is continuous, otherwise the pmf of the products of all pairs
+    of points, accumulated on the integer lattice.
+    """
+    from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+    from sdatools.distributions.continuous.product import ProductDistribution
+    from sdatools.distributions.discrete.lattice import LatticeDistribution
+    if isinstance(x, ContinuousDistribution) or isinstance(y, ContinuousDistribution):
+        return ProductDistribution(x, y)
+    x, y = LatticeDistribution.from_distribution(x), LatticeDistribution.from_distribution(y)
+    points = np.multiply.outer(np.asarray(x.domain), np.asarray(y.domain)).ravel()
+    table = np.zeros(int(points.max() - points.min()) + 1)
+    np.add.at(table, points - points.min(), np.multiply.outer(x.probabilities, y.probabilities).ravel())
+    return LatticeDistribution(table, int(points.min()))
+
+
+def _affine_fallback(x: Distribution, scale: float, shift: float) -> Distribution:
+    """
+    An AffineDistribution for continuous X. For discrete X with an integer scale and shift, the pmf moved
+    onto the mapped points of the integer lattice; other maps of discrete X would leave the integers.
+    """
+    from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+    from sdatools.distributions.continuous.affine import AffineDistribution
+    from sdatools.distributions.discrete.lattice import LatticeDistribution
+    if isinstance(x, ContinuousDistribution):
+        return AffineDistribution(x, scale, shift)
+    if scale != int(scale) or shift != int(shift):
+        raise NotImplementedError(f"The affine map {scale} * {x} + {shift} of a discrete distribution must have "
+                                  f"an integer scale and shift.")
+    x = LatticeDistribution.from_distribution(x)
+    points = int(scale) * np.asarray(x.domain) + int(shift)
+    table = np.zeros(int(points.max() - points.min()) + 1)
+    np.add.at(table, points - points.min(), x.probabilities)
+    return LatticeDistribution(table, int(points.min()))
+
+
+# Helper functions
+
+def _lookup(rules: dict[tuple[type, type], Callable], type_x: type, type_y: type) -> Callable | None:
+    """
+    Find the most specific rule for (type_x, type_y), searching both method resolution orders.
+    """
+    _load_rules()
+    for tx in type_x.__mro__:
+        for ty in type_y.__mro__:
+            if (tx, ty) in rules:
+                return rules[(tx, ty)]
+    return None
+
+
+def _load_rules() -> None:
+    """
+    Import the built-in closed-form rules (deferred to avoid circular imports).
+    """
+    global _rules_loaded
+    if not _rules_loaded:
+        import sdatools.distributions.algebra.rules  # noqa: F401
+        _rules_loaded = True
+
+
+def is_scalar(value: object) -> bool:
+    """
+    Check whether a value is a real scalar (including numpy scalars, excluding bool).
+    """
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _check_distribution(value: object, operation: str) -> None:
+    from sdatools.distributions.abstract.distribution import Distribution
+    if not isinstance(value, Distribution):
+        raise TypeError(f"Can only {operation} a Distribution or a scalar (int or float).")
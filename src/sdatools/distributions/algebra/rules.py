@@ -0,0 +1,201 @@
+# Closed-form results for combining independent distributions.
+#
+# Each rule returns the resulting distribution, or None when the parameters do not admit a
+# closed form, in which case the registry falls back to a numeric result.
+from math import isclose, log, sqrt
+
+from sdatools.distributions.algebra.registry import register_affine, register_product, register_sum
+from sdatools.distributions.continuous.affine import AffineDistribution
+from sdatools.distributions.continuous.egb2 import EGB2Distribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.irwin_hall import IrwinHallDistribution
+from sdatools.distributions.continuous.jsu import JohnsonSUDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.mixture import MixtureDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.skewnormal import SkewNormalDistribution
+from sdatools.distributions.continuous.truncated import TruncatedDistribution
+from sdatools.distributions.continuous.uniform import UniformDistribution
+from sdatools.distributions.discrete.binomial import BinomialDistribution
+from sdatools.distributions.discrete.poisson import PoissonDistribution
+
+
+# Sums of independent random variables
+
+@register_sum(NormalDistribution, NormalDistribution)
+def _normal_plus_normal(x: NormalDistribution, y: NormalDistribution) -> NormalDistribution:
+    """
+    If X ~ N(mu1, sigma1) and Y ~ N(mu2, sigma2), then X + Y ~ N(mu1 + mu2, sqrt(sigma1^2 + sigma2^2))
+    """
+    return NormalDistribution(x.mu + y.mu, sqrt(x.sigma ** 2 + y.sigma ** 2))
+
+
+@register_sum(GammaDistribution, GammaDistribution)
+def _gamma_plus_gamma(x: GammaDistribution, y: GammaDistribution) -> GammaDistribution | None:
+    """
+    If X ~ Gamma(alpha_1, beta) and Y ~ Gamma(alpha_2, beta), then X + Y ~ Gamma(alpha_1 + alpha_2, beta)
+    """
+    if not isclose(x.beta, y.beta):
+        return None
+    return GammaDistribution(x.alpha + y.alpha, x.beta)
+
+
+@register_sum(ExponentialDistribution, ExponentialDistribution)
+def _exponential_plus_exponential(x: ExponentialDistribution, y: ExponentialDistribution) -> GammaDistribution | None:
+    """
+    If X, Y ~ Exp(lambda), then X + Y ~ Gamma(2, 1 / lambda)
+    """
+    if not isclose(x.lam, y.lam):
+        return None
+    return GammaDistribution(2.0, 1.0 / x.lam)
+
+
+@register_sum(GammaDistribution, ExponentialDistribution)
+def _gamma_plus_exponential(x: GammaDistribution, y: ExponentialDistribution) -> GammaDistribution | None:
+    """
+    If X ~ Gamma(alpha, beta) and Y ~ Exp(1 / beta), then X + Y ~ Gamma(alpha + 1, beta)
+    """
+    if not isclose(x.beta, 1.0 / y.lam):
+        return None
+    return GammaDistribution(x.alpha + 1.0, x.beta)
+
+
+@register_sum(IrwinHallDistribution, IrwinHallDistribution)
+def _irwin_hall_plus_irwin_hall(x: IrwinHallDistribution, y: IrwinHallDistribution) -> IrwinHallDistribution:
+    """
+    If X ~ IrwinHall(n_1) and Y ~ IrwinHall(n_2), then X + Y ~ IrwinHall(n_1 + n_2)
+
+    The sum is evaluated exactly only if both operands would be, i.e. up to the smaller exact_max_n.
+    """
+    return IrwinHallDistribution(x.n + y.n, exact_max_n=min(x.exact_max_n, y.exact_max_n))
+
+
+@register_sum(PoissonDistribution, PoissonDistribution)
+def _poisson_plus_poisson(x: PoissonDistribution, y: PoissonDistribution) -> PoissonDistribution:
+    """
+    If X ~ Po(lambda_1) and Y ~ Po(lambda_2), then X + Y ~ Po(lambda_1 + lambda_2)
+    """
+    return PoissonDistribution(x.lam + y.lam)
+
+
+@register_sum(BinomialDistribution, BinomialDistribution)
+def _binomial_plus_binomial(x: BinomialDistribution, y: BinomialDistribution) -> BinomialDistribution | None:
+    """
+    If X ~ Bin(n_1, p) and Y ~ Bin(n_2, p), then X + Y ~ Bin(n_1 + n_2, p)
+    """
+    if not isclose(x.p, y.p):
+        return None
+    return BinomialDistribution(x.n + y.n, x.p)
+
+
+# Products of independent random variables
+
+@register_product(LogNormalDistribution, LogNormalDistribution)
+def _lognormal_times_lognormal(x: LogNormalDistribution, y: LogNormalDistribution) -> LogNormalDistribution:
+    """
+    If ln(X) ~ N(mu1, sigma1^2) and ln(Y) ~ N(mu2, sigma2^2), then ln(XY) ~ N(mu1 + mu2, sigma1^2 + sigma2^2)
+    """
+    return LogNormalDistribution(x.mu + y.mu, sqrt(x.sigma ** 2 + y.sigma ** 2))
+
+
+# Affine maps, Y = c * X + d
+
+@register_affine(NormalDistribution)
+def _affine_normal(x: NormalDistribution, c: float, d: float) -> NormalDistribution:
+    """
+    If X ~ N(mu, sigma), then c * X + d ~ N(c * mu + d, |c| * sigma)
+    """
+    return NormalDistribution(c * x.mu + d, abs(c) * x.sigma)
+
+
+@register_affine(UniformDistribution)
+def _affine_uniform(x: UniformDistribution, c: float, d: float) -> UniformDistribution:
+    """
+    If X ~ U[a, b], then c * X + d is uniform on the image of [a, b]
+    """
+    a, b = sorted((c * x.a + d, c * x.b + d))
+    return UniformDistribution(a, b)
+
+
+@register_affine(ExponentialDistribution)
+def _affine_exponential(x: ExponentialDistribution, c: float, d: float) -> ExponentialDistribution | None:
+    """
+    If X ~ Exp(lambda) and c > 0, then c * X ~ Exp(lambda / c)
+    """
+    if c < 0 or d != 0:
+        return None
+    return ExponentialDistribution(x.lam / c)
+
+
+@register_affine(GammaDistribution)
+def _affine_gamma(x: GammaDistribution, c: float, d: float) -> GammaDistribution | None:
+    """
+    If X ~ Gamma(alpha, beta) and c > 0, then c * X ~ Gamma(alpha, c * beta)
+    """
+    if c < 0 or d != 0:
+        return None
+    return GammaDistribution(x.alpha, c * x.beta)
+
+
+@register_affine(LogNormalDistribution)
+def _affine_lognormal(x: LogNormalDistribution, c: float, d: float) -> LogNormalDistribution | None:
+    """
+    If ln(X) ~ N(mu, sigma^2) and c > 0, then ln(c * X) ~ N(mu + ln(c), sigma^2)
+    """
+    if c < 0 or d != 0:
+        return None
+    return LogNormalDistribution(x.mu + log(c), x.sigma)
+
+
+@register_affine(JohnsonSUDistribution)
+def _affine_jsu(x: JohnsonSUDistribution, c: float, d: float) -> JohnsonSUDistribution:
+    """
+    If X ~ JSU(gamma, delta, xi, lambda), then c * X + d ~ JSU(sign(c) * gamma, delta, c * xi + d, |c| * lambda)
+    """
+    gamma = x.gamma if c > 0 else -x.gamma
+    return JohnsonSUDistribution(gamma, x.delta, c * x.xi + d, abs(c) * x.lam)
+
+
+@register_affine(EGB2Distribution)
+def _affine_egb2(x: EGB2Distribution, c: float, d: float) -> EGB2Distribution:
+    """
+    If X ~ EGB2(mu, sigma, p, q), then c * X + d ~ EGB2(c * mu + d, |c| * sigma, p, q) for c > 0,
+    and EGB2(c * mu + d, |c| * sigma, q, p) for c < 0
+    """
+    p, q = (x.p, x.q) if c > 0 else (x.q, x.p)
+    return EGB2Distribution(c * x.mu + d, abs(c) * x.sigma, p, q)
+
+
+@register_affine(SkewNormalDistribution)
+def _affine_skew_normal(x: SkewNormalDistribution, c: float, d: float) -> SkewNormalDistribution:
+    """
+    If X ~ SN(xi, omega, alpha), then c * X + d ~ SN(c * xi + d, |c| * omega, sign(c) * alpha)
+    """
+    alpha = x.alpha if c > 0 else -x.alpha
+    return SkewNormalDistribution(c * x.xi + d, abs(c) * x.omega, alpha)
+
+
+@register_affine(AffineDistribution)
+def _affine_affine(x: AffineDistribution, c: float, d: float) -> AffineDistribution:
+    """
+    c * (a * X + b) + d = (c * a) * X + (c * b + d)
+    """
+    return AffineDistribution(x.base, c * x.scale, c * x.shift + d)
+
+
+@register_affine(MixtureDistribution)
+def _affine_mixture(x: MixtureDistribution, c: float, d: float) -> MixtureDistribution:
+    """
+    c * X + d is the mixture of c * X_i + d with the same weights
+    """
+    return MixtureDistribution([c * component + d for component in x.components], x.weights)
+
+
+@register_affine(TruncatedDistribution)
+def _affine_truncated(x: TruncatedDistribution, c: float, d: float) -> TruncatedDistribution:
+    """
+    c * X + d, for X truncated to [a, b], is c * X_base + d truncated to the image of [a, b]
+    """
+    lower, upper = sorted((c * x.lower + d, c * x.upper + d))
+    return TruncatedDistribution(c * x.base + d, lower, upper)
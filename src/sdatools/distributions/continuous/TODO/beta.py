@@ -1,2 +0,0 @@
-# TODO: Implement the Beta distribution
-# https://en.wikipedia.org/wiki/Beta_distribution
\ No newline at end of file
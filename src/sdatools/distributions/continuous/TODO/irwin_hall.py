@@ -1,3 +0,0 @@
-# TODO: Implement Irwin-Hall dustributrion, i.e. sum of n iid U[0,1] random variables
-# https://en.wikipedia.org/wiki/Irwin%E2%80%93Hall_distribution
-
@@ -1,2 +0,0 @@
-# TODO: implement Weibull distribution
-# https://en.wikipedia.org/wiki/Weibull_distribution
\ No newline at end of file
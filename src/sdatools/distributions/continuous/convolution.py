@@ -0,0 +1,315 @@
+from math import isfinite, sqrt
+import numpy as np
+
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.distribution import Distribution
+from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+from sdatools.distributions.abstract.discrete_distribution import DiscreteDistribution
+
+
+class ConvolutionDistribution(ContinuousDistribution):
+    """
+    Class for the distribution of a sum of independent random variables, X_1 + ... + X_k, evaluated numerically.
+
+    Each component is discretised onto a shared grid of step h (continuous components by the probability
+    mass of each grid cell, discrete components by placing each pmf atom at the nearest grid point), and
+    the discretised masses are convolved with the FFT. The pdf, cdf and inverse cdf are then obtained by
+    linear interpolation on the grid, and are vectorised.
+
+    Error control:
+    - Each component is truncated at its tail_mass / (2k) and 1 - tail_mass / (2k) quantiles, so at most
+      tail_mass of probability is discarded in total (see truncation_error).
+    - The grid covers only the range of the sum, planned up front from the component means, truncation
+      bounds and the standard deviation of the sum (rather than the sum of the component ranges, which is
+      mostly empty for long-tailed components), and the convolution is circular over that range.
+    - The grid starts with grid_size points across that range and is doubled until the maximum change in
+      the cdf between successive grids is below tol, or max_grid_size is reached (see error_estimate).
+
+    Moments are exact, from the additivity of cumulants over independent components.
+
+    Used by the distribution algebra when a sum has no closed-form rule.
+    """
+
+    def __init__(self,
+                 components: list[Distribution],
+                 grid_size: int = 2 ** 12,
+                 tail_mass: float = 1e-10,
+                 tol: float = 1e-5,
+                 max_grid_size: int = 2 ** 20):
+        flattened: list[Distribution] = []
+        for component in components:
+            if isinstance(component, ConvolutionDistribution):
+                flattened.extend(component.components)
+            elif isinstance(component, (ContinuousDistribution, DiscreteDistribution)):
+                flattened.append(component)
+            else:
+                raise TypeError("Components must be continuous or discrete distributions.")
+        if len(flattened) < 1:
+            raise ValueError("At least one component distribution is required.")
+        if grid_size < 16 or max_grid_size < grid_size:
+            raise ValueError("Grid size must be at least 16, and no larger than max_grid_size.")
+        if not 0 < tail_mass < 1:
+            raise ValueError("Tail mass must be in the range (0, 1).")
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+
+        self._components: tuple[Distribution, ...] = tuple(flattened)
+        self._grid_size: int = int(grid_size)
+        self._tail_mass: float = float(tail_mass)
+        self._tol: float = float(tol)
+        self._max_grid_size: int = int(max_grid_size)
+
+        self._bounds: list[tuple[float, float]] = [self._component_bounds(c) for c in self._components]
+        self._range: tuple[float, float] = self._sum_range()
+        self._build()
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return (f"ConvolutionDistribution(components={list(self._components)!r}, grid_size={self._grid_size}, "
+                f"tail_mass={self._tail_mass}, tol={self._tol}, max_grid_size={self._max_grid_size})")
+
+    def __str__(self) -> str:
+        return " + ".join(str(c) for c in self._components)
+
+    def __hash__(self) -> int:
+        return hash(self._parameters())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConvolutionDistribution):
+            return NotImplemented
+        return self._parameters() == other._parameters()
+
+    # Distribution parameters
+
+    @property
+    def components(self) -> tuple[Distribution, ...]:
+        return self._components
+
+    @property
+    def grid(self) -> np.ndarray:
+        """
+        Grid points (cell centres) on which the density is tabulated.
+        """
+        return self._x
+
+    @property
+    def step(self) -> float:
+        return self._h
+
+    @property
+    def truncation_error(self) -> float:
+        """
+        Probability mass discarded by truncating the component tails.
+        """
+        return self._truncation_error
+
+    @property
+    def error_estimate(self) -> float:
+        """
+        Maximum absolute change in the cdf between the final grid and the grid of half its size.
+        """
+        return self._error_estimate
+
+    # Domain
+
+    @property
+    def domain(self) -> list[float]:
+        return [sum(c.domain[0] for c in self._components), sum(c.domain[-1] for c in self._components)]
+
+    # Moments
+
+    @property
+    def mean(self) -> float:
+        return sum(c.mean for c in self._components)
+
+    @property
+    def variance(self) -> float:
+        return sum(c.variance for c in self._components)
+
+    @property
+    def skewness(self) -> float:
+        k3: float = sum(c.skewness * c.variance ** 1.5 for c in self._components)
+        return k3 / self.variance ** 1.5
+
+    @property
+    def kurtosis(self) -> float:
+        k4: float = sum(c.kurtosis * c.variance ** 2 for c in self._components)
+        return k4 / self.variance ** 2
+
+    # Distribution functions
+
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        return np.interp(x, self._x, self._density, left=0.0, right=0.0)[()]
+
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        return np.interp(x, self._edges, self._cumulative, left=0.0, right=1.0)[()]
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        validate_probability(p)
+        return np.interp(p, self._cumulative, self._edges)[()]
+
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Exact samples, as the sum of independent samples from each component.
+        """
+        total: np.ndarray = np.zeros(size)
+        for component in self._components:
+            total += component._sample(size, rng)
+        return total
+
+    # Helper functions
+
+    def _parameters(self) -> tuple:
+        return (self._components, self._grid_size, self._tail_mass, self._tol, self._max_grid_size)
+
+    def _build(self) -> None:
+        """
+        Convolve on successively finer grids until the cdf converges to within tol.
+        """
+        n: int = self._grid_size
+        x, mass, h, truncation_error = self._convolve(n)
+        error: float = float("inf")
+        while n < self._max_grid_size:
+            n *= 2
+            x_fine, mass_fine, h_fine, truncation_error = self._convolve(n)
+            cumulative = np.cumsum(mass)
+            cumulative_fine = np.interp(x + h / 2, x_fine + h_fine / 2, np.cumsum(mass_fine))
+            error = float(np.max(np.abs(cumulative - cumulative_fine)))
+            x, mass, h = x_fine, mass_fine, h_fine
+            if error < self._tol:
+                break
+
+        self._x: np.ndarray = x
+        self._h: float = h
+        self._density: np.ndarray = mass / h
+        self._edges: np.ndarray = np.append(x - h / 2, x[-1] + h / 2)
+        self._cumulative: np.ndarray = np.minimum(np.concatenate(([0.0], np.cumsum(mass))), 1.0)
+        self._truncation_error: float = truncation_error
+        self._error_estimate: float = error
+
+    def _convolve(self, n: int) -> tuple[np.ndarray, np.ndarray, float, float]:
+        """
+        Discretise every component with a common step, with n points across the planned range of the sum
+        (see _sum_range), and convolve them with a single FFT.
+
+        Returns the grid, the (normalised) probability mass at each grid point, the step and the discarded mass.
+        """
+        k: int = len(self._components)
+        lower, upper = self._range
+        h: float = (upper - lower) / n if upper > lower else 1.0
+        if any(isinstance(c, DiscreteDistribution) for c in self._components):
+            # Align the grid with the integers, so the atoms of discrete components fall on grid points
+            h = 1.0 / np.ceil(1.0 / h) if h < 1 else float(np.ceil(h))
+
+        masses: list[np.ndarray] = []
+        start: float = 0.0
+        captured: float = 1.0
+        for component, (lo, hi) in zip(self._components, self._bounds):
+            x0: float = np.floor(lo / h) * h
+            m: int = int(np.ceil((hi - x0) / h)) + 1
+            grid: np.ndarray = x0 + h * np.arange(m)
+            if isinstance(component, DiscreteDistribution):
+                mass = np.zeros(m)
+                atoms = np.asarray(component.domain)
+                np.add.at(mass, np.clip(np.rint((atoms - x0) / h).astype(int), 0, m - 1),
+                          [component.pmf(int(a)) for a in atoms])
+            else:
+                edges = np.append(grid - h / 2, grid[-1] + h / 2)
+                mass = np.diff(np.asarray(component.cdf(edges), dtype=float))
+            mass = np.maximum(mass, 0.0)
+            captured *= float(mass.sum())
+            masses.append(mass)
+            start += x0
+
+        # The full linear convolution spans the sum of the component ranges, most of it with negligible mass
+        # when the components have long tails. Only the planned range of the sum is kept: a circular
+        # convolution over a period covering it wraps at most the mass outside it (below tail_mass) onto it.
+        length: int = sum(len(mass) for mass in masses) - k + 1
+        window: int = max(int(np.ceil((upper - lower) / h)) + 2, max(len(mass) for mass in masses))
+        if window >= length:
+            window, offset = length, 0
+        else:
+            offset = min(max(int(np.floor((lower - start) / h)), 0), length - window)
+        fft_size: int = 1 << (window - 1).bit_length()
+        spectrum: np.ndarray = np.ones(fft_size // 2 + 1, dtype=complex)
+        for mass in masses:
+            spectrum *= np.fft.rfft(mass, fft_size)
+
+        # Each cell mass is the density smoothed by a box of width h, so the product spectrum carries one
+        # box factor, sinc(f h), per continuous component. Divide out all but one, which removes the
+        # O(k h^2) variance the discretisation would otherwise add; frequencies where the factor is
+        # negligible carry no signal and are left alone to avoid amplifying rounding noise.
+        n_continuous: int = sum(isinstance(c, ContinuousDistribution) for c in self._components)
+        if n_continuous > 1:
+            box: np.ndarray = np.sinc(np.arange(len(spectrum)) / fft_size) ** (n_continuous - 1)
+            spectrum = np.where(box > 1e-8, spectrum / np.maximum(box, 1e-8), spectrum)
+        circular: np.ndarray = np.fft.irfft(spectrum, fft_size)
+        total: np.ndarray = np.maximum(circular[(offset + np.arange(window)) % fft_size], 0.0)
+        total /= total.sum()
+        return start + h * (offset + np.arange(window)), total, h, max(1.0 - captured, 0.0)
+
+    def _sum_range(self) -> tuple[float, float]:
+        """
+        Range holding all but a negligible part of the mass of the sum, planned from the components up front.
+
+        Beyond a few standard deviations of the sum, its tail is dominated by one large component value, so
+        the range is the mean of the sum, plus or minus the largest distance from a component's mean to its
+        truncation bound, plus or minus z = sqrt(2 log(1 / tail_mass)) standard deviations of the sum (a
+        Gaussian tail bound for the rest). It is clipped to the sum of the component bounds, the full range.
+        """
+        lowest: float = sum(lo for lo, _ in self._bounds)
+        highest: float = sum(hi for _, hi in self._bounds)
+        means: list[float] = [c.mean for c in self._components]
+        spread: float = sqrt(sum(c.variance for c in self._components))
+        if not (np.all(np.isfinite(means)) and isfinite(spread)):
+            return lowest, highest
+        z: float = sqrt(2 * np.log(1 / self._tail_mass))
+        centre: float = sum(means)
+        below: float = max(mean - lo for mean, (lo, _) in zip(means, self._bounds))
+        above: float = max(hi - mean for mean, (_, hi) in zip(means, self._bounds))
+        return max(lowest, centre - below - z * spread), min(highest, centre + above + z * spread)
+
+    def _component_bounds(self, component: Distribution) -> tuple[float, float]:
+        """
+        Truncation bounds for a component: its domain where finite, otherwise its tail quantiles.
+        """
+        eps: float = self._tail_mass / (2 * len(self._components))
+        lower, upper = float(component.domain[0]), float(component.domain[-1])
+        if not isfinite(lower):
+            lower = self._quantile(component, eps)
+        if not isfinite(upper):
+            upper = self._quantile(component, 1.0 - eps)
+        return lower, upper
+
+    @staticmethod
+    def _quantile(component: Distribution, p: float) -> float:
+        """
+        Quantile of a component, by bisection on the cdf if inverse_cdf() is not implemented.
+        """
+        try:
+            return float(component.inverse_cdf(p))
+        except (NotImplementedError, AttributeError):
+            pass
+        lo: float = component.mean - component.stddev
+        hi: float = component.mean + component.stddev
+        step: float = max(component.stddev, 1e-12)
+        while component.cdf(lo) > p:
+            lo -= step
+            step *= 2
+        step = max(component.stddev, 1e-12)
+        while component.cdf(hi) < p:
+            hi += step
+            step *= 2
+        for _ in range(200):
+            mid = 0.5 * (lo + hi)
+            if component.cdf(mid) < p:
+                lo = mid
+            else:
+                hi = mid
+            if hi - lo <= 1e-12 * max(1.0, abs(mid)):
+                break
+        return 0.5 * (lo + hi)
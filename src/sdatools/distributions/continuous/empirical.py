@@ -0,0 +1,129 @@
+from typing import Callable
+import numpy as np
+
+from sdatools.core.types import ArrayLike, SeriesLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+
+
+class EmpiricalDistribution(ContinuousDistribution):
+    """
+    Class for the empirical distribution of a sample x_1, ..., x_n.
+
+    The data are sorted once on construction, after which:
+    - cdf(x) = #{x_i <= x} / n is answered by binary search (O(log n) per point)
+    - inverse_cdf(p) is the inverse of the ECDF, x_(ceil(n * p)), by direct indexing
+    - sampling is the bootstrap, i.e. drawing from the data with replacement
+
+    Moments are the (population) moments of the sample, as in MethodOfMoments, and expect(g) is the sample
+    mean of g over the data.
+
+    The empirical distribution has no density; use KDEDistribution for a smooth density estimate.
+    """
+
+    def __init__(self, data: SeriesLike):
+        data = np.asarray(data, dtype=float).ravel()
+        if data.size == 0:
+            raise ValueError("Data must contain at least one observation.")
+        if not np.all(np.isfinite(data)):
+            raise ValueError("Data must be finite.")
+        self._data: np.ndarray = np.sort(data)
+        self._data.flags.writeable = False
+        self._n: int = data.size
+        self._hash: int = hash((self._n, self._data.tobytes()))
+
+        mean: float = float(self._data.mean())
+        d: np.ndarray = self._data - mean
+        d2: np.ndarray = d * d
+        self._mean: float = mean
+        self._variance: float = float(d2.mean())
+        self._m3: float = float((d2 * d).mean())
+        self._m4: float = float((d2 * d2).mean())
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"EmpiricalDistribution(n={self._n}, min={self._data[0]:.4g}, max={self._data[-1]:.4g})"
+
+    def __str__(self) -> str:
+        return f"Empirical(n={self._n})"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EmpiricalDistribution):
+            return NotImplemented
+        return self._hash == other._hash and np.array_equal(self._data, other._data)
+
+    # Distribution parameters
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        Sorted (read-only) sample data.
+        """
+        return self._data
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    # Domain
+
+    @property
+    def domain(self) -> list[float]:
+        return [float(self._data[0]), float(self._data[-1])]
+
+    # Moments
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        return self._variance
+
+    @property
+    def skewness(self) -> float:
+        return self._m3 / self._variance ** 1.5
+
+    @property
+    def kurtosis(self) -> float:
+        return self._m4 / self._variance ** 2 - 3
+
+    # Distribution functions
+
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        raise NotImplementedError("EmpiricalDistribution has no density; use KDEDistribution for a smooth density estimate.")
+
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        return (np.searchsorted(self._data, x, side='right') / self._n)[()]
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        """
+        Smallest sample value x with ECDF(x) >= p (so inverse_cdf(0) is the sample minimum).
+        """
+        validate_probability(p)
+        index = np.maximum(np.ceil(np.asarray(p) * self._n).astype(np.int64) - 1, 0)
+        return self._data[index][()]
+
+    def expect(self, g: Callable | None = None, lower: float = float('-inf'), upper: float = float('inf')) -> float | np.ndarray:
+        """
+        E[g(X); lower <= X <= upper] = (1 / n) * sum of g(x_i) over the data in [lower, upper].
+
+        The data in range are found by binary search, and g is called once on them.
+        """
+        start, stop = np.searchsorted(self._data, lower, side='left'), np.searchsorted(self._data, upper, side='right')
+        if stop <= start:
+            return 0.0
+        if g is None:
+            return (stop - start) / self._n
+        integral = np.sum(np.asarray(g(self._data[start:stop])), axis=-1) / self._n
+        return float(integral) if np.ndim(integral) == 0 else integral
+
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        return self._data[rng.integers(0, self._n, size=size)]
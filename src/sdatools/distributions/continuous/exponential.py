@@ -1,7 +1,6 @@
-from math import exp, log
 import numpy as np
 
-from sdatools.core.types import SeriesLike
+from sdatools.core.types import ArrayLike
 from sdatools.core.utils import validate_probability
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 
@@ -63,18 +62,19 @@ class ExponentialDistribution(ContinuousDistribution):
     
     # Distribution functions
 
-    # @vectorise_input
-    def pdf(self, x: float) -> float:
-        if x < 0:
-            return 0.0
-        return self._lam * exp(-self._lam * x)
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        return np.where(x < 0, 0.0, self._lam * np.exp(-self._lam * np.maximum(x, 0.0)))[()]
     
-    # @vectorise_input
-    def cdf(self, x: float) -> float:
-        if x < 0:
-            return 0.0
-        return 1.0 - exp(-self._lam * x)
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        return -np.expm1(-self._lam * np.maximum(x, 0.0))[()]
     
-    def inverse_cdf(self, p: float) -> float:
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
         validate_probability(p)
-        return log(1 / (1 - p)) / self._lam
+        return -np.log1p(-np.asarray(p)) / self._lam
+    
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.exponential(1.0 / self._lam, size)
@@ -1,7 +1,9 @@
-from math import exp, sqrt, gamma
-from scipy.special import gammainc
+from math import lgamma, sqrt
+import numpy as np
+from scipy.special import gammainc, gammaincinv, xlogy
 
-from sdatools.core.utils import vectorise_input, validate_probability
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 
 
@@ -29,60 +31,6 @@ class GammaDistribution(ContinuousDistribution):
     def __hash__(self) -> int:
         return hash((self._alpha, self._beta))
 
-    def __add__(self, other: 'GammaDistribution') -> 'GammaDistribution':
-        """
-        Add two Gamma distributions with the same shape parameter
-        
-        If X ~ Gamma(alpha_1, beta) and Y ~ Gamma(alpha_2, beta), then:
-
-        X + Y ~ Gamma(alpha_1 + alpha_2, beta)
-        """
-        if not isinstance(other, GammaDistribution):
-            raise TypeError("Can only add another GammaDistribution.")
-        
-        if self._beta != other._beta:
-            raise ValueError("Can only add Gamma distributions with the same scale parameter (beta).")
-        
-        return GammaDistribution(self._alpha + other._alpha, self._beta)
-    
-    def __sub__(self, other: 'GammaDistribution') -> 'GammaDistribution':
-        # TODO: Investigate if subtraction of Gamma distributions is defined
-        raise NotImplementedError("Subtraction of Gamma distributions is not defined.")
-
-    def __mul__(self, scalar) -> 'GammaDistribution':
-        """
-        Left multiplication to allow GammaDistribution * scalar
-        
-        If X ~ Gamma(alpha, beta) and c > 0, then c * X ~ Gamma(alpha, b / c)
-        """
-        if not isinstance(scalar, (int, float)):
-            raise TypeError("Can only multiply by a scalar (int or float).")
-        
-        if scalar <= 0:
-            raise ValueError("Scalar must be positive for multiplication with GammaDistribution.")
-        
-        return GammaDistribution(self._alpha, self._beta / scalar)
-    
-    def __rmul__(self, other):
-        """
-        Right multiplication to allow scalar * GammaDistribution.
-        """
-        return self.__mul__(other)
-
-    def __truediv__(self, scalar) -> 'GammaDistribution':
-        """
-        Divide the Gamma distribution by a scalar
-
-        If X ~ Gamma(alpha, beta) and c > 0, then X / c ~ Gamma(alpha, b * c)
-        """
-        if not isinstance(scalar, (int, float)) or scalar == 0:
-            raise ValueError("Can only divide by a non-zero scalar (int or float).")
-        
-        if scalar <= 0:
-            raise ValueError("Scalar must be positive for division with GammaDistribution.")
-        
-        return GammaDistribution(self._alpha, self._beta * scalar)
-
     # Distribution parameters
     
     @property
@@ -119,25 +67,25 @@ class GammaDistribution(ContinuousDistribution):
     
     # Distribution functions
 
-    # @vectorise_input
-    def pdf(self, x: float) -> float:
-        if x < 0:
-            return 0.0
-        return (1.0 / (gamma(self._alpha) * self._beta ** self._alpha)) * (x ** (self._alpha - 1.0)) * exp(-(x / self._beta))
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        xp = np.maximum(x, 0.0)
+        # In log space, since Gamma(alpha) and y^(alpha - 1) overflow for large alpha
+        y = xp / self._beta
+        with np.errstate(divide='ignore'):
+            density = np.exp(xlogy(self._alpha - 1.0, y) - y - lgamma(self._alpha)) / self._beta
+        return np.where(x < 0, 0.0, density)[()]
     
-    # @vectorise_input
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayLike) -> ArrayLike:
         # TODO: Implement without SciPy 
-        return gammainc(self._alpha, x / self._beta)
+        return gammainc(self._alpha, np.maximum(x, 0.0) / self._beta)
     
-    # @vectorise_input
-    def inverse_cdf(self, p: float) -> float:
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
         validate_probability(p)
-        # TODO: Implement the inverse CDF for the Gamma distribution
-        raise NotImplementedError("Inverse CDF for Gamma distribution is not implemented yet.")
+        # TODO: Implement without SciPy
+        return gammaincinv(self._alpha, p) * self._beta
     
     # Sampling
     
-    def sample(self, size: int = 1) -> list[float]:
-        # TODO: Implement sampling from the Gamma distribution
-        raise NotImplementedError("Sampling from Gamma distribution is not implemented yet.")
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.gamma(self._alpha, self._beta, size)
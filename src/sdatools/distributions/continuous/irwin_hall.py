@@ -0,0 +1,232 @@
+from math import sqrt, lgamma
+import numpy as np
+from scipy.stats import norm
+
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+
+
+# Standardised fourth and sixth cumulants of U[0, 1]
+KAPPA_4: float = -6 / 5
+KAPPA_6: float = 48 / 7
+
+
+class IrwinHallDistribution(ContinuousDistribution):
+    """
+    Class for an Irwin-Hall distribution, the distribution of the sum of n i.i.d. U[0, 1] random variables.
+
+    https://en.wikipedia.org/wiki/Irwin%E2%80%93Hall_distribution
+
+    The textbook formula f(x) = sum_k (-1)^k C(n, k) (x - k)^(n - 1) / (n - 1)! alternates in sign and
+    loses all precision by n ~ 30. Instead, for n <= exact_max_n the pdf and cdf are evaluated by the
+    B-spline recurrences
+
+    f_j(x) = (x * f_{j-1}(x) + (j - x) * f_{j-1}(x - 1)) / (j - 1),
+    F_j(x) = (x * F_{j-1}(x) + (j - x) * F_{j-1}(x - 1)) / j,
+
+    whose terms are all non-negative on the support, so the result is accurate to a few ulps. The cdf
+    is evaluated in the lower half and reflected (F(x) = 1 - F(n - x)), so the lower tail keeps full
+    relative precision. The cost is O(n^2) per point, vectorised across points.
+
+    For n > exact_max_n the Edgeworth expansion of the standardised sum z = (x - n / 2) / sqrt(n / 12)
+    is used instead. Since the odd cumulants vanish, the expansion to order n^-2,
+
+    F(x) ~ Phi(z) - phi(z) * [k4 / (24 n) He_3(z) + k6 / (720 n^2) He_5(z) + k4^2 / (1152 n^2) He_7(z)],
+
+    has an absolute error of O(n^-3) uniformly in x. Comparing against the exact cdf gives a maximum
+    absolute error below 0.006 / n^3 (about 1e-7 for n = 41, 6e-9 for n = 100). Quantiles and sampling
+    use the matching Cornish-Fisher expansion, so their cost does not grow with n.
+    """
+
+    def __init__(self, n: int = 1, exact_max_n: int = 40):
+        if not isinstance(n, (int, np.integer)) or n < 1:
+            raise ValueError("Number of summands n must be a positive integer.")
+        self._n = int(n)
+        self._exact: bool = self._n <= exact_max_n
+        self._exact_max_n = exact_max_n
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"IrwinHallDistribution(n={self._n}, exact_max_n={self._exact_max_n})"
+
+    def __str__(self) -> str:
+        return f"IrwinHall({self._n})"
+
+    def __hash__(self) -> int:
+        return hash((self._n, self._exact_max_n))
+
+    # Distribution parameters
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def exact_max_n(self) -> int:
+        return self._exact_max_n
+
+    @property
+    def exact(self) -> bool:
+        """
+        Whether the pdf and cdf are evaluated exactly (True) or by the Edgeworth expansion (False).
+        """
+        return self._exact
+
+    # Domain
+
+    @property
+    def domain(self) -> list[float]:
+        return [0, self._n]
+
+    # Moments
+
+    @property
+    def mean(self) -> float:
+        return self._n / 2
+
+    @property
+    def variance(self) -> float:
+        return self._n / 12
+
+    @property
+    def skewness(self) -> float:
+        return 0.0
+
+    @property
+    def kurtosis(self) -> float:
+        return KAPPA_4 / self._n
+
+    # Distribution functions
+
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        inside = (x >= 0) & (x <= self._n)
+        # The density is symmetric about n / 2
+        y = np.clip(np.minimum(x, self._n - x), 0.0, self._n / 2)
+        density = self._exact_pdf(y) if self._exact else self._edgeworth_pdf(y)
+        return np.where(inside, density, 0.0)[()]
+
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        upper = x > self._n / 2
+        y = np.clip(np.where(upper, self._n - x, x), 0.0, self._n / 2)
+        lower_tail = self._exact_cdf(y) if self._exact else self._edgeworth_cdf(y)
+        return np.where(upper, 1 - lower_tail, lower_tail)[()]
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        """
+        Exact quantiles by safeguarded Newton iteration for n <= exact_max_n, and the Cornish-Fisher
+        expansion otherwise. As for the cdf, p > 1/2 is solved by reflection.
+        """
+        validate_probability(p)
+        p = np.asarray(p, dtype=float)
+        upper = p > 0.5
+        q = np.where(upper, 1 - p, p)
+        if self._exact:
+            x = self._exact_quantile(q)
+        else:
+            x = np.where(q > 0, self._cornish_fisher(norm.ppf(q)), 0.0)
+        return np.where(upper, self._n - x, x)[()]
+
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Row sums of an (size x n) array of uniforms for n <= exact_max_n; otherwise the Cornish-Fisher
+        transform of standard normal variates, whose cost is independent of n.
+        """
+        if self._exact:
+            return rng.random((size, self._n)).sum(axis=1)
+        return self._cornish_fisher(rng.standard_normal(size))
+
+    # Helper functions
+
+    def _exact_pdf(self, x: np.ndarray) -> np.ndarray:
+        if self._n == 1:
+            return np.ones_like(x)
+        # Row i holds f_j(x - i); row n + 1 stays zero for x <= n
+        y = x[None, ...] - np.arange(self._n + 2).reshape((-1,) + (1,) * x.ndim)
+        f = ((y >= 0) & (y < 1)).astype(float)
+        for j in range(2, self._n + 1):
+            f[:-1] = (y[:-1] * f[:-1] + (j - y[:-1]) * f[1:]) / (j - 1)
+        return f[0]
+
+    def _exact_cdf(self, x: np.ndarray) -> np.ndarray:
+        # Row i holds F_j(x - i); arguments beyond the support of F_j are pinned to 1
+        y = x[None, ...] - np.arange(self._n + 1).reshape((-1,) + (1,) * x.ndim)
+        F = np.clip(y, 0.0, 1.0)
+        for j in range(2, self._n + 1):
+            F[:-1] = np.where(y[:-1] >= j, 1.0, (y[:-1] * F[:-1] + (j - y[:-1]) * F[1:]) / j)
+        return F[0]
+
+    def _edgeworth_pdf(self, x: np.ndarray) -> np.ndarray:
+        sd = sqrt(self._n / 12)
+        z = (x - self._n / 2) / sd
+        z2 = z * z
+        he4 = (z2 - 6) * z2 + 3
+        he6 = ((z2 - 15) * z2 + 45) * z2 - 15
+        he8 = (((z2 - 28) * z2 + 210) * z2 - 420) * z2 + 105
+        g2, g4 = KAPPA_4 / self._n, KAPPA_6 / self._n ** 2
+        correction = 1 + g2 / 24 * he4 + g4 / 720 * he6 + g2 ** 2 / 1152 * he8
+        return np.maximum(norm.pdf(z) * correction / sd, 0.0)
+
+    def _edgeworth_cdf(self, x: np.ndarray) -> np.ndarray:
+        z = (x - self._n / 2) / sqrt(self._n / 12)
+        z2 = z * z
+        he3 = (z2 - 3) * z
+        he5 = ((z2 - 10) * z2 + 15) * z
+        he7 = (((z2 - 21) * z2 + 105) * z2 - 105) * z
+        g2, g4 = KAPPA_4 / self._n, KAPPA_6 / self._n ** 2
+        correction = g2 / 24 * he3 + g4 / 720 * he5 + g2 ** 2 / 1152 * he7
+        return np.clip(norm.cdf(z) - norm.pdf(z) * correction, 0.0, 1.0)
+
+    def _cornish_fisher(self, z: np.ndarray) -> np.ndarray:
+        """
+        Quantile of the sum at standard normal quantile z, to order n^-2 (Abramowitz and Stegun 26.2.49).
+
+        z is limited to the support, |z| <= sqrt(3 n), on which the expansion is increasing.
+        """
+        bound = sqrt(3 * self._n)
+        z = np.clip(z, -bound, bound)
+        z2 = z * z
+        g2, g4 = KAPPA_4 / self._n, KAPPA_6 / self._n ** 2
+        w = z + g2 / 24 * (z2 - 3) * z \
+            + g4 / 720 * ((z2 - 10) * z2 + 15) * z \
+            - g2 ** 2 / 384 * ((3 * z2 - 24) * z2 + 29) * z
+        return np.clip(self._n / 2 + sqrt(self._n / 12) * w, 0.0, float(self._n))
+
+    def _exact_quantile(self, p: np.ndarray) -> np.ndarray:
+        """
+        Solve F(x) = p for p in [0, 1/2], keeping each iterate inside a bracket on the root.
+
+        On [0, 1], F(x) = x^n / n! exactly, which is used directly; elsewhere the Cornish-Fisher quantile
+        is the starting point.
+        """
+        n = self._n
+        log_factorial = lgamma(n + 1)
+        with np.errstate(divide='ignore'):
+            head = np.exp((np.log(p) + log_factorial) / n)
+        x = np.where(head <= 1, head, self._cornish_fisher(norm.ppf(p))).ravel()
+        target = p.ravel()
+        lo = np.ones_like(x)
+        hi = np.full_like(x, n / 2)
+        active = np.flatnonzero(head.ravel() > 1)
+        x[active] = np.clip(x[active], 1.0, n / 2)
+        for _ in range(100):
+            if active.size == 0:
+                break
+            xa = x[active]
+            f = self._exact_cdf(xa) - target[active]
+            unsolved = np.abs(f) > 1e-15 * target[active]
+            active, xa, f = active[unsolved], xa[unsolved], f[unsolved]
+            lo[active] = np.where(f < 0, xa, lo[active])
+            hi[active] = np.where(f > 0, xa, hi[active])
+            x_new = xa - f / self._exact_pdf(xa)
+            bracketed = (x_new > lo[active]) & (x_new < hi[active])
+            x_new = np.where(bracketed, x_new, 0.5 * (lo[active] + hi[active]))
+            x[active] = x_new
+            active = active[np.abs(x_new - xa) > 1e-15 * x_new]
+        return x.reshape(p.shape) if n > 1 else p.copy()
+
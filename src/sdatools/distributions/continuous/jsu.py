@@ -3,8 +3,8 @@ import numpy as np
 from scipy.stats import norm
 
 from sdatools.core.functions import phi, Phi
-from sdatools.core.utils import vectorise_input, validate_probability
-from sdatools.core.types import SeriesLike
+from sdatools.core.utils import validate_probability
+from sdatools.core.types import ArrayLike
 from sdatools.core.constants import EXP_LIMIT
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 # from sdatools.distributions.continuous.normal import NormalDistribution
@@ -115,16 +115,15 @@ class JohnsonSUDistribution(ContinuousDistribution):
     @property
     def kurtosis(self) -> float:
         k1: float = (self._expdmin2) ** 2 * ((self._expdmin2) ** 4 + 2 * (self._expdmin2) ** 3 + 3 * (self._expdmin2) ** 2 - 3) * cosh(4 * self._gamma / self._delta)
-        k2: float = 4 * (self._expdmin2) ** 2 * (self._expdmin2 + 2) * cosh(3 * self._gamma / self._delta)
+        k2: float = 4 * (self._expdmin2) ** 2 * (self._expdmin2 + 2) * cosh(2 * self._gamma / self._delta)
         k3: float = 3 * (2 * self._expdmin2 + 1)
         num: float = self._lam ** 4 * (self._expdmin2 - 1) ** 2 * (k1 + k2 + k3)
         denom: float = 8 * self.variance ** 2
-        return num / denom
+        return num / denom - 3
     
     # Distribution functions
 
-    # @vectorise_input
-    def pdf(self, x: float) -> float:
+    def pdf(self, x: ArrayLike) -> ArrayLike:
         """
         PDF of the Johnson SU distribution, derived from the probability transform.
 
@@ -134,28 +133,33 @@ class JohnsonSUDistribution(ContinuousDistribution):
 
         g^{-1}(y) = gamma + delta * arcsinh((x - xi) / lambda).
         """
-        z: float = (x - self._xi) / self._lam
+        z: ArrayLike = (np.asarray(x) - self._xi) / self._lam
         trm1: float = self._delta / self._lam
-        trm2: float = 1.0 / sqrt(1 + z ** 2)
+        trm2: ArrayLike = 1.0 / np.sqrt(1 + z ** 2)
         trm3: float = phi(self._gamma + self._delta * np.arcsinh(z))
         return trm1 * trm2 * trm3
     
-    # @vectorise_input
-    def cdf(self, x: float) -> float:
-        z: float = (x - self._xi) / self._lam
+    def logpdf(self, x: ArrayLike) -> ArrayLike:
+        z: ArrayLike = (np.asarray(x) - self._xi) / self._lam
+        u: ArrayLike = self._gamma + self._delta * np.arcsinh(z)
+        return np.log(self._delta / (self._lam * sqrt(2 * np.pi))) - 0.5 * np.log1p(z ** 2) - 0.5 * u ** 2
+    
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        z: ArrayLike = (np.asarray(x) - self._xi) / self._lam
         return Phi(self._gamma + self._delta * np.arcsinh(z))
     
-    # @vectorise_input
-    def inverse_cdf(self, p: float) -> float:
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        """
+        Inverse CDF of the Johnson SU distribution, obtained by applying g to Normal quantiles.
+
+        F^{-1}(p) = xi + lambda * sinh((Phi^{-1}(p) - gamma) / delta).
+        """
         validate_probability(p)
-        # TODO: Implement inverse CDF of Johnson SU distribution
-        raise NotImplementedError("Inverse CDF not implemented for Johnson's SU distribution")
+        return self._xi + self._lam * np.sinh((norm.ppf(p) - self._gamma) / self._delta)
     
     # Sampling
     
-    def sample(self, size: int = 1) -> SeriesLike:
-        if size <= 0:
-            raise ValueError("Sample size must be a positive integer.")
-        z: np.ndarray = np.random.normal(size=size) # TODO: Implement using NormalDistribution().sample(size)
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        z: np.ndarray = rng.standard_normal(size)
         return self._xi + self._lam * np.sinh((z - self._gamma) / self._delta)
     
\ No newline at end of file
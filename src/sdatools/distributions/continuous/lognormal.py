@@ -1,10 +1,10 @@
 from math import exp, sqrt, pi
 import numpy as np
-from scipy.stats import lognorm
+from scipy.stats import norm
 
 from sdatools.core.functions import Phi
-from sdatools.core.utils import vectorise_input, validate_probability
-from sdatools.core.types import SeriesLike
+from sdatools.core.utils import validate_probability
+from sdatools.core.types import ArrayLike
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 
 
@@ -32,32 +32,6 @@ class LogNormalDistribution(ContinuousDistribution):
     def __hash__(self) -> int:
         return hash((self._mu, self._sigma))
 
-    def __mul__(self, scalar) -> 'LogNormalDistribution':
-        """
-        Left multiplication to allow LognormalDistribution * scalar.
-
-        If ln(X) ~ N(mu, sigma**2) and c > 0, then c * ln(X) ~ N(mu + ln(c), sigma**2).
-        """
-        if not isinstance(scalar, (int, float)):
-            raise TypeError("Can only multiply by a scalar (int or float).")
-        return LogNormalDistribution(self._mu + scalar, self._sigma)
-    
-    def __rmul__(self, other):
-        """
-        Right multiplication to allow scalar * NormalDistribution.
-        """
-        return self.__mul__(other)
-
-    def __truediv__(self, scalar) -> 'LogNormalDistribution':
-        """
-        Divide the normal distribution by a scalar.
-
-        If ln(X) ~ N(mu, sigma**2) and c > 0, then ln(X) / c ~ N(mu - ln(c), sigma**2).
-        """
-        if not isinstance(scalar, (int, float)) or scalar == 0:
-            raise ValueError("Can only divide by a non-zero scalar (int or float).")
-        return LogNormalDistribution(self._mu - scalar, self._sigma)
-    
     # Distribution parameters
 
     @property
@@ -94,32 +68,28 @@ class LogNormalDistribution(ContinuousDistribution):
     
     # Distribution functions
 
-    # @vectorise_input
-    def pdf(self, x: float) -> float:
-        if x <= 0:
-            return 0.0
-        return (1.0 / (x * self._sigma * sqrt(2.0 * pi))) * exp(-((np.log(x) - self._mu) ** 2) / (2.0 * self._sigma ** 2))
-    
-    # @vectorise_input
-    def cdf(self, x: float) -> float:
-        if x <= 0:
-            return 0.0
-        return Phi((np.log(x) - self._mu) / self._sigma)
-    
-    # @vectorise_input
-    def inverse_cdf(self, p: float) -> float:
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        xp = np.where(x > 0, x, 1.0)
+        density = (1.0 / (xp * self._sigma * sqrt(2.0 * pi))) * np.exp(-((np.log(xp) - self._mu) ** 2) / (2.0 * self._sigma ** 2))
+        return np.where(x > 0, density, 0.0)[()]
+    
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        xp = np.where(x > 0, x, 1.0)
+        return np.where(x > 0, Phi((np.log(xp) - self._mu) / self._sigma), 0.0)[()]
+    
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
         validate_probability(p)
         # TODO: Implement without using scipy for educational purposes
-        return float(lognorm.ppf(p, loc=self._mu, scale=self._sigma))
+        return np.exp(self._mu + self._sigma * norm.ppf(p))
     
     # Sampling
     
-    def sample(self, size: int = 1) -> SeriesLike:
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
         """
         Generate n samples (n = size) from the Lognormal distribution.
         """
-        if size <= 0:
-            raise ValueError("Sample size must be a positive integer.")
-        z: np.ndarray = np.random.normal(size=size) # TODO: Implement using NormalDistribution().sample(size)
+        z: np.ndarray = rng.standard_normal(size)
         return np.exp(self._mu + self._sigma * z)
     
\ No newline at end of file
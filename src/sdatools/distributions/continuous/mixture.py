@@ -0,0 +1,161 @@
+from math import isclose
+import numpy as np
+from scipy.special import logsumexp
+
+from sdatools.core.types import ArrayLike, SeriesLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+
+
+class MixtureDistribution(ContinuousDistribution):
+    """
+    Class for a finite mixture of continuous distributions, with density
+
+    f(x) = sum_i w_i * f_i(x),
+
+    where the weights w_i are non-negative and sum to one.
+
+    Distribution functions are evaluated for all components at once and reduced over the component axis,
+    and logpdf uses log-sum-exp over the components' logpdf, so it stays finite far into the tails.
+    Sampling draws all component labels in one call and then samples each component once with its count.
+    """
+
+    def __init__(self, components: list[ContinuousDistribution], weights: SeriesLike | None = None):
+        if len(components) < 1:
+            raise ValueError("At least one component distribution is required.")
+        if not all(isinstance(c, ContinuousDistribution) for c in components):
+            raise TypeError("Components must be continuous distributions.")
+        if weights is None:
+            weights = [1.0 / len(components)] * len(components)
+        if len(weights) != len(components):
+            raise ValueError("Number of weights must match the number of components.")
+        if any(w < 0 for w in weights):
+            raise ValueError("Weights must be non-negative.")
+        if not isclose(sum(weights), 1.0):
+            raise ValueError("Weights must sum to one.")
+        self._components: tuple[ContinuousDistribution, ...] = tuple(components)
+        self._weights: tuple[float, ...] = tuple(float(w) for w in weights)
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"MixtureDistribution(components={list(self._components)!r}, weights={list(self._weights)})"
+
+    def __str__(self) -> str:
+        return "Mix(" + ", ".join(f"{w:.4g} * {c}" for c, w in zip(self._components, self._weights)) + ")"
+
+    def __hash__(self) -> int:
+        return hash((self._components, self._weights))
+
+    # Distribution parameters
+
+    @property
+    def components(self) -> tuple[ContinuousDistribution, ...]:
+        return self._components
+
+    @property
+    def weights(self) -> tuple[float, ...]:
+        return self._weights
+
+    # Domain
+
+    @property
+    def domain(self) -> list[float]:
+        return [min(c.domain[0] for c in self._components), max(c.domain[-1] for c in self._components)]
+
+    # Moments
+
+    @property
+    def mean(self) -> float:
+        return sum(w * c.mean for c, w in zip(self._components, self._weights))
+
+    @property
+    def variance(self) -> float:
+        return self._central_moment(2)
+
+    @property
+    def skewness(self) -> float:
+        return self._central_moment(3) / self.variance ** 1.5
+
+    @property
+    def kurtosis(self) -> float:
+        return self._central_moment(4) / self.variance ** 2 - 3
+
+    # Distribution functions
+
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        return self._reduce([c.pdf(np.asarray(x, dtype=float)) for c in self._components])
+
+    def logpdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        log_weights = np.log(self._weights_array()).reshape((-1,) + (1,) * x.ndim)
+        with np.errstate(divide='ignore'):
+            terms = np.stack([np.broadcast_to(c.logpdf(x), x.shape) for c in self._components]) + log_weights
+        return logsumexp(terms, axis=0)[()]
+
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        return self._reduce([c.cdf(np.asarray(x, dtype=float)) for c in self._components])
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        """
+        Inverse CDF by vectorised bisection on the mixture cdf.
+
+        The mixture quantile lies between the smallest and largest component quantiles at p,
+        which gives a bracket for every element of p at once.
+        """
+        validate_probability(p)
+        p = np.asarray(p, dtype=float)
+        quantiles = np.stack([np.broadcast_to(c.inverse_cdf(p), p.shape) for c in self._components])
+        lo, hi = quantiles.min(axis=0), quantiles.max(axis=0)
+        for _ in range(100):
+            mid = 0.5 * (lo + hi)
+            below = self.cdf(mid) < p
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+            if np.all(hi - lo <= 1e-12 * np.maximum(1.0, np.abs(mid))):
+                break
+        return (0.5 * (lo + hi))[()]
+
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        labels: np.ndarray = rng.choice(len(self._components), size=size, p=self._weights_array())
+        counts: np.ndarray = np.bincount(labels, minlength=len(self._components))
+        out: np.ndarray = np.empty(size)
+        for i, (component, count) in enumerate(zip(self._components, counts)):
+            if count > 0:
+                out[labels == i] = component._sample(int(count), rng)
+        return out
+
+    # Helper functions
+
+    def _weights_array(self) -> np.ndarray:
+        return np.asarray(self._weights)
+
+    def _reduce(self, values: list[ArrayLike]) -> ArrayLike:
+        """
+        Weighted sum of per-component values over the component axis.
+        """
+        return np.tensordot(self._weights_array(), np.stack(np.broadcast_arrays(*values)), axes=1)[()]
+
+    def _central_moment(self, order: int) -> float:
+        """
+        E[(X - mu)^r] for r = 2, 3, 4, from each component's mean and standardised moments.
+        """
+        mu: float = self.mean
+        total: float = 0.0
+        for c, w in zip(self._components, self._weights):
+            if w == 0:
+                continue
+            d: float = c.mean - mu
+            v: float = c.variance
+            m3: float = c.skewness * v ** 1.5 if order >= 3 else 0.0
+            if order == 2:
+                term = v + d ** 2
+            elif order == 3:
+                term = m3 + 3 * d * v + d ** 3
+            else:
+                m4: float = (c.kurtosis + 3) * v ** 2
+                term = m4 + 4 * d * m3 + 6 * d ** 2 * v + d ** 4
+            total += w * term
+        return total
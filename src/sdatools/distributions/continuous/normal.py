@@ -1,8 +1,9 @@
-from math import sqrt
+import numpy as np
 from scipy.stats import norm
 
 from sdatools.core.functions import phi, Phi
-from sdatools.core.utils import vectorise_input, validate_probability
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 
 
@@ -30,61 +31,6 @@ class NormalDistribution(ContinuousDistribution):
     def __hash__(self) -> int:
         return hash((self._mu, self._sigma))
 
-    def __add__(self, other: 'NormalDistribution') -> 'NormalDistribution':
-        """
-        Add two normal distributions
-
-        If X ~ N(mu1, sigma1) and Y ~ N(mu2, sigma2), then X + Y ~ N(mu1 + mu2, sqrt(sigma1^2 + sigma2^2))
-        """
-        if not isinstance(other, NormalDistribution):
-            raise TypeError("Can only add another NormalDistribution.")
-        new_mu = self._mu + other._mu
-        new_sigma = sqrt(self._sigma ** 2 + other._sigma ** 2)
-        return NormalDistribution(new_mu, new_sigma)
-    
-    def __sub__(self, other: 'NormalDistribution') -> 'NormalDistribution':
-        """
-        Subtract two normal distributions
-
-        If X ~ N(mu1, sigma1) and Y ~ N(mu2, sigma2), then X - Y ~ N(mu1 - mu2, sqrt(sigma1^2 + sigma2^2))
-        """
-        if not isinstance(other, NormalDistribution):
-            raise TypeError("Can only subtract another NormalDistribution.")
-        new_mu = self._mu - other._mu
-        new_sigma = sqrt(self._sigma ** 2 + other._sigma ** 2)
-        return NormalDistribution(new_mu, new_sigma)
-
-    def __mul__(self, scalar) -> 'NormalDistribution':
-        """
-        Left multiplication to allow NormalDistribution * scalar
-
-        If X ~ N(mu, sigma) and c in R, then c * X ~ N(c * mu, |c| * sigma)
-        """
-        if not isinstance(scalar, (int, float)):
-            raise TypeError("Can only multiply by a scalar (int or float).")
-        new_mu = scalar * self._mu
-        new_sigma = abs(scalar) * self._sigma
-        return NormalDistribution(new_mu, new_sigma)
-    
-    def __rmul__(self, other):
-        """
-        Right multiplication to allow scalar * NormalDistribution
-        """
-        return self.__mul__(other)
-
-    def __truediv__(self, scalar) -> 'NormalDistribution':
-        """
-        Divide the normal distribution by a scalar
-
-        If X ~ N(mu, sigma) and c != 0, then X / c ~ N(mu / c, sigma / |c|)
-        """
-        if not isinstance(scalar, (int, float)) or scalar == 0:
-            raise ValueError("Can only divide by a non-zero scalar (int or float).")
-        new_mu = self._mu / scalar
-        new_sigma = self._sigma / abs(scalar)
-        return NormalDistribution(new_mu, new_sigma)
-    
-
     # Distribution parameters
 
     @property
@@ -124,18 +70,29 @@ class NormalDistribution(ContinuousDistribution):
 
     # Distribution functions
 
-    # @vectorise_input
-    def pdf(self, x: float) -> float:
-        return phi((x - self._mu) / self._sigma) / self._sigma
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        return phi((np.asarray(x) - self._mu) / self._sigma) / self._sigma
     
-    # @vectorise_input
-    def cdf(self, x: float) -> float:
-        return Phi((x - self._mu) / self._sigma)
+    def logpdf(self, x: ArrayLike) -> ArrayLike:
+        z = (np.asarray(x) - self._mu) / self._sigma
+        return -0.5 * z ** 2 - np.log(self._sigma * np.sqrt(2 * np.pi))
     
-    # @vectorise_input
-    def inverse_cdf(self, p: float) -> float:
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        return Phi((np.asarray(x) - self._mu) / self._sigma)
+    
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
         validate_probability(p)
         # TODO: Implement without using SciPy for better understanding
-        return float(norm.ppf(p, loc=self._mu, scale=self._sigma))
+        return norm.ppf(p, loc=self._mu, scale=self._sigma)
+
+    def sf(self, x: ArrayLike) -> ArrayLike:
+        return Phi((self._mu - np.asarray(x)) / self._sigma)
+
+    def isf(self, q: ArrayLike) -> ArrayLike:
+        validate_probability(q)
+        return norm.isf(q, loc=self._mu, scale=self._sigma)
     
-   
\ No newline at end of file
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.normal(self._mu, self._sigma, size)
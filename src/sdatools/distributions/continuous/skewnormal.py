@@ -1,8 +1,11 @@
 from math import sqrt, pi
+import numpy as np
+from scipy.special import log_ndtr
 from scipy.stats import skewnorm
 
 from sdatools.core.functions import phi, Phi
-from sdatools.core.utils import vectorise_input, validate_probability
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 
 
@@ -71,31 +74,31 @@ class SkewNormalDistribution(ContinuousDistribution):
     
     # Distribution functions
 
-    # @vectorise_input
-    def pdf(self, x: float) -> float:
-        z = (x - self._xi) / self._omega
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        z = (np.asarray(x) - self._xi) / self._omega
         return 2 / self._omega * phi(z) * Phi(self._alpha * z)
     
-    # @vectorise_input
-    def cdf(self, x: float) -> float:
+    def logpdf(self, x: ArrayLike) -> ArrayLike:
+        z = (np.asarray(x) - self._xi) / self._omega
+        return np.log(2 / (self._omega * sqrt(2 * pi))) - 0.5 * z ** 2 + log_ndtr(self._alpha * z)
+    
+    def cdf(self, x: ArrayLike) -> ArrayLike:
         # TODO: Implement without scipy
-        return float(skewnorm.cdf(x, self._alpha, loc=self._xi, scale=self._omega))
+        return skewnorm.cdf(x, self._alpha, loc=self._xi, scale=self._omega)
     
-    # @vectorise_input
-    def inverse_cdf(self, p: float) -> float:
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
         validate_probability(p)
-        # TODO: Implement SkewNormal inverse CDF
-        raise NotImplementedError("Inverse CDF for SkewNormalDistribution is not implemented yet.")
+        # TODO: Implement without scipy
+        return skewnorm.ppf(p, self._alpha, loc=self._xi, scale=self._omega)
     
     # Sampling
     
-    def sample(self, size: int = 1) -> list[float]:
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
         """
         Generate n samples (n = size) from the SkewNormal distribution
+
+        If Z0, Z1 ~ N(0, 1) are independent, then delta * |Z0| + sqrt(1 - delta^2) * Z1 ~ SN(0, 1, alpha)
         """
-        # TODO: Implement manually using Box-Muller transform or similar method
-        if size <= 0:
-            raise ValueError("Sample size must be a positive integer.")
-        raise NotImplementedError("Sampling from SkewNormalDistribution is not implemented yet.")
-        # return skewnorm.rvs(self.alpha, loc=self.xi, scale=self.omega, size=size).tolist()
+        z: np.ndarray = rng.standard_normal((2, size))
+        return self._xi + self._omega * (self._delta * np.abs(z[0]) + sqrt(1 - self._delta ** 2) * z[1])
     
\ No newline at end of file
@@ -1,6 +1,7 @@
 import numpy as np
 
-from sdatools.core.utils import vectorise_input, validate_probability
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 
 
@@ -61,24 +62,14 @@ class UniformDistribution(ContinuousDistribution):
 
     # Distribution functions
 
-    # @vectorise_input
-    def pdf(self, x: float) -> float:
-        if self._a <= x <= self._b:
-            return 1 / (self._b - self._a)
-        else:
-            return 0.0
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        x = np.asarray(x, dtype=float)
+        return np.where((self._a <= x) & (x <= self._b), 1 / (self._b - self._a), 0.0)[()]
 
-    # @vectorise_input    
-    def cdf(self, x: float) -> float:
-        if x < self._a:
-            return 0.0
-        elif x > self._b:
-            return 1.0
-        else:
-            return (x - self._a) / (self._b - self._a)
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        return np.clip((np.asarray(x, dtype=float) - self._a) / (self._b - self._a), 0.0, 1.0)[()]
 
-    # @vectorise_input    
-    def inverse_cdf(self, p: float) -> float:
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
         validate_probability(p)
         return self._a + p * (self._b - self._a)
     
\ No newline at end of file
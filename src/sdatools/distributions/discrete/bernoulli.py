@@ -0,0 +1,86 @@
+from math import sqrt
+import numpy as np
+
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.discrete_distribution import DiscreteDistribution
+
+
+class BernoulliDistribution(DiscreteDistribution):
+    """
+    A class representing a Bernoulli distribution with probability of success p.
+
+    https://en.wikipedia.org/wiki/Bernoulli_distribution
+
+    P(X = 1) = p, P(X = 0) = 1 - p
+    """
+
+    def __init__(self, p: float):
+        if not (0 <= p <= 1):
+            raise ValueError("Probability of success must be between 0 and 1.")
+        self._p = p
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"BernoulliDistribution(p={self._p})"
+
+    def __str__(self) -> str:
+        return f"Bernoulli({self._p})"
+
+    def __hash__(self) -> int:
+        return hash(self._p)
+
+    # Distribution parameters
+
+    @property
+    def p(self) -> float:
+        return self._p
+
+    # Domain
+
+    @property
+    def domain(self) -> list[int]:
+        return [0, 1]
+
+    # Moments
+
+    @property
+    def mean(self) -> float:
+        return self._p
+
+    @property
+    def variance(self) -> float:
+        return self._p * (1 - self._p)
+
+    @property
+    def skewness(self) -> float:
+        q = 1 - self._p
+        return (q - self._p) / sqrt(self._p * q) if 0 < self._p < 1 else float('inf')
+
+    @property
+    def kurtosis(self) -> float:
+        pq = self._p * (1 - self._p)
+        return (1 - 6 * pq) / pq if 0 < self._p < 1 else float('inf')
+
+    # Distribution functions
+
+    def pmf(self, k: ArrayLike) -> ArrayLike:
+        k = np.asarray(k)
+        return np.where(k == 1, self._p, np.where(k == 0, 1 - self._p, 0.0))[()]
+
+    def cdf(self, k: ArrayLike) -> ArrayLike:
+        k = np.asarray(k)
+        return np.where(k < 0, 0.0, np.where(k < 1, 1 - self._p, 1.0))[()]
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        """
+        F^{-1}(u) = 1 if u > 1 - p, else 0
+        """
+        validate_probability(p)
+        return (np.asarray(p) > 1 - self._p).astype(np.int64)[()]
+
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        return (rng.random(size) < self._p).astype(np.int64)
@@ -0,0 +1,148 @@
+from math import ceil, log, sqrt, log1p
+from typing import Callable
+import numpy as np
+
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.discrete_distribution import DiscreteDistribution
+
+
+class GeometricDistribution(DiscreteDistribution):
+    """
+    A class representing a Geometric distribution with probability of success p, counting the number
+    of failures before the first success.
+
+    https://en.wikipedia.org/wiki/Geometric_distribution
+
+    P(X = k) = (1 - p)^k * p, for k = 0, 1, 2, ...
+
+    The domain is unbounded, so sampling does not go through a pmf table: if U ~ U(0, 1], then
+    floor(log(U) / log(1 - p)) ~ Geometric(p). The moments, cdf, sf and probabilities P(lower <= X <= upper)
+    are closed-form; only expect(g) for a function g sums the pmf over the domain, which is truncated at the
+    first k with P(X > k) <= tail_mass.
+    """
+
+    def __init__(self, p: float, tail_mass: float = 1e-16):
+        if not (0 < p <= 1):
+            raise ValueError("Probability of success must be in (0, 1].")
+        if not (0 < tail_mass < 1):
+            raise ValueError("Tail mass must be in (0, 1).")
+        self._p = p
+        self._tail_mass = tail_mass
+        self._log_q = log1p(-p) if p < 1 else float('-inf')
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"GeometricDistribution(p={self._p}, tail_mass={self._tail_mass})"
+
+    def __str__(self) -> str:
+        return f"Geo({self._p})"
+
+    def __hash__(self) -> int:
+        return hash((self._p, self._tail_mass))
+
+    # Distribution parameters
+
+    @property
+    def p(self) -> float:
+        return self._p
+
+    @property
+    def tail_mass(self) -> float:
+        return self._tail_mass
+
+    # Domain
+
+    @property
+    def domain(self) -> list[int]:
+        # Smallest k with P(X > k) = (1 - p)^(k + 1) <= tail_mass
+        if self._p == 1:
+            return [0]
+        return list(range(0, max(ceil(log(self._tail_mass) / self._log_q) - 1, 0) + 1))
+
+    # Moments
+
+    @property
+    def mean(self) -> float:
+        return (1 - self._p) / self._p
+
+    @property
+    def variance(self) -> float:
+        return (1 - self._p) / self._p ** 2
+
+    @property
+    def skewness(self) -> float:
+        return (2 - self._p) / sqrt(1 - self._p) if self._p < 1 else float('inf')
+
+    @property
+    def kurtosis(self) -> float:
+        return 6 + self._p ** 2 / (1 - self._p) if self._p < 1 else float('inf')
+
+    # Distribution functions
+
+    def pmf(self, k: ArrayLike) -> ArrayLike:
+        """
+        P(X = k) = (1 - p)^k * p
+        """
+        k = np.asarray(k)
+        valid = (k >= 0) & (k == np.floor(k))
+        with np.errstate(invalid='ignore'):
+            mass = self._p * np.exp(np.where(valid, k, 0) * self._log_q) if self._p < 1 else (k == 0) * 1.0
+        return np.where(valid, mass, 0.0)[()]
+
+    def cdf(self, k: ArrayLike) -> ArrayLike:
+        """
+        P(X <= k) = 1 - (1 - p)^(floor(k) + 1)
+        """
+        k = np.floor(np.asarray(k, dtype=float))
+        with np.errstate(invalid='ignore'):
+            tail = -np.expm1((np.maximum(k, -1) + 1) * self._log_q) if self._p < 1 else np.ones_like(k)
+        return np.where(k < 0, 0.0, tail)[()]
+
+    def sf(self, k: ArrayLike) -> ArrayLike:
+        """
+        P(X > k) = (1 - p)^(floor(k) + 1), accurate far into the upper tail where the cdf rounds to 1.
+        """
+        k = np.floor(np.asarray(k, dtype=float))
+        with np.errstate(invalid='ignore'):
+            tail = np.exp((np.maximum(k, -1) + 1) * self._log_q) if self._p < 1 else np.zeros_like(k)
+        return np.where(k < 0, 1.0, tail)[()]
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        """
+        Smallest k with P(X <= k) >= p, i.e. k = ceil(log(1 - p) / log(1 - p_success)) - 1.
+        """
+        validate_probability(p)
+        p = np.asarray(p, dtype=float)
+        if self._p == 1:
+            return np.zeros(p.shape, dtype=np.int64)[()]
+        finite = p < 1
+        with np.errstate(divide='ignore'):
+            k = np.ceil(np.log1p(-np.where(finite, p, 0.0)) / self._log_q) - 1
+        # Guard against rounding just above an integer
+        k = np.where((k > 0) & (self.cdf(k - 1) >= p), k - 1, np.maximum(k, 0)).astype(np.int64)
+        # The quantile at p = 1 is infinite; it is represented by the largest int64
+        return np.where(finite, k, np.iinfo(np.int64).max)[()]
+
+    def expect(self, g: Callable | None = None, lower: float = float('-inf'), upper: float = float('inf')) -> float | np.ndarray:
+        """
+        As DiscreteDistribution.expect, except that P(lower <= X <= upper) (g=None) is exact: the cdf at the
+        upper limit minus the cdf just below the lower limit, with no truncation of the domain.
+        """
+        if g is not None:
+            return super().expect(g, lower, upper)
+        below: float = float(self.cdf(np.ceil(lower) - 1)) if lower > 0 else 0.0
+        above: float = float(self.sf(upper)) if np.isfinite(upper) else 0.0
+        return max(1.0 - below - above, 0.0)
+
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        floor(log(U) / log(1 - p)) with U ~ U(0, 1], drawn as 1 - U[0, 1) so that log(U) is finite.
+        """
+        if self._p == 1:
+            return np.zeros(size, dtype=np.int64)
+        u: np.ndarray = 1.0 - rng.random(size)
+        return np.floor(np.log(u) / self._log_q).astype(np.int64)
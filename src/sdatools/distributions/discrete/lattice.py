@@ -0,0 +1,102 @@
+from typing import Callable
+import numpy as np
+
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.discrete_distribution import DiscreteDistribution
+
+
+class LatticeDistribution(DiscreteDistribution):
+    """
+    Class for a distribution on the consecutive integers offset, offset + 1, ..., offset + m - 1, with a tabulated pmf.
+
+    P(X = offset + i) = probabilities[i] / sum(probabilities)
+
+    Used by the distribution algebra for sums and products of discrete distributions without a closed-form rule,
+    whose pmfs are combined exactly on the integer lattice (up to the truncation of each component's domain).
+    The pmf, cdf and inverse cdf are lookups in the table, and are vectorised.
+    """
+
+    def __init__(self, probabilities: ArrayLike, offset: int = 0):
+        table = np.asarray(probabilities, dtype=float)
+        if table.ndim != 1 or table.size == 0:
+            raise ValueError("Probabilities must be a non-empty 1-D array.")
+        if np.any(table < 0) or not np.all(np.isfinite(table)) or not table.sum() > 0:
+            raise ValueError("Probabilities must be finite and non-negative, with a positive sum.")
+        if int(offset) != offset:
+            raise ValueError("Offset must be an integer.")
+        # Drop zero-probability points at either end, so the domain is the support
+        support = np.flatnonzero(table)
+        self._table: np.ndarray = table[support[0]:support[-1] + 1] / table.sum()
+        self._offset: int = int(offset) + int(support[0])
+        self._cumulative: np.ndarray = np.cumsum(self._table)
+        self._cumulative[-1] = 1.0
+
+    @classmethod
+    def from_distribution(cls, dist: DiscreteDistribution) -> 'LatticeDistribution':
+        """
+        Tabulate a discrete distribution over its (integer) domain.
+        """
+        points = np.asarray(dist.domain, dtype=np.int64)
+        table = np.zeros(int(points.max() - points.min()) + 1)
+        np.add.at(table, points - points.min(), [dist.pmf(int(k)) for k in points])
+        return cls(table, int(points.min()))
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"LatticeDistribution(probabilities={self._table.tolist()}, offset={self._offset})"
+
+    def __str__(self) -> str:
+        return f"Lattice({self._offset}, ..., {self._offset + self._table.size - 1})"
+
+    def __hash__(self) -> int:
+        return hash((self._offset, self._table.tobytes()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LatticeDistribution):
+            return NotImplemented
+        return self._offset == other._offset and np.array_equal(self._table, other._table)
+
+    # Distribution parameters
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._table
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    # Domain
+
+    @property
+    def domain(self) -> list[int]:
+        return list(range(self._offset, self._offset + self._table.size))
+
+    # Distribution functions
+
+    def pmf(self, k: ArrayLike) -> ArrayLike:
+        k = np.asarray(k, dtype=float)
+        index = k - self._offset
+        support = (index >= 0) & (index < self._table.size) & (k == np.floor(k))
+        return np.where(support, self._table[np.where(support, index, 0).astype(np.int64)], 0.0)[()]
+
+    def cdf(self, k: ArrayLike) -> ArrayLike:
+        index = np.floor(np.asarray(k, dtype=float)) - self._offset
+        inside = np.clip(index, 0, self._table.size - 1).astype(np.int64)
+        return np.where(index < 0, 0.0, np.where(index >= self._table.size, 1.0, self._cumulative[inside]))[()]
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        validate_probability(p)
+        index = np.searchsorted(self._cumulative, np.asarray(p, dtype=float), side="left")
+        return (self._offset + np.minimum(index, self._table.size - 1)).astype(np.int64)[()]
+
+    def expect(self, g: Callable | None = None, lower: float = float('-inf'), upper: float = float('inf')) -> float | np.ndarray:
+        points = self._offset + np.arange(self._table.size)
+        inside = (points >= lower) & (points <= upper)
+        if not inside.any():
+            return 0.0
+        points, weights = points[inside], self._table[inside]
+        integral = weights.sum() if g is None else np.asarray(g(points)) @ weights
+        return float(integral) if np.ndim(integral) == 0 else integral
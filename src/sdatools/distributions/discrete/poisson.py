@@ -67,7 +67,7 @@ class PoissonDistribution(DiscreteDistribution):
         if k < 0 or not isinstance(k, int):
             raise ValueError("k must be a non-negative integer.")
         
-        log_pmf = self._lam * k - self._lam - sum(log(i) for i in range(1, k + 1)) if k > 0 else -self._lam
+        log_pmf = k * log(self._lam) - self._lam - sum(log(i) for i in range(1, k + 1)) if k > 0 else -self._lam
         return exp(log_pmf)
     
     def cdf(self, k: int) -> float:
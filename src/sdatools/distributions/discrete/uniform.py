@@ -0,0 +1,98 @@
+from math import floor
+import numpy as np
+
+from sdatools.core.types import ArrayLike
+from sdatools.core.utils import validate_probability
+from sdatools.distributions.abstract.discrete_distribution import DiscreteDistribution
+
+
+class DiscreteUniformDistribution(DiscreteDistribution):
+    """
+    A class representing a discrete Uniform distribution on the integers a, a + 1, ..., b.
+
+    https://en.wikipedia.org/wiki/Discrete_uniform_distribution
+
+    P(X = k) = 1 / (b - a + 1), for k = a, ..., b
+    """
+
+    def __init__(self, a: int, b: int):
+        if int(a) != a or int(b) != b:
+            raise ValueError("Bounds a and b must be integers.")
+        if a > b:
+            raise ValueError("Lower bound a must not exceed upper bound b.")
+        self._a = int(a)
+        self._b = int(b)
+        self._n = self._b - self._a + 1
+
+    # Special methods
+
+    def __repr__(self) -> str:
+        return f"DiscreteUniformDistribution(a={self._a}, b={self._b})"
+
+    def __str__(self) -> str:
+        return f"U{{{self._a}, ..., {self._b}}}"
+
+    def __hash__(self) -> int:
+        return hash((self._a, self._b))
+
+    # Distribution parameters
+
+    @property
+    def a(self) -> int:
+        return self._a
+
+    @property
+    def b(self) -> int:
+        return self._b
+
+    # Domain
+
+    @property
+    def domain(self) -> list[int]:
+        return list(range(self._a, self._b + 1))
+
+    # Moments
+
+    @property
+    def mean(self) -> float:
+        return (self._a + self._b) / 2
+
+    @property
+    def variance(self) -> float:
+        return (self._n ** 2 - 1) / 12
+
+    @property
+    def skewness(self) -> float:
+        return 0.0
+
+    @property
+    def kurtosis(self) -> float:
+        n2 = self._n ** 2
+        return -6 * (n2 + 1) / (5 * (n2 - 1)) if self._n > 1 else float('inf')
+
+    # Distribution functions
+
+    def pmf(self, k: ArrayLike) -> ArrayLike:
+        k = np.asarray(k)
+        support = (k >= self._a) & (k <= self._b) & (k == np.floor(k))
+        return np.where(support, 1 / self._n, 0.0)[()]
+
+    def cdf(self, k: ArrayLike) -> ArrayLike:
+        k = np.floor(np.asarray(k, dtype=float))
+        return np.clip((k - self._a + 1) / self._n, 0.0, 1.0)[()]
+
+    def inverse_cdf(self, p: ArrayLike) -> ArrayLike:
+        """
+        F^{-1}(p) = a + ceil(n * p) - 1, for n = b - a + 1 (and a at p = 0)
+        """
+        validate_probability(p)
+        k = np.maximum(np.ceil(np.asarray(p, dtype=float) * self._n) - 1, 0)
+        return (self._a + k.astype(np.int64))[()]
+
+    # Sampling
+
+    def _sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Integer scaling of the Generator's raw bits (unbiased, unlike floor(n * U)).
+        """
+        return rng.integers(self._a, self._b, size=size, dtype=np.int64, endpoint=True)
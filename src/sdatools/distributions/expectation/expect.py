@@ -0,0 +1,113 @@
+from __future__ import annotations
+from functools import lru_cache
+from math import pi, sqrt
+from typing import Callable
+import numpy as np
+
+from sdatools.distributions.abstract.distribution import Distribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import _weighted_sum
+from sdatools.numerical_methods.quadrature.rules.gaussian import GaussHermiteRule, GaussLaguerreRule
+
+
+# Default number of nodes of the matched Gaussian rules, exact for polynomials g of degree 2n - 1
+DEFAULT_NODES: int = 32
+
+# Matched rules, keyed by the distribution types they apply to. A rule is called as rule(dist, n) and returns the
+# nodes x and weights w with E[g(X)] ~ sum(w_i * g(x_i)), or None if the parameters are outside its range, in which
+# case expect falls back to dist.expect.
+_EXPECTATION_RULES: dict[type, Callable] = {}
+
+
+def register_expectation(dist_type: type) -> Callable:
+    """
+    Decorator registering a matched quadrature rule for expectations under dist_type (and its subclasses).
+    """
+    def decorator(rule: Callable) -> Callable:
+        _EXPECTATION_RULES[dist_type] = rule
+        return rule
+    return decorator
+
+
+def expect(g: Callable, dist: Distribution, n: int = DEFAULT_NODES) -> float | np.ndarray:
+    """
+    E[g(X)] for X ~ dist, using the Gaussian quadrature rule matched to the distribution where there is one.
+
+    - Normal and LogNormal: n-point Gauss-Hermite, after standardising (X = mu + sigma * Z, or exp of it)
+    - Gamma and Exponential: n-point generalised Gauss-Laguerre, with the density as the weight function
+    - Otherwise: dist.expect(g), i.e. tanh-sinh quadrature (see DoubleExponentialIntegrator)
+
+    The matched rules integrate against the density exactly, so they are exact for polynomials g of degree
+    2n - 1 (in log X for LogNormal) and converge exponentially for smooth g, with a single call of g on the n
+    nodes and no truncation of the domain. For g with kinks or jumps (e.g. max(X - K, 0)), or singular at zero
+    (e.g. log X under a Gamma), convergence is only algebraic, and dist.expect(g, lower, upper), splitting at
+    the kink, is more accurate.
+
+    Nodes and weights are cached per distribution (compared by its parameters) and n, so repeated expectations
+    under the same distribution cost one call of g and a dot product.
+
+    Args:
+        g (Callable): Vectorised function of x; may return an array whose last axis runs over x
+        dist (Distribution): Distribution of X
+        n (int): Number of nodes of the matched rule
+
+    Returns:
+        float or np.ndarray: The expectation (an array if g returns one)
+    """
+    if n < 1:
+        raise ValueError("Number of nodes must be at least 1.")
+    nodes = expectation_nodes(dist, n)
+    if nodes is None:
+        return dist.expect(g)
+    x, w = nodes
+    return _weighted_sum(g(x), w)
+
+
+def expectation_nodes(dist: Distribution, n: int = DEFAULT_NODES) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    The (read-only) nodes and weights of the rule matched to dist, or None if there is none.
+    """
+    return _cached_nodes(type(dist), dist, n)
+
+
+@lru_cache(maxsize=1024)
+def _cached_nodes(dist_type: type, dist: Distribution, n: int) -> tuple[np.ndarray, np.ndarray] | None:
+    # The type is part of the key, since distributions of different types can compare equal
+    for rule_type in dist_type.__mro__:
+        if rule_type in _EXPECTATION_RULES:
+            nodes = _EXPECTATION_RULES[rule_type](dist, n)
+            if nodes is not None:
+                for array in nodes:
+                    array.flags.writeable = False
+            return nodes
+    return None
+
+
+# Matched rules
+
+@register_expectation(NormalDistribution)
+def _normal_nodes(dist: NormalDistribution, n: int) -> tuple[np.ndarray, np.ndarray]:
+    rule = GaussHermiteRule(n)
+    return dist.mu + sqrt(2) * dist.sigma * rule.nodes, rule.weights / sqrt(pi)
+
+
+@register_expectation(LogNormalDistribution)
+def _lognormal_nodes(dist: LogNormalDistribution, n: int) -> tuple[np.ndarray, np.ndarray]:
+    rule = GaussHermiteRule(n)
+    return np.exp(dist.mu + sqrt(2) * dist.sigma * rule.nodes), rule.weights / sqrt(pi)
+
+
+@register_expectation(GammaDistribution)
+def _gamma_nodes(dist: GammaDistribution, n: int) -> tuple[np.ndarray, np.ndarray]:
+    # X = beta * Y, where Y has density y^(alpha - 1) * exp(-y) / Gamma(alpha)
+    rule = GaussLaguerreRule(n, dist.alpha - 1)
+    return dist.beta * rule.nodes, rule.probabilities.copy()
+
+
+@register_expectation(ExponentialDistribution)
+def _exponential_nodes(dist: ExponentialDistribution, n: int) -> tuple[np.ndarray, np.ndarray]:
+    rule = GaussLaguerreRule(n)
+    return rule.nodes / dist.lam, rule.weights.copy()
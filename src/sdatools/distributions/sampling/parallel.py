@@ -0,0 +1,118 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import TYPE_CHECKING
+from weakref import finalize
+import numpy as np
+
+from sdatools.core.types import RNGLike
+
+if TYPE_CHECKING:
+    from sdatools.distributions.abstract.distribution import Distribution
+
+
+# Number of draws per independent random stream. Fixed so that output does not depend on n_jobs.
+CHUNK_SIZE: int = 2 ** 20
+
+
+def spawn_seed_sequences(rng: RNGLike, n: int) -> list[np.random.SeedSequence]:
+    """
+    Spawn n independent child SeedSequences from a seed, SeedSequence or Generator.
+
+    A Generator is consumed once to derive the root entropy, so repeated calls continue its stream.
+    """
+    if isinstance(rng, np.random.SeedSequence):
+        root = rng
+    elif isinstance(rng, np.random.Generator):
+        root = np.random.SeedSequence(rng.integers(0, 2 ** 63, size=4).tolist())
+    else:
+        root = np.random.SeedSequence(rng)
+    return root.spawn(n)
+
+
+def parallel_sample(dist: Distribution,
+                    size: int,
+                    n_jobs: int = 1,
+                    rng: RNGLike = None,
+                    chunk_size: int = CHUNK_SIZE,
+                    dtype: type = np.float64) -> np.ndarray:
+    """
+    Generate n (n=size) i.i.d. samples from dist using independent random streams per chunk.
+
+    The request is split into chunks of chunk_size draws, and chunk i is drawn with a Generator
+    seeded from the i-th child of SeedSequence(rng). Chunks are written directly into a shared
+    memory buffer by a pool of n_jobs processes, so the output is bit-identical for any n_jobs
+    (n_jobs=1 draws the same chunks in the calling process). The returned array is a view of the
+    shared memory itself, not a copy, and the memory is released when the array is.
+
+    Args:
+        dist (Distribution): Distribution implementing _sample(size, rng) (or _sample_into(out, rng))
+        size (int): Number of samples
+        n_jobs (int): Number of worker processes (-1 uses all available cores)
+        rng (RNGLike): Seed, SeedSequence or Generator defining the root random stream
+        chunk_size (int): Number of draws per random stream
+        dtype (type): dtype of the output array
+
+    Returns:
+        np.ndarray: Array of n (n=size) samples
+    """
+    if size <= 0:
+        raise ValueError("Sample size must be a positive integer.")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive integer.")
+    if n_jobs == -1:
+        n_jobs = cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("Number of jobs must be a positive integer or -1.")
+
+    starts: list[int] = list(range(0, size, chunk_size))
+    seeds: list[np.random.SeedSequence] = spawn_seed_sequences(rng, len(starts))
+
+    if n_jobs == 1 or len(starts) == 1:
+        out: np.ndarray = np.empty(size, dtype=dtype)
+        for start, seed in zip(starts, seeds):
+            stop = min(start + chunk_size, size)
+            dist._sample_into(out[start:stop], np.random.default_rng(seed))
+        return out
+
+    dtype_str: str = np.dtype(dtype).str
+    shm = SharedMemory(create=True, size=size * np.dtype(dtype).itemsize)
+    try:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(starts))) as executor:
+            futures = [
+                executor.submit(_fill_chunk, dist, shm.name, size, dtype_str, start, min(start + chunk_size, size), seed)
+                for start, seed in zip(starts, seeds)
+            ]
+            for future in futures:
+                future.result()
+        # Return the segment itself rather than a copy, which would double peak memory. Its name is unlinked
+        # below, so the memory is only mapped here, and it is closed (unmapped) once the array and every view
+        # of it have been released
+        out: np.ndarray = np.ndarray(size, dtype=dtype, buffer=shm.buf)
+        finalize(out, shm.close)
+        return out
+    except BaseException:
+        shm.close()
+        raise
+    finally:
+        shm.unlink()
+
+
+def _fill_chunk(dist: Distribution,
+                shm_name: str,
+                size: int,
+                dtype_str: str,
+                start: int,
+                stop: int,
+                seed: np.random.SeedSequence) -> None:
+    """
+    Worker: draw samples [start, stop) with a Generator seeded by seed and write them into shared memory.
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(size, dtype=np.dtype(dtype_str), buffer=shm.buf)
+        dist._sample_into(out[start:stop], np.random.default_rng(seed))
+        del out
+    finally:
+        shm.close()
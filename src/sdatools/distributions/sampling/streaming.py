@@ -0,0 +1,160 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+import numpy as np
+
+from sdatools.core.types import RNGLike, SeriesLike
+from sdatools.core.utils import get_rng
+
+if TYPE_CHECKING:
+    from sdatools.distributions.abstract.distribution import Distribution
+
+
+# Default number of draws held in memory at once when streaming samples
+STREAM_CHUNK_SIZE: int = 2 ** 20
+
+
+def sample_iter(dist: Distribution,
+                total: int,
+                chunk_size: int = STREAM_CHUNK_SIZE,
+                rng: RNGLike = None) -> Iterator[np.ndarray]:
+    """
+    Yield n (n=total) i.i.d. samples from dist in chunks of chunk_size draws.
+
+    Every chunk except possibly the last has exactly chunk_size elements. All chunks are
+    drawn from the same Generator, so a fixed seed reproduces the whole stream.
+    """
+    if total <= 0:
+        raise ValueError("Sample size must be a positive integer.")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive integer.")
+    rng = get_rng(rng)
+    for start in range(0, total, chunk_size):
+        yield np.asarray(dist.sample(min(chunk_size, total - start), rng=rng))
+
+
+def sample_to_file(dist: Distribution,
+                   path: str,
+                   total: int,
+                   chunk_size: int = STREAM_CHUNK_SIZE,
+                   rng: RNGLike = None) -> str:
+    """
+    Write n (n=total) i.i.d. samples from dist to a .npy file through a memory map.
+
+    Only one chunk is held in memory at a time; the file can be re-opened lazily
+    with np.load(path, mmap_mode="r").
+
+    Returns:
+        str: The path written to
+    """
+    out: np.memmap | None = None
+    start: int = 0
+    for chunk in sample_iter(dist, total, chunk_size, rng):
+        if out is None:
+            out = np.lib.format.open_memmap(path, mode="w+", dtype=chunk.dtype, shape=(total,))
+        out[start:start + len(chunk)] = chunk
+        start += len(chunk)
+    out.flush()
+    del out
+    return path
+
+
+class RunningMoments:
+    """
+    Accumulate mean, variance, skewness and (excess) kurtosis over chunks of data.
+
+    Chunks are merged with the pairwise update formulas of Pebay (2008), so the result
+    matches the moments of the concatenated data without holding it in memory.
+
+    Moments use the same (population) definitions as MethodOfMoments.
+
+    Methods:
+        update(chunk): Merge a chunk of observations into the running moments
+    """
+
+    def __init__(self):
+        self._n: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._m3: float = 0.0
+        self._m4: float = 0.0
+
+    def update(self, chunk: SeriesLike) -> 'RunningMoments':
+        x: np.ndarray = np.asarray(chunk, dtype=float)
+        nb: int = x.size
+        if nb == 0:
+            return self
+        mean_b: float = float(x.mean())
+        d: np.ndarray = x - mean_b
+        d2: np.ndarray = d * d
+        m2_b: float = float(d2.sum())
+        m3_b: float = float((d2 * d).sum())
+        m4_b: float = float((d2 * d2).sum())
+
+        na: int = self._n
+        n: int = na + nb
+        delta: float = mean_b - self._mean
+        m2_a, m3_a = self._m2, self._m3
+
+        self._m4 += m4_b + delta ** 4 * na * nb * (na ** 2 - na * nb + nb ** 2) / n ** 3 \
+            + 6 * delta ** 2 * (na ** 2 * m2_b + nb ** 2 * m2_a) / n ** 2 \
+            + 4 * delta * (na * m3_b - nb * m3_a) / n
+        self._m3 += m3_b + delta ** 3 * na * nb * (na - nb) / n ** 2 \
+            + 3 * delta * (na * m2_b - nb * m2_a) / n
+        self._m2 += m2_b + delta ** 2 * na * nb / n
+        self._mean += delta * nb / n
+        self._n = n
+        return self
+
+    @property
+    def count(self) -> int:
+        return self._n
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self._n
+
+    @property
+    def skewness(self) -> float:
+        return self._m3 / (self._n * self.variance ** 1.5)
+
+    @property
+    def kurtosis(self) -> float:
+        return self._m4 / (self._n * self.variance ** 2) - 3
+
+
+class RunningHistogram:
+    """
+    Accumulate histogram counts over chunks of data using fixed bin edges.
+
+    Inputs:
+        bin_edges (SeriesLike): Monotonically increasing bin edges, as for np.histogram
+
+    Methods:
+        update(chunk): Add the counts of a chunk of observations
+    """
+
+    def __init__(self, bin_edges: SeriesLike):
+        self._bin_edges: np.ndarray = np.asarray(bin_edges, dtype=float)
+        if self._bin_edges.ndim != 1 or len(self._bin_edges) < 2:
+            raise ValueError("At least two bin edges are required.")
+        self._counts: np.ndarray = np.zeros(len(self._bin_edges) - 1, dtype=np.int64)
+
+    def update(self, chunk: SeriesLike) -> 'RunningHistogram':
+        self._counts += np.histogram(np.asarray(chunk), bins=self._bin_edges)[0]
+        return self
+
+    @property
+    def bin_edges(self) -> np.ndarray:
+        return self._bin_edges
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts
+
+    @property
+    def density(self) -> np.ndarray:
+        return self._counts / (self._counts.sum() * np.diff(self._bin_edges))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import numpy as np
+
+from sdatools.core.types import RNGLike
+from sdatools.core.utils import get_rng
+
+if TYPE_CHECKING:
+    from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+
+
+# Sampling methods supported by Distribution.sample()
+SAMPLING_METHODS: tuple[str, ...] = ("iid", "antithetic", "stratified", "lhs")
+
+
+def sample_uniforms(size: int, method: str = "iid", rng: RNGLike = None) -> np.ndarray:
+    """
+    Generate n (n=size) U[0, 1) variates using the requested sampling method.
+
+    Args:
+        size (int): Number of variates to generate
+        method (str): One of "iid", "antithetic", "stratified" or "lhs"
+        rng (RNGLike): Seed or Generator used to draw the variates
+
+    Returns:
+        np.ndarray: Array of uniform variates, suitable as input to a vectorised inverse CDF
+    """
+    rng = get_rng(rng)
+    if method == "iid":
+        return rng.random(size)
+    if method == "antithetic":
+        return antithetic_uniforms(size, rng)
+    if method == "stratified":
+        return stratified_uniforms(size, rng)
+    if method == "lhs":
+        return latin_hypercube_uniforms(size, 1, rng)[:, 0]
+    raise ValueError(f"Unknown sampling method '{method}'. Must be one of {SAMPLING_METHODS}.")
+
+
+def antithetic_uniforms(size: int, rng: RNGLike = None) -> np.ndarray:
+    """
+    Antithetic variates: the first half of the array holds u ~ U[0, 1), the second half holds 1 - u.
+
+    For odd sizes the final antithetic partner is dropped.
+    """
+    rng = get_rng(rng)
+    u: np.ndarray = rng.random((size + 1) // 2)
+    return np.concatenate((u, 1.0 - u))[:size]
+
+
+def stratified_uniforms(size: int, rng: RNGLike = None) -> np.ndarray:
+    """
+    Stratified variates: one uniform draw from each of the n (n=size) strata [i / n, (i + 1) / n).
+
+    The strata are visited in random order (as in latin_hypercube_uniforms), so any prefix or subsequence of the
+    output is itself a uniform sample rather than the lowest strata.
+    """
+    rng = get_rng(rng)
+    return (rng.permutation(size) + rng.random(size)) / size
+
+
+def latin_hypercube_uniforms(size: int, dim: int, rng: RNGLike = None) -> np.ndarray:
+    """
+    Latin hypercube design on [0, 1)^dim with n (n=size) points.
+
+    Each column is a stratified sample with an independent random permutation of strata,
+    so every one-dimensional margin contains exactly one point per stratum.
+
+    Returns:
+        np.ndarray: Array of shape (size, dim)
+    """
+    rng = get_rng(rng)
+    strata: np.ndarray = rng.permuted(np.tile(np.arange(size), (dim, 1)), axis=1).T
+    return (strata + rng.random((size, dim))) / size
+
+
+def latin_hypercube_sample(distributions: list[ContinuousDistribution],
+                           size: int,
+                           rng: RNGLike = None) -> np.ndarray:
+    """
+    Multidimensional Latin hypercube sample across several (independent) distributions.
+
+    Column j of the output is distributions[j].inverse_cdf() applied to column j of a
+    Latin hypercube design, so each margin is stratified.
+
+    Args:
+        distributions (list[ContinuousDistribution]): Distributions implementing a vectorised inverse_cdf()
+        size (int): Number of sample points
+        rng (RNGLike): Seed or Generator used to draw the design
+
+    Returns:
+        np.ndarray: Array of shape (size, len(distributions))
+    """
+    if size <= 0:
+        raise ValueError("Sample size must be a positive integer.")
+    if len(distributions) == 0:
+        raise ValueError("At least one distribution is required.")
+    u: np.ndarray = latin_hypercube_uniforms(size, len(distributions), rng)
+    return np.column_stack([dist.inverse_cdf(u[:, j]) for j, dist in enumerate(distributions)])
@@ -0,0 +1,212 @@
+from math import comb, pi, sqrt
+from typing import Callable
+import numpy as np
+
+from sdatools.core.types import ArrayLike
+from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule
+from sdatools.numerical_methods.quadrature.quadrature_engine import QuadratureResult
+from sdatools.numerical_methods.quadrature.rules.gaussian import GaussHermiteRule, GaussLegendreRule
+
+
+class SparseGridIntegrator:
+    """
+    Smolyak sparse grid cubature over a box in d dimensions, built from a family of one-dimensional rules
+
+    rule(i) gives the one-dimensional rule U^i used at level i >= 1 (by default, the i-point Gauss-Legendre
+    rule). The level L sparse grid is the combination of tensor products
+
+    A(L, d) = sum over i with max(d, L) <= |i| <= L + d - 1 of (-1)^(L + d - 1 - |i|) * C(d - 1, L + d - 1 - |i|)
+              * U^(i_1) x ... x U^(i_d),
+
+    whose points are merged into one set with combined weights. With Gauss-Legendre rules A(L, d) is exact
+    for polynomials of total degree 2L - 1, and its number of points grows polynomially in d, rather than
+    exponentially as for the full tensor product.
+
+    Levels are computed from min_level upwards. Each level evaluates f only at the points not already
+    evaluated at an earlier level, in a single vectorised call, and integration stops once successive levels
+    agree to within max(abs_tol, rel_tol * |I|), which is the reported error. It also stops at max_level, or
+    before a level would take the evaluations beyond max_evaluations.
+    """
+    def __init__(self,
+                 rule: Callable[[int], QuadratureRule] = GaussLegendreRule,
+                 abs_tol: float = 1e-10,
+                 rel_tol: float = 1e-10,
+                 min_level: int = 2,
+                 max_level: int = 10,
+                 max_evaluations: int = 1_000_000):
+        if abs_tol < 0 or rel_tol < 0:
+            raise ValueError("Tolerances must be non-negative.")
+        if not 1 <= min_level <= max_level:
+            raise ValueError("Levels must satisfy 1 <= min_level <= max_level.")
+        self.rule = rule
+        self.abs_tol = abs_tol
+        self.rel_tol = rel_tol
+        self.min_level = min_level
+        self.max_level = max_level
+        self.max_evaluations = max_evaluations
+
+    def integrate(self, f: Callable, a: ArrayLike, b: ArrayLike) -> QuadratureResult:
+        """
+        Integrate the vectorised function f over the box [a_1, b_1] x ... x [a_d, b_d].
+
+        Args:
+            f (Callable): Function of an (n x d) array of points, one per row, returning n values. It may return
+                an array whose last axis runs over the points, in which case the value of the result is an
+                array of integrals.
+            a (ArrayLike): Lower limits, one per dimension
+            b (ArrayLike): Upper limits, one per dimension. Infinite limits may be used with rules that
+                support them, e.g. GaussHermiteRule over (-inf, inf).
+
+        Returns:
+            QuadratureResult: (value, error, evaluations, converged)
+        """
+        a, b = (np.atleast_1d(np.asarray(limit, dtype=float)) for limit in (a, b))
+        if a.ndim != 1 or a.shape != b.shape:
+            raise ValueError("Limits a and b must be one-dimensional arrays of the same length.")
+
+        seen_keys, seen_values = np.empty(0, dtype=_row_dtype(a.size)), None
+        estimate, error, evaluations = None, np.inf, 0
+        for level in range(max(1, self.min_level - 1), self.max_level + 1):
+            if estimate is not None and evaluations + _grid_size(self.rule, a.size, level) > self.max_evaluations:
+                break
+            points, weights = self.points_and_weights(a, b, level)
+            keys = _row_keys(points)
+            new = ~np.isin(keys, seen_keys)
+            new_values = np.asarray(f(points[new]), dtype=float)
+            if new_values.ndim == 0:
+                new_values = np.full(int(new.sum()), float(new_values))
+            evaluations += int(new.sum())
+
+            # Merge the new values into the sorted table of evaluated points, and look up this level's values
+            keys = np.concatenate((seen_keys, keys[new]))
+            values = new_values if seen_values is None else np.concatenate((seen_values, new_values), axis=-1)
+            order = np.argsort(keys)
+            seen_keys, seen_values = keys[order], values[..., order]
+            level_values = seen_values[..., np.searchsorted(seen_keys, _row_keys(points))]
+
+            previous, estimate = estimate, level_values @ weights
+            if previous is not None:
+                error = float(np.max(np.abs(estimate - previous)))
+                tolerance = max(self.abs_tol, self.rel_tol * float(np.max(np.abs(estimate))))
+                if level >= self.min_level and error <= tolerance:
+                    return QuadratureResult(_to_float(estimate), error, evaluations, True)
+        return QuadratureResult(_to_float(estimate), error, evaluations, False)
+
+    def expect_normal(self, f: Callable, mean: ArrayLike, cov: ArrayLike) -> QuadratureResult:
+        """
+        E[f(X)] for X ~ N(mean, cov), using a Gauss-Hermite rule family.
+
+        With cov = L L^T, X = mean + sqrt(2) * L z, and the expectation is the integral of
+        f(mean + sqrt(2) * L z) * exp(-|z|^2) / pi^(d / 2) over R^d.
+        """
+        if not isinstance(self.rule(1), GaussHermiteRule):
+            raise ValueError("Normal expectations require the GaussHermiteRule family.")
+        mean, factor = _normal_factor(mean, cov)
+        d = mean.size
+        g = lambda z: f(mean + sqrt(2) * z @ factor.T) / pi ** (d / 2)
+        return self.integrate(g, np.full(d, -np.inf), np.full(d, np.inf))
+
+    def points_and_weights(self, a: ArrayLike, b: ArrayLike, level: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The distinct points (one per row) and combined weights of the level sparse grid on the box [a, b]
+        """
+        a, b = (np.atleast_1d(np.asarray(limit, dtype=float)) for limit in (a, b))
+        d = a.size
+        q = level + d - 1
+        # One-dimensional nodes and weights per dimension and level
+        tables = [[self.rule(i).nodes_and_weights(a[k], b[k]) for i in range(1, level + 1)] for k in range(d)]
+
+        points, weights = [], []
+        for index in _multi_indices(d, q):
+            coefficient = (-1) ** (q - sum(index)) * comb(d - 1, q - sum(index))
+            grid_points, grid_weights = _tensor_product([tables[k][i - 1] for k, i in enumerate(index)])
+            points.append(grid_points)
+            weights.append(coefficient * grid_weights)
+        points, weights = np.concatenate(points), np.concatenate(weights)
+
+        # Merge repeated points, which come from the same one-dimensional nodes and so are bitwise equal
+        _, first, inverse = np.unique(_row_keys(points), return_index=True, return_inverse=True)
+        return points[first], np.bincount(inverse.ravel(), weights=weights)
+
+
+def _tensor_product(factors: list[tuple[np.ndarray, np.ndarray]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The points (one per row) and weights of the tensor product of one-dimensional (nodes, weights) pairs
+    """
+    total = int(np.prod([len(nodes) for nodes, _ in factors]))
+    points, weights = np.empty((total, len(factors))), np.ones(total)
+    repeat = total
+    for k, (nodes, node_weights) in enumerate(factors):
+        repeat //= len(nodes)
+        if len(nodes) == 1:
+            # Most factors of a high-dimensional sparse grid are one-point rules
+            points[:, k] = nodes[0]
+            weights *= node_weights[0]
+        else:
+            position = np.arange(total) // repeat % len(nodes)
+            points[:, k] = nodes[position]
+            weights *= node_weights[position]
+    return points, weights
+
+
+def _multi_indices(d: int, q: int):
+    """
+    Multi-indices i with i_k >= 1 and max(d, q - d + 1) <= |i| <= q
+    """
+    if d == 1:
+        yield (q,)
+        return
+    for first in range(1, q - d + 2):
+        for rest in _all_multi_indices(d - 1, q - first):
+            if sum(rest) + first >= q - d + 1:
+                yield (first,) + rest
+
+
+def _all_multi_indices(d: int, total: int):
+    """
+    All multi-indices i with i_k >= 1 and |i| <= total
+    """
+    if d == 1:
+        yield from ((i,) for i in range(1, total + 1))
+        return
+    for first in range(1, total - d + 2):
+        for rest in _all_multi_indices(d - 1, total - first):
+            yield (first,) + rest
+
+
+def _grid_size(rule: Callable[[int], QuadratureRule], d: int, level: int) -> int:
+    """
+    Number of points of the level sparse grid before repeated points are merged, an upper bound on its size
+    """
+    sizes = [len(rule(i).nodes) for i in range(1, level + 1)]
+    return sum(int(np.prod([sizes[i - 1] for i in index])) for index in _multi_indices(d, level + d - 1))
+
+
+def _normal_factor(mean: ArrayLike, cov: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The mean vector and lower triangular Cholesky factor L of cov = L L^T
+    """
+    mean = np.atleast_1d(np.asarray(mean, dtype=float))
+    cov = np.atleast_2d(np.asarray(cov, dtype=float))
+    if mean.ndim != 1 or cov.shape != (mean.size, mean.size):
+        raise ValueError("Covariance must be a square matrix matching the length of the mean.")
+    try:
+        return mean, np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        raise ValueError("Covariance must be symmetric positive definite.") from None
+
+
+def _row_dtype(d: int) -> np.dtype:
+    return np.dtype((np.void, 8 * d))
+
+
+def _row_keys(points: np.ndarray) -> np.ndarray:
+    """
+    One opaque key per row of a float array, for exact matching of points
+    """
+    # Adding zero maps -0.0 to 0.0, so the two compare equal as bytes
+    return np.ascontiguousarray(points + 0.0).view(_row_dtype(points.shape[1])).ravel()
+
+
+def _to_float(value: np.ndarray) -> float | np.ndarray:
+    return float(value) if np.ndim(value) == 0 else value
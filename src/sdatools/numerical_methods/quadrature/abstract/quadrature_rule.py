@@ -1,10 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import Callable
+import numpy as np
+
+from sdatools.core.types import ArrayLike
 
 
 class QuadratureRule(ABC):
     """
     Abstract base class for quadrature rules
+
+    A rule is defined by its nodes and weights on the reference interval [-1, 1]. These are mapped onto [a, b]
+    by nodes_and_weights(a, b), and integrate(f, a, b) evaluates f once, on the whole array of nodes.
+
+    Rules for weighted integrals over infinite intervals (e.g. Gauss-Hermite) define their nodes on their own
+    interval and override nodes_and_weights.
     """
     @property
     @abstractmethod
@@ -21,7 +30,93 @@ class QuadratureRule(ABC):
         The maximum order of polynomials for which the quadrature rule is exact 
         """
         pass
-    
+
+    @property
     @abstractmethod
-    def integrate(self, f: Callable, a: float, b: float) -> float:
+    def nodes(self) -> np.ndarray:
+        """
+        The nodes of the rule on the reference interval [-1, 1], in increasing order
+        """
         pass
+
+    @property
+    @abstractmethod
+    def weights(self) -> np.ndarray:
+        """
+        The weights of the rule on the reference interval [-1, 1]
+        """
+        pass
+
+    def nodes_and_weights(self, a: float | np.ndarray, b: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The nodes and weights of the rule mapped onto [a, b]
+
+        a and b may be arrays of shape (P, 1), giving (P, n) arrays of nodes and weights for P intervals.
+        """
+        half_width = (b - a) / 2
+        return a + half_width * (self.nodes + 1), half_width * self.weights
+
+    def integrate(self, f: Callable, a: float, b: float) -> float | np.ndarray:
+        """
+        Approximate the integral of f over [a, b] by sum(w_i * f(x_i)).
+
+        f is called once with the array of nodes, so must be vectorised. It may return an array whose last
+        axis runs over the nodes, in which case an array of integrals is returned.
+        """
+        x, w = self.nodes_and_weights(a, b)
+        return _weighted_sum(f(x), w)
+
+    def integrate_batch(self, f: Callable, a: ArrayLike, b: ArrayLike, *params: ArrayLike) -> np.ndarray:
+        """
+        Approximate the integrals of f(x, *params) over [a, b] for many problems at once.
+
+        a, b and each of params are broadcast together to the shape of the batch of problems. A (problems x nodes)
+        matrix of nodes is built, with each parameter as a (problems x 1) column, and f is called once on it, so
+        f must broadcast over its arguments. The integrals are then the weighted sums along each row.
+
+        For example, rule.integrate_batch(lambda x, s: np.exp(-s * x), 0.0, 1.0, np.linspace(0.1, 10, 1000))
+        returns the 1000 integrals of exp(-s x) over [0, 1].
+        """
+        arrays = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                     *(np.asarray(p) for p in params))
+        shape = arrays[0].shape
+        a, b, *params = (array.reshape(-1, 1) for array in arrays)
+        x, w = self.nodes_and_weights(a, b)
+        x = np.broadcast_to(x, (a.shape[0], x.shape[-1]))
+        values = np.broadcast_to(np.asarray(f(x, *params), dtype=float), x.shape)
+        return np.sum(values * w, axis=-1).reshape(shape)
+
+    def integrate_cumulative(self, f: Callable, x: ArrayLike) -> np.ndarray:
+        """
+        Approximate the integrals of f from x[0] to each x[i], for an increasing grid x.
+
+        The rule is applied to every cell [x[i], x[i + 1]] in one batch, and the cell integrals are accumulated,
+        so each integral reuses the partial sum up to the previous grid point. For rules with nodes at both ends
+        of the interval, the grid points are evaluated once rather than once per adjacent cell. For example,
+        rule.integrate_cumulative(dist.pdf, grid) is a numeric cdf on the grid, with one call of the pdf.
+        """
+        x = np.asarray(x, dtype=float)
+        if x.ndim != 1 or x.size < 2:
+            raise ValueError("Grid must be a one-dimensional array of at least two points.")
+        lo, hi = x[:-1, None], x[1:, None]
+        t, w = self.nodes_and_weights(lo, hi)
+        if self.nodes[0] == -1 and self.nodes[-1] == 1:
+            # Evaluate the grid points and the interior nodes of every cell in a single call
+            interior = t[:, 1:-1]
+            values = np.asarray(f(np.concatenate((x, interior.ravel()))), dtype=float)
+            grid_values, interior_values = values[:x.size], values[x.size:].reshape(interior.shape)
+            cells = w[:, 0] * grid_values[:-1] + w[:, -1] * grid_values[1:] + np.sum(w[:, 1:-1] * interior_values, axis=-1)
+        else:
+            cells = np.sum(np.asarray(f(t), dtype=float) * w, axis=-1)
+        return np.concatenate(([0.0], np.cumsum(cells)))
+
+
+def _weighted_sum(values, weights: np.ndarray) -> float | np.ndarray:
+    """
+    sum(w_i * f_i) over the last axis of values, broadcasting a constant f.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 0:
+        return float(values * weights.sum())
+    result = values @ weights
+    return float(result) if np.ndim(result) == 0 else result
@@ -0,0 +1,179 @@
+from functools import lru_cache
+from math import isfinite, pi
+from typing import Callable
+import numpy as np
+
+from sdatools.numerical_methods.quadrature.quadrature_engine import QuadratureResult
+
+
+# Ranges of t covered by each transform, chosen so that the nodes reach within about 1e-300 of a finite limit
+# (where singular integrands need them) and out to about 1e30 scale units towards an infinite limit
+T_RANGES: dict[str, tuple[float, float]] = {
+    "tanh-sinh": (-6.1, 6.1),
+    "exp-sinh": (-6.7, 4.5),
+    "sinh-sinh": (-4.5, 4.5),
+}
+
+# Nodes closer than this (relative to the half width, or the scale) to a finite limit, or further than its
+# reciprocal (in scale units) towards an infinite limit, are outer nodes: their weight in the integral is
+# negligible, so non-finite integrand values there (rounding onto a singular limit, overflow far out in a tail)
+# are dropped
+OUTER_NODE_DISTANCE: float = 1e-15
+
+
+class DoubleExponentialIntegrator:
+    """
+    Double-exponential quadrature: the trapezium rule in t after a transform x(t) whose derivative decays
+    double-exponentially, chosen by the limits of integration:
+
+    - [a, b]      : tanh-sinh, x = (a + b) / 2 + (b - a) / 2 * tanh(pi / 2 * sinh(t))
+    - [a, inf)    : exp-sinh,  x = a + s * exp(pi / 2 * sinh(t))
+    - (-inf, b]   : exp-sinh,  x = b - s * exp(pi / 2 * sinh(t))
+    - (-inf, inf) : sinh-sinh, x = c + s * sinh(pi / 2 * sinh(t))
+
+    with centre c and scale s. The transformed integrand decays so fast that the trapezium rule converges
+    exponentially in the number of nodes, even for integrable singularities at a finite limit (e.g. the Gamma
+    pdf with shape below one) and for slowly decaying tails, with no truncation of the domain.
+
+    Level k uses the step h = 2^-k. Each level evaluates f only at the new nodes, the odd multiples of h, in a
+    single vectorised call, and halves the previous trapezium sum. Integration stops once successive levels
+    agree to within max(abs_tol, rel_tol * |I|), or after max_levels. Near a finite limit, nodes are placed
+    using the distance to the limit, so they resolve the region next to it (down to rounding of x itself).
+    Non-finite values of the integrand at the outer nodes (see OUTER_NODE_DISTANCE), e.g. where a node rounds
+    onto a singular limit or the integrand overflows far out in a tail, are treated as zero, as their weights
+    are negligible. A non-finite value at any other node stops the integration with a non-finite value and
+    converged=False. Check converged on the result: a divergent integral also shows up there, as its partial
+    sums keep growing from level to level.
+
+    Node tables are cached per transform and level.
+    """
+    def __init__(self,
+                 abs_tol: float = 1e-12,
+                 rel_tol: float = 1e-12,
+                 min_levels: int = 2,
+                 max_levels: int = 8):
+        if abs_tol < 0 or rel_tol < 0:
+            raise ValueError("Tolerances must be non-negative.")
+        if not 0 <= min_levels <= max_levels:
+            raise ValueError("Levels must satisfy 0 <= min_levels <= max_levels.")
+        self.abs_tol = abs_tol
+        self.rel_tol = rel_tol
+        self.min_levels = min_levels
+        self.max_levels = max_levels
+
+    def integrate(self, f: Callable, a: float, b: float, centre: float = 0.0, scale: float = 1.0) -> QuadratureResult:
+        """
+        Integrate the vectorised function f over [a, b], where either limit may be infinite.
+
+        Args:
+            f (Callable): Function of an array of points. It may return an array whose last axis runs over the
+                points, in which case the value of the result is an array of integrals.
+            a (float): Lower limit of integration
+            b (float): Upper limit of integration
+            centre (float): Centre c of the sinh-sinh transform, used if both limits are infinite
+            scale (float): Scale s of the exp-sinh and sinh-sinh transforms, used if a limit is infinite. The
+                nodes are most dense within a few multiples of s of the finite limit (or of c).
+
+        Returns:
+            QuadratureResult: (value, error, evaluations, converged)
+        """
+        if a == b:
+            return QuadratureResult(0.0, 0.0, 0, True)
+        if a > b:
+            value, error, evaluations, converged = self.integrate(f, b, a, centre, scale)
+            return QuadratureResult(-value, error, evaluations, converged)
+        if scale <= 0:
+            raise ValueError("Scale must be positive.")
+        transform = _transform(a, b, centre, scale)
+
+        total, estimate, error, evaluations = 0.0, None, np.inf, 0
+        for level in range(self.max_levels + 1):
+            x, w, outer = transform(level)
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                values = np.asarray(f(x), dtype=float)
+                terms = values * w if values.ndim else np.full_like(w, float(values)) * w
+            finite = np.isfinite(terms)
+            evaluations += x.size
+            if not np.all(finite | outer):
+                with np.errstate(invalid='ignore'):
+                    estimate = (total + np.sum(terms, axis=-1)) * 2.0 ** -level
+                return QuadratureResult(_to_float(estimate), np.inf, evaluations, False)
+            total = total + np.sum(np.where(finite, terms, 0.0), axis=-1)
+            previous, estimate = estimate, total * 2.0 ** -level
+            if previous is not None:
+                error = float(np.max(np.abs(estimate - previous)))
+                tolerance = max(self.abs_tol, self.rel_tol * float(np.max(np.abs(estimate))))
+                if level >= self.min_levels and error <= tolerance:
+                    return QuadratureResult(_to_float(estimate), error, evaluations, True)
+        return QuadratureResult(_to_float(estimate), error, evaluations, False)
+
+
+def _transform(a: float, b: float, centre: float, scale: float) -> Callable[[int], tuple[np.ndarray, ...]]:
+    """
+    The nodes x, weights w (including the Jacobian dx/dt) and outer-node mask of the new points at a given
+    level, for [a, b]
+    """
+    if isfinite(a) and isfinite(b):
+        half_width, midpoint = (b - a) / 2, (a + b) / 2
+        def tanh_sinh(level: int) -> tuple[np.ndarray, ...]:
+            t, distance, w, outer = _tanh_sinh_table(level)
+            # distance = 1 - |tanh(u)| is accurate near the limits, where 1 - tanh(u) would round to zero
+            x = np.where(t < 0, a + half_width * distance, np.where(t > 0, b - half_width * distance, midpoint))
+            return x, half_width * w, outer
+        return tanh_sinh
+    if isfinite(a):
+        return lambda level: (a + scale * _exp_sinh_table(level)[0], scale * _exp_sinh_table(level)[1],
+                              _exp_sinh_table(level)[2])
+    if isfinite(b):
+        return lambda level: (b - scale * _exp_sinh_table(level)[0], scale * _exp_sinh_table(level)[1],
+                              _exp_sinh_table(level)[2])
+    return lambda level: (centre + scale * _sinh_sinh_table(level)[0], scale * _sinh_sinh_table(level)[1],
+                          _sinh_sinh_table(level)[2])
+
+
+def _new_points(kind: str, level: int) -> np.ndarray:
+    """
+    The values of t first used at a given level: the integers at level 0, and odd multiples of 2^-level after
+    """
+    t_min, t_max = T_RANGES[kind]
+    if level == 0:
+        return np.arange(np.ceil(t_min), np.floor(t_max) + 1)
+    h = 2.0 ** -level
+    k = np.arange(np.ceil((t_min / h - 1) / 2), np.floor((t_max / h - 1) / 2) + 1)
+    return (2 * k + 1) * h
+
+
+@lru_cache(maxsize=None)
+def _tanh_sinh_table(level: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    t = _new_points("tanh-sinh", level)
+    u = pi / 2 * np.sinh(t)
+    with np.errstate(over='ignore'):
+        distance = 2 / (np.exp(2 * np.abs(u)) + 1)
+        weight = pi / 2 * np.cosh(t) / np.cosh(u) ** 2
+    return _read_only(t, distance, weight, distance < OUTER_NODE_DISTANCE)
+
+
+@lru_cache(maxsize=None)
+def _exp_sinh_table(level: int) -> tuple[np.ndarray, np.ndarray]:
+    t = _new_points("exp-sinh", level)
+    e = np.exp(pi / 2 * np.sinh(t))
+    outer = (e < OUTER_NODE_DISTANCE) | (e > 1 / OUTER_NODE_DISTANCE)
+    return _read_only(e, pi / 2 * np.cosh(t) * e, outer)
+
+
+@lru_cache(maxsize=None)
+def _sinh_sinh_table(level: int) -> tuple[np.ndarray, np.ndarray]:
+    t = _new_points("sinh-sinh", level)
+    u = pi / 2 * np.sinh(t)
+    x = np.sinh(u)
+    return _read_only(x, pi / 2 * np.cosh(t) * np.cosh(u), np.abs(x) > 1 / OUTER_NODE_DISTANCE)
+
+
+def _read_only(*arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+def _to_float(value: np.ndarray) -> float | np.ndarray:
+    return float(value) if np.ndim(value) == 0 else value
@@ -1,6 +1,6 @@
 from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule
 
-from typing import Callable
+import numpy as np
 
 
 class BooleRule(QuadratureRule):
@@ -16,7 +16,11 @@ class BooleRule(QuadratureRule):
     @property
     def exact_order(self) -> int:
         return 5
-    
-    def integrate(self, f: Callable, a: float, b: float) -> float:
-        h = (b - a) / 4
-        return 2 * h / 45 * (7 * f(a) + 32 * f(a + h) + 12 * f(a + 2 * h) + 32 * f(a + 3 * h) + 7 * f(b))
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return np.array([-1.0, -0.5, 0.0, 0.5, 1.0])
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.array([7.0, 32.0, 12.0, 32.0, 7.0]) / 45
@@ -1,11 +1,16 @@
 from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule
 
-from typing import Callable
+import numpy as np
 
 
 class CompositeRule(QuadratureRule):
     """
     Composite quadrature rule that applies a specified quadrature rule over multiple subintervals
+
+    The nodes of all subintervals are assembled into one array, so the integrand is evaluated in a single
+    vectorised call. For closed rules (with nodes at both ends of the interval), the endpoint shared by
+    neighbouring subintervals is evaluated once and carries the sum of both weights, e.g. a composite Simpson
+    rule over n subintervals uses 2n + 1 nodes rather than 3n.
     """
     def __init__(self, rule: QuadratureRule, num_subintervals: int):
         self.rule = rule
@@ -20,14 +25,26 @@ class CompositeRule(QuadratureRule):
     @property
     def exact_order(self) -> int:
         return self.rule.exact_order
-    
-    def integrate(self, f: Callable, a: float, b: float) -> float:
-        subinterval_width = (b - a) / self.num_subintervals
-        integral = 0.0
-        x_lower = a
-        for _ in range(self.num_subintervals):
-            x_upper = x_lower + subinterval_width
-            integral += self.rule.integrate(f, x_lower, x_upper)
-            x_lower = x_upper
-        return integral
-    
\ No newline at end of file
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return self._reference_nodes_and_weights()[0]
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._reference_nodes_and_weights()[1]
+
+    def _reference_nodes_and_weights(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The nodes and weights of all subintervals of [-1, 1], with shared endpoints merged for closed rules
+        """
+        n = self.num_subintervals
+        t, w = self.rule.nodes, self.rule.weights
+        # Row i holds the nodes and weights of subinterval i
+        x = -1 + 2 / n * (np.arange(n)[:, None] + (t + 1) / 2)
+        weights = np.tile(w / n, (n, 1))
+        if n == 1 or t[0] != -1 or t[-1] != 1:
+            return x.ravel(), weights.ravel()
+        # Merge the last node of each subinterval into the first node of the next
+        weights[1:, 0] += weights[:-1, -1]
+        return np.append(x[:, :-1].ravel(), 1.0), np.append(weights[:, :-1].ravel(), weights[-1, -1])
@@ -0,0 +1,56 @@
+from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule
+
+import numpy as np
+
+
+# Positive nodes and weights of the 15-point Kronrod rule and its embedded 7-point Gauss rule (QUADPACK qk15)
+_KRONROD_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0,
+])
+_KRONROD_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+])
+_GAUSS_WEIGHTS = np.array([
+    0.0, 0.129484966168869693270611432679082,
+    0.0, 0.279705391489276667901467771423780,
+    0.0, 0.381830050505118944950369775488975,
+    0.0, 0.417959183673469387755102040816327,
+])
+
+
+class GaussKronrodRule(QuadratureRule):
+    """
+    15-point Gauss-Kronrod quadrature rule
+
+    The Kronrod nodes extend the 7-point Gauss-Legendre rule, so the difference between the two estimates,
+    which share 7 function evaluations, gives an error estimate at no extra cost. The approximation is exact
+    for polynomials of degree 22.
+    """
+    @property
+    def order(self) -> int:
+        return 14
+
+    @property
+    def exact_order(self) -> int:
+        return 22
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return np.concatenate((-_KRONROD_NODES, _KRONROD_NODES[-2::-1]))
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.concatenate((_KRONROD_WEIGHTS, _KRONROD_WEIGHTS[-2::-1]))
+
+    @property
+    def gauss_weights(self) -> np.ndarray:
+        """
+        The weights of the embedded 7-point Gauss rule, aligned with nodes (zero at the Kronrod-only nodes)
+        """
+        return np.concatenate((_GAUSS_WEIGHTS, _GAUSS_WEIGHTS[-2::-1]))
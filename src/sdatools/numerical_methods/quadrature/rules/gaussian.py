@@ -0,0 +1,227 @@
+from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule, _weighted_sum
+
+from functools import lru_cache
+from math import gamma, pi, sqrt
+from typing import Callable
+import numpy as np
+from scipy.linalg import eigh_tridiagonal
+
+
+class GaussLegendreRule(QuadratureRule):
+    """
+    n-point Gauss-Legendre quadrature rule
+
+    The approximation is exact for polynomials of degree 2n - 1
+    """
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError("Number of nodes must be at least 1.")
+        self.n = n
+
+    @property
+    def order(self) -> int:
+        return self.n - 1
+
+    @property
+    def exact_order(self) -> int:
+        return 2 * self.n - 1
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return _gauss_legendre(self.n)[0]
+
+    @property
+    def weights(self) -> np.ndarray:
+        return _gauss_legendre(self.n)[1]
+
+
+class GaussHermiteRule(QuadratureRule):
+    """
+    n-point Gauss-Hermite quadrature rule, for integrals over the real line against the weight exp(-x^2)
+
+    integrate(f, -inf, inf) approximates ∫ f(x) exp(-x^2) dx, exactly for polynomials f of degree 2n - 1,
+    and expect(f, mu, sigma) approximates E[f(X)] for X ~ N(mu, sigma^2).
+    """
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError("Number of nodes must be at least 1.")
+        self.n = n
+
+    @property
+    def order(self) -> int:
+        return self.n - 1
+
+    @property
+    def exact_order(self) -> int:
+        return 2 * self.n - 1
+
+    @property
+    def nodes(self) -> np.ndarray:
+        """
+        The nodes of the rule on the real line
+        """
+        return _gauss_hermite(self.n)[0]
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        The weights of the rule for the weight function exp(-x^2)
+        """
+        return _gauss_hermite(self.n)[1]
+
+    def nodes_and_weights(self, a: float | np.ndarray, b: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if not (np.all(np.isneginf(a)) and np.all(np.isposinf(b))):
+            raise ValueError("Gauss-Hermite quadrature integrates over (-inf, inf).")
+        return self.nodes, self.weights
+
+    def expect(self, f: Callable, mu: float = 0.0, sigma: float = 1.0) -> float | np.ndarray:
+        """
+        E[f(X)] for X ~ N(mu, sigma^2), i.e. sum(w_i * f(mu + sqrt(2) * sigma * x_i)) / sqrt(pi)
+        """
+        return _weighted_sum(f(mu + sqrt(2) * sigma * self.nodes), self.weights / sqrt(pi))
+
+
+class GaussLaguerreRule(QuadratureRule):
+    """
+    n-point generalised Gauss-Laguerre quadrature rule, for integrals over [a, inf) against the weight
+    (x - a)^alpha * exp(-(x - a)), alpha > -1
+
+    integrate(f, a, inf) approximates ∫ f(x) (x - a)^alpha exp(-(x - a)) dx, exactly for polynomials f of
+    degree 2n - 1, and expect(f, scale) approximates E[f(X)] for X ~ Gamma(alpha + 1, scale).
+    """
+    def __init__(self, n: int, alpha: float = 0.0):
+        if n < 1:
+            raise ValueError("Number of nodes must be at least 1.")
+        if alpha <= -1:
+            raise ValueError("Exponent alpha must be greater than -1.")
+        self.n = n
+        self.alpha = alpha
+
+    @property
+    def order(self) -> int:
+        return self.n - 1
+
+    @property
+    def exact_order(self) -> int:
+        return 2 * self.n - 1
+
+    @property
+    def nodes(self) -> np.ndarray:
+        """
+        The nodes of the rule on [0, inf)
+        """
+        return _gauss_laguerre(self.n, float(self.alpha), normalised=True)[0]
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        The weights of the rule for the weight function x^alpha * exp(-x)
+        """
+        return _gauss_laguerre(self.n, float(self.alpha))[1]
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        """
+        The weights divided by Gamma(alpha + 1), for the Gamma(alpha + 1, 1) density. These sum to one and are
+        computed directly, so they stay finite for large alpha, where Gamma(alpha + 1) overflows.
+        """
+        return _gauss_laguerre(self.n, float(self.alpha), normalised=True)[1]
+
+    def nodes_and_weights(self, a: float | np.ndarray, b: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if not (np.all(np.isfinite(a)) and np.all(np.isposinf(b))):
+            raise ValueError("Gauss-Laguerre quadrature integrates over [a, inf) for finite a.")
+        return a + self.nodes, self.weights
+
+    def expect(self, f: Callable, scale: float = 1.0) -> float | np.ndarray:
+        """
+        E[f(X)] for X ~ Gamma(alpha + 1, scale), i.e. sum(w_i * f(scale * x_i)) / Gamma(alpha + 1)
+        """
+        return _weighted_sum(f(scale * self.nodes), self.probabilities)
+
+
+# Nodes and weights, by the Golub-Welsch algorithm: the nodes are the eigenvalues of the symmetric tridiagonal
+# Jacobi matrix of the three-term recurrence of the orthonormal polynomials p_k. Results are cached per order
+# and returned read-only.
+
+def _golub_welsch(diagonal: np.ndarray, off_diagonal: np.ndarray, mu_0: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Nodes and weights for the Jacobi matrix with the given diagonal and off-diagonal, where mu_0 is the integral
+    of the weight function.
+
+    The Golub-Welsch weights, mu_0 times the squared first components of the eigenvectors, are only accurate
+    relative to the largest weight, and the smallest weights of e.g. a 100-point Gauss-Hermite rule are lost
+    entirely. The weights are therefore recomputed from the Christoffel function, w_i = 1 / sum_k p_k(x_i)^2,
+    by running the recurrence at the nodes, which keeps the small weights accurate relative to themselves. The
+    eigenvector weights are kept wherever the recurrence overflows.
+    """
+    nodes, vectors = eigh_tridiagonal(diagonal, off_diagonal)
+    eigenvector_weights = mu_0 * vectors[0] ** 2
+    # One Newton step on p_n(x) = 0 polishes the eigenvalues, then the recurrence is rerun for the weights
+    p, dp, christoffel = _recurrence(nodes, diagonal, off_diagonal, mu_0)
+    with np.errstate(invalid='ignore'):
+        step = np.where(np.isfinite(p / dp), p / dp, 0.0)
+    nodes = nodes - step
+    christoffel = _recurrence(nodes, diagonal, off_diagonal, mu_0)[2]
+    weights = np.where(np.isfinite(christoffel), 1 / christoffel, eigenvector_weights)
+    return nodes, weights
+
+
+def _recurrence(x: np.ndarray, diagonal: np.ndarray, off_diagonal: np.ndarray, mu_0: float) -> tuple[np.ndarray, ...]:
+    """
+    p_n(x), p_n'(x) and sum_{k < n} p_k(x)^2 from x p_k = b_{k+1} p_{k+1} + a_k p_k + b_k p_{k-1}, where a and
+    b are the diagonal and off-diagonal of the Jacobi matrix and p_{-1} = 0, p_0 = 1 / sqrt(mu_0).
+
+    p_n is taken with b_n = 1, since only its zeros are needed.
+    """
+    n = len(diagonal)
+    p_previous, p = np.zeros_like(x), np.full_like(x, 1 / sqrt(mu_0))
+    dp_previous, dp = np.zeros_like(x), np.zeros_like(x)
+    christoffel = p * p
+    with np.errstate(over='ignore', invalid='ignore'):
+        for k in range(n):
+            b_k = off_diagonal[k - 1] if k > 0 else 0.0
+            b_next = off_diagonal[k] if k < n - 1 else 1.0
+            p_previous, p, dp_previous, dp = (
+                p,
+                ((x - diagonal[k]) * p - b_k * p_previous) / b_next,
+                dp,
+                ((x - diagonal[k]) * dp + p - b_k * dp_previous) / b_next,
+            )
+            if k < n - 1:
+                christoffel += p * p
+    return p, dp, christoffel
+
+
+def _symmetrise(nodes: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Enforce the symmetry of nodes and weights about zero, for weight functions that are even
+    """
+    return 0.5 * (nodes - nodes[::-1]), 0.5 * (weights + weights[::-1])
+
+
+def _read_only(*arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=None)
+def _gauss_legendre(n: int) -> tuple[np.ndarray, np.ndarray]:
+    k = np.arange(1, n)
+    nodes, weights = _golub_welsch(np.zeros(n), k / np.sqrt(4.0 * k * k - 1), 2.0)
+    return _read_only(*_symmetrise(nodes, weights))
+
+
+@lru_cache(maxsize=None)
+def _gauss_hermite(n: int) -> tuple[np.ndarray, np.ndarray]:
+    nodes, weights = _golub_welsch(np.zeros(n), np.sqrt(np.arange(1, n) / 2), sqrt(pi))
+    return _read_only(*_symmetrise(nodes, weights))
+
+
+@lru_cache(maxsize=None)
+def _gauss_laguerre(n: int, alpha: float, normalised: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    # The weights scale with mu_0 = Gamma(alpha + 1), so normalised weights are found with mu_0 = 1
+    k = np.arange(1, n)
+    mu_0 = 1.0 if normalised else gamma(alpha + 1)
+    nodes, weights = _golub_welsch(2.0 * np.arange(n) + alpha + 1, np.sqrt(k * (k + alpha)), mu_0)
+    return _read_only(nodes, weights)
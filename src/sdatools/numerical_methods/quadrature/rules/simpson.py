@@ -1,6 +1,6 @@
 from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule
 
-from typing import Callable
+import numpy as np
 
 
 class SimpsonRule(QuadratureRule):
@@ -16,10 +16,14 @@ class SimpsonRule(QuadratureRule):
     @property
     def exact_order(self) -> int:
         return 3
-    
-    def integrate(self, f: Callable, a: float, b: float) -> float:
-        h = (b - a) / 2
-        return h / 3 * (f(a) + 4 * f((a + b) / 2) + f(b))
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return np.array([-1.0, 0.0, 1.0])
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.array([1.0, 4.0, 1.0]) / 3
 
 
 class Simpson38Rule(QuadratureRule):
@@ -35,7 +39,11 @@ class Simpson38Rule(QuadratureRule):
     @property
     def exact_order(self) -> int:
         return 3
-    
-    def integrate(self, f: Callable, a: float, b: float) -> float:
-        h = (b - a) / 3
-        return 3 * h / 8 * (f(a) + 3 * f(a + h) + 3 * f(a + 2 * h) + f(b))
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return np.array([-1.0, -1 / 3, 1 / 3, 1.0])
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.array([1.0, 3.0, 3.0, 1.0]) / 4
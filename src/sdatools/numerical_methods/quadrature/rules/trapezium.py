@@ -1,6 +1,6 @@
 from sdatools.numerical_methods.quadrature.abstract.quadrature_rule import QuadratureRule
 
-from typing import Callable
+import numpy as np
 
 
 class TrapeziumRule(QuadratureRule):
@@ -16,7 +16,11 @@ class TrapeziumRule(QuadratureRule):
     @property
     def exact_order(self) -> int:
         return 1
-    
-    def integrate(self, f: Callable, a: float, b: float) -> float:
-        return (b - a) / 2 * (f(a) + f(b))
-    
\ No newline at end of file
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return np.array([-1.0, 1.0])
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.array([1.0, 1.0])
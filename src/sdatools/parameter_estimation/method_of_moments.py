@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from sdatools.distributions.continuous.exponential import ExponentialDistribution
     from sdatools.distributions.continuous.lognormal import LogNormalDistribution
     from sdatools.distributions.continuous.skewnormal import SkewNormalDistribution
+    from sdatools.distributions.continuous.beta import BetaDistribution
 
 T = TypeVar("T", bound=Distribution)
 
@@ -40,7 +41,8 @@ class MethodOfMoments:
             "GammaDistribution": self._fit_gamma,
             "ExponentialDistribution": self._fit_exponential,
             "LogNormalDistribution": self._fit_lognormal,
-            "SkewNormalDistribution": self._fit_skew_normal
+            "SkewNormalDistribution": self._fit_skew_normal,
+            "BetaDistribution": self._fit_beta
         }
 
 
@@ -87,6 +89,7 @@ class MethodOfMoments:
                 - ExponentialDistribution
                 - LogNormalDistribution
                 - SkewNormalDistribution
+                - BetaDistribution
 
         Returns:
             T: A fitted instance of the same distribution type, with parameters estimated from the data.
@@ -134,4 +137,14 @@ class MethodOfMoments:
         omega = np.sqrt(self.sample_variance * (1 - 2 * delta**2 / np.pi))
         xi = self.sample_mean - (omega * np.sqrt(2 / np.pi) * alpha / np.sqrt(1 + alpha ** 2))
         return SkewNormalDistribution(xi=xi, omega=omega, alpha=alpha)
-    
\ No newline at end of file
+
+
+    def _fit_beta(self) -> BetaDistribution:
+        from sdatools.distributions.continuous.beta import BetaDistribution
+        if np.any((self._data < 0) | (self._data > 1)):
+            raise ValueError("Cannot fit a Beta distribution - data must lie in [0, 1].")
+        m, v = self.sample_mean, self.sample_variance
+        if v >= m * (1 - m):
+            raise ValueError("Cannot fit a Beta distribution - sample variance must be less than mean * (1 - mean).")
+        common = m * (1 - m) / v - 1
+        return BetaDistribution(alpha=m * common, beta=(1 - m) * common)
@@ -2,6 +2,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from math import sqrt, exp
 
+from sdatools.core.cache import evaluate
 from sdatools.core.types import SeriesLike
 from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
 
@@ -46,7 +47,7 @@ class KSTest:
             dist (type[Distribution] or Distribution): a distribution to compare against
         """ 
         empirical_cdf = self._empirical_cdf()
-        theoretical_cdf = np.array([dist.cdf(x) for x in self._data])
+        theoretical_cdf = evaluate(dist, "cdf", self._data)
 
         # Compute KS statistic
         self._ks_statistic = np.max(np.abs(empirical_cdf - theoretical_cdf))
@@ -64,7 +65,7 @@ class KSTest:
             print(f"KS test against {dist.__class__.__name__} FAILED")
             self._result = "FAIL"
 
-        self._plot_ks_test_result(dist, alpha)
+        self._plot_ks_test_result(dist, alpha, theoretical_cdf)
         
     
     def _empirical_cdf(self) -> np.ndarray:
@@ -86,6 +87,7 @@ class KSTest:
     def _plot_ks_test_result(self, 
             dist: ContinuousDistribution,
             alpha: float,
+            theoretical_cdf: np.ndarray,
             color_empirical: str = 'k',
             color_theoretical: str = 'b',
             linestyle: str = '-',
@@ -107,10 +109,9 @@ class KSTest:
         )
 
         # Theoretical CDF
-        theoretical_cdf_y_values = [dist.cdf(x) for x in empirical_cdf_x_values]
         self._ax.plot(
             empirical_cdf_x_values,
-            theoretical_cdf_y_values,
+            theoretical_cdf,
             color=color_theoretical,
             linestyle=linestyle,
             lw=lw,
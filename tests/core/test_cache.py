@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from sdatools.core.cache import EvaluationCache, evaluate
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+
+
+class CountingNormal(NormalDistribution):
+    calls = 0
+
+    def cdf(self, x):
+        CountingNormal.calls += 1
+        return super().cdf(x)
+
+
+def test_hits_and_misses():
+    cache = EvaluationCache()
+    dist = NormalDistribution(0, 1)
+    x = np.linspace(-3, 3, 101)
+    first = cache.evaluate(dist, "cdf", x)
+    second = cache.evaluate(NormalDistribution(0, 1), "cdf", x.copy())
+    assert np.array_equal(first, dist.cdf(x)) and np.array_equal(second, first)
+    cache.evaluate(dist, "pdf", x)
+    cache.evaluate(NormalDistribution(0, 2), "cdf", x)
+    cache.evaluate(dist, "cdf", x[:-1])
+    info = cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 4, 4)
+
+
+def test_cached_results_skip_evaluation():
+    cache = EvaluationCache()
+    dist = CountingNormal(0, 1)
+    x = np.linspace(-3, 3, 101)
+    CountingNormal.calls = 0
+    for _ in range(200):
+        cache.evaluate(dist, "cdf", x)
+    assert CountingNormal.calls == 1
+
+
+def test_results_are_read_only():
+    cache = EvaluationCache()
+    result = cache.evaluate(GammaDistribution(2.0, 1.0), "pdf", np.linspace(0, 5, 11))
+    with pytest.raises(ValueError):
+        result[0] = 1.0
+    # Modifying the input after the call does not affect the cached result
+    x = np.linspace(0, 5, 11)
+    y = cache.evaluate(NormalDistribution(), "pdf", x)
+    x[:] = 0
+    assert not np.array_equal(cache.evaluate(NormalDistribution(), "pdf", x), y)
+
+
+def test_memory_limit_evicts_least_recently_used():
+    x = np.linspace(-1, 1, 1000)  # 8000 bytes per result
+    cache = EvaluationCache(max_bytes=20000)
+    a, b, c = NormalDistribution(0, 1), NormalDistribution(0, 2), NormalDistribution(0, 3)
+    cache.evaluate(a, "cdf", x)
+    cache.evaluate(b, "cdf", x)
+    cache.evaluate(a, "cdf", x)  # a is now the most recently used
+    cache.evaluate(c, "cdf", x)  # evicts b
+    info = cache.info()
+    assert (info.entries, info.evictions, info.nbytes) == (2, 1, 16000)
+    cache.evaluate(a, "cdf", x)
+    cache.evaluate(b, "cdf", x)
+    assert cache.info().hits == 2 and cache.info().misses == 4
+
+    # Results larger than the limit are computed but not stored
+    cache.evaluate(a, "cdf", np.linspace(-1, 1, 5000))
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_context_manager_activates_cache():
+    x = np.linspace(-3, 3, 11)
+    dist = CountingNormal(0, 1)
+    CountingNormal.calls = 0
+    evaluate(dist, "cdf", x)
+    with EvaluationCache() as cache:
+        evaluate(dist, "cdf", x)
+        evaluate(dist, "cdf", x)
+    evaluate(dist, "cdf", x)
+    assert CountingNormal.calls == 3
+    assert cache.info().hits == 1
+
+
+def test_clear():
+    cache = EvaluationCache()
+    cache.evaluate(NormalDistribution(), "cdf", [0.0, 1.0])
+    cache.clear()
+    assert len(cache) == 0 and cache.info() == (0, 0, 0, 0, 0, cache.max_bytes)
+
+
+def test_invalid_memory_limit():
+    with pytest.raises(ValueError):
+        EvaluationCache(max_bytes=0)
@@ -0,0 +1,211 @@
+from math import isclose, log, sqrt
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.algebra.registry import add, affine, multiply, register_sum, _SUM_RULES
+from sdatools.distributions.continuous.affine import AffineDistribution
+from sdatools.distributions.continuous.convolution import ConvolutionDistribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.jsu import JohnsonSUDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.product import ProductDistribution
+from sdatools.distributions.continuous.skewnormal import SkewNormalDistribution
+from sdatools.distributions.continuous.uniform import UniformDistribution
+from sdatools.distributions.discrete.binomial import BinomialDistribution
+from sdatools.distributions.discrete.lattice import LatticeDistribution
+from sdatools.distributions.discrete.poisson import PoissonDistribution
+from sdatools.distributions.discrete.uniform import DiscreteUniformDistribution
+
+
+# Sums
+
+def test_exponential_plus_exponential_is_gamma():
+    result = ExponentialDistribution(2.0) + ExponentialDistribution(2.0)
+    assert result == GammaDistribution(2.0, 0.5)
+
+
+def test_gamma_plus_gamma_same_beta():
+    result = GammaDistribution(1.5, 2.0) + GammaDistribution(2.5, 2.0)
+    assert result == GammaDistribution(4.0, 2.0)
+
+
+def test_gamma_plus_exponential_matching_rate():
+    result = ExponentialDistribution(0.5) + GammaDistribution(3.0, 2.0)
+    assert result == GammaDistribution(4.0, 2.0)
+
+
+def test_poisson_plus_poisson():
+    assert PoissonDistribution(1.5) + PoissonDistribution(2.0) == PoissonDistribution(3.5)
+
+
+def test_binomial_plus_binomial_same_p():
+    assert BinomialDistribution(3, 0.2) + BinomialDistribution(7, 0.2) == BinomialDistribution(10, 0.2)
+
+
+def test_normal_plus_scalar():
+    assert 3 + NormalDistribution(1, 2) == NormalDistribution(4, 2)
+
+
+# Products
+
+def test_lognormal_times_lognormal():
+    result = LogNormalDistribution(0.5, 0.3) * LogNormalDistribution(-1.0, 0.4)
+    assert isclose(result.mu, -0.5)
+    assert isclose(result.sigma, 0.5)
+
+
+def test_product_without_rule_is_numeric():
+    z = GammaDistribution(2.0, 1.0) * GammaDistribution(3.0, 1.0)
+    assert isinstance(z, ProductDistribution)
+    assert z.mean == pytest.approx(6.0)
+    assert z.variance == pytest.approx(6.0 * 12.0 - 36.0)
+    rng = np.random.default_rng(0)
+    samples = stats.gamma(2.0).rvs(10 ** 6, random_state=rng) * stats.gamma(3.0).rvs(10 ** 6, random_state=rng)
+    grid = np.array([0.5, 2.0, 6.0, 15.0, 40.0])
+    assert np.allclose(z.cdf(grid), [np.mean(samples <= v) for v in grid], atol=2e-3)
+    p = np.array([0.1, 0.5, 0.9])
+    assert np.allclose(z.cdf(z.inverse_cdf(p)), p, atol=1e-9)
+
+
+def test_numeric_product_of_normals_matches_monte_carlo():
+    z = NormalDistribution(1.0, 1.0) * NormalDistribution(0.0, 2.0)
+    assert z.domain == [float('-inf'), float('inf')]
+    rng = np.random.default_rng(1)
+    samples = rng.normal(1.0, 1.0, 10 ** 6) * rng.normal(0.0, 2.0, 10 ** 6)
+    grid = np.array([-3.0, -0.5, 0.3, 2.0])
+    assert np.allclose(z.cdf(grid), [np.mean(samples <= v) for v in grid], atol=2e-3)
+    # Density against a finite difference of the cdf
+    assert np.allclose(z.pdf(grid), (z.cdf(grid + 1e-4) - z.cdf(grid - 1e-4)) / 2e-4, rtol=1e-4)
+
+
+def test_numeric_product_with_discrete_factor():
+    z = DiscreteUniformDistribution(1, 3) * NormalDistribution(0.0, 1.0)
+    assert isinstance(z, ProductDistribution)
+    assert z.cdf(0.5) == pytest.approx(np.mean([stats.norm.cdf(0.5 / k) for k in (1, 2, 3)]))
+    with pytest.raises(ValueError):
+        PoissonDistribution(1.0) * NormalDistribution()
+
+
+# Affine maps
+
+def test_scalar_multiplication_of_gamma_scales_beta():
+    result = 3 * GammaDistribution(2.0, 1.5)
+    assert result == GammaDistribution(2.0, 4.5)
+    assert isclose(result.mean, 3 * GammaDistribution(2.0, 1.5).mean)
+
+
+def test_scalar_multiplication_of_lognormal_shifts_mu():
+    result = LogNormalDistribution(0.2, 0.5) * 2
+    assert isclose(result.mu, 0.2 + log(2))
+    assert isclose(result.mean, 2 * LogNormalDistribution(0.2, 0.5).mean)
+
+
+def test_negative_scale_uniform():
+    assert -2 * UniformDistribution(1, 3) + 1 == UniformDistribution(-5, -1)
+
+
+@pytest.mark.parametrize('dist', [
+    JohnsonSUDistribution(0.5, 1.5, 1.0, 2.0),
+    SkewNormalDistribution(1.0, 2.0, 3.0),
+])
+@pytest.mark.parametrize('scale, shift', [(2.0, 1.0), (-0.5, 3.0)])
+def test_affine_location_scale_moments(dist, scale, shift):
+    result = affine(dist, scale, shift)
+    assert type(result) is type(dist)
+    assert isclose(result.mean, scale * dist.mean + shift)
+    assert isclose(result.variance, scale ** 2 * dist.variance)
+    assert isclose(result.skewness, np.sign(scale) * dist.skewness)
+
+
+def test_affine_fallback_wraps_distribution():
+    dist = ExponentialDistribution(1.0)
+    result = -2 * dist + 1
+    assert isinstance(result, AffineDistribution)
+    assert isclose(result.mean, -1.0)
+    assert isclose(result.cdf(0.0), 1 - dist.cdf(0.5))
+    assert isclose(result.pdf(0.0), dist.pdf(0.5) / 2)
+    assert isclose(result.inverse_cdf(0.3), -2 * dist.inverse_cdf(0.7) + 1)
+
+
+def test_numpy_scalar_multiplication():
+    assert np.float64(2.0) * NormalDistribution(1, 1) == NormalDistribution(2, 2)
+
+
+def test_division_by_zero():
+    with pytest.raises(ValueError):
+        NormalDistribution() / 0
+
+
+# Registry
+
+def test_sum_without_rule_uses_convolution():
+    z = GammaDistribution(1.0, 1.0) + GammaDistribution(1.0, 2.0)
+    assert isinstance(z, ConvolutionDistribution)
+    assert z.mean == pytest.approx(3.0)
+
+
+def test_discrete_sum_without_rule_convolves_pmfs():
+    z = BinomialDistribution(3, 0.2) + BinomialDistribution(4, 0.5)
+    assert isinstance(z, LatticeDistribution)
+    expected = np.convolve(stats.binom(3, 0.2).pmf(np.arange(4)), stats.binom(4, 0.5).pmf(np.arange(5)))
+    assert z.domain == list(range(8))
+    assert np.allclose(z.pmf(np.arange(8)), expected)
+    assert z.mean == pytest.approx(3 * 0.2 + 4 * 0.5)
+    assert z.variance == pytest.approx(3 * 0.2 * 0.8 + 4 * 0.25)
+    assert z.cdf(3.5) == pytest.approx(expected[:4].sum())
+
+
+def test_discrete_product_without_rule():
+    z = PoissonDistribution(2.0) * DiscreteUniformDistribution(1, 3)
+    assert isinstance(z, LatticeDistribution)
+    assert z.pmf(0) == pytest.approx(stats.poisson(2.0).pmf(0))
+    expected = sum(stats.poisson(2.0).pmf(6 // k) / 3 for k in (1, 2, 3))
+    assert z.pmf(6) == pytest.approx(expected)
+    assert z.mean == pytest.approx(4.0, rel=1e-8)
+
+
+def test_affine_maps_of_discrete_distributions():
+    shifted = PoissonDistribution(2.0) + 1
+    assert isinstance(shifted, LatticeDistribution)
+    assert shifted.pmf(np.arange(1, 6)) == pytest.approx(stats.poisson(2.0).pmf(np.arange(5)))
+    assert shifted.pmf(0) == 0
+    doubled = 2 * BinomialDistribution(3, 0.5)
+    assert doubled.pmf(np.arange(7)) == pytest.approx([1 / 8, 0, 3 / 8, 0, 3 / 8, 0, 1 / 8])
+    assert doubled.mean == pytest.approx(3.0)
+    negated = -PoissonDistribution(2.0)
+    assert negated.cdf(-3) == pytest.approx(stats.poisson(2.0).sf(2))
+    assert negated.mean == pytest.approx(-2.0, rel=1e-8)
+
+
+def test_difference_of_poissons_is_skellam():
+    z = PoissonDistribution(2.0) - PoissonDistribution(3.0)
+    assert isinstance(z, LatticeDistribution)
+    k = np.arange(-6, 5)
+    assert z.pmf(k) == pytest.approx(stats.skellam(2.0, 3.0).pmf(k), abs=1e-9)
+    assert z.mean == pytest.approx(-1.0, rel=1e-8)
+    assert z.variance == pytest.approx(5.0, rel=1e-8)
+
+
+def test_non_integer_affine_map_of_discrete_distribution():
+    with pytest.raises(NotImplementedError):
+        0.5 * PoissonDistribution(2.0)
+
+
+def test_add_invalid_type():
+    with pytest.raises(TypeError):
+        NormalDistribution() + "x"
+
+
+def test_register_custom_sum_rule():
+    @register_sum(UniformDistribution, NormalDistribution)
+    def _rule(x, y):
+        return NormalDistribution(x.mean + y.mu, sqrt(x.variance + y.sigma ** 2))
+    try:
+        result = NormalDistribution(0, 1) + UniformDistribution(0, 1)
+        assert isclose(result.mu, 0.5)
+    finally:
+        del _SUM_RULES[(UniformDistribution, NormalDistribution)]
+        del _SUM_RULES[(NormalDistribution, UniformDistribution)]
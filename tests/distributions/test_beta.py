@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from scipy import stats
+from scipy.special import betainc
+
+from sdatools.core.functions import incomplete_beta
+from sdatools.distributions.continuous.beta import BetaDistribution
+from sdatools.parameter_estimation.method_of_moments import MethodOfMoments
+
+
+SHAPES = [(2.0, 5.0), (0.5, 0.5), (0.1, 3.0), (30.0, 2.0), (1.0, 1.0), (1.0, 3.0), (200.0, 300.0)]
+
+
+def test_incomplete_beta_matches_scipy():
+    rng = np.random.default_rng(0)
+    a, b, x = rng.uniform(0.05, 50, 5000), rng.uniform(0.05, 50, 5000), rng.random(5000)
+    assert np.allclose(incomplete_beta(a, b, x), betainc(a, b, x), rtol=0, atol=1e-13)
+    assert incomplete_beta(2.0, 3.0, -1.0) == 0.0
+    assert incomplete_beta(2.0, 3.0, 2.0) == 1.0
+
+
+@pytest.mark.parametrize("alpha,beta", SHAPES)
+def test_incomplete_beta_with_scalar_shapes_matches_scipy(alpha, beta):
+    # Scalar shapes take a separate path, with the two sides of the symmetry evaluated apart
+    x = np.linspace(0.0, 1.0, 1001)
+    assert np.allclose(incomplete_beta(alpha, beta, x), betainc(alpha, beta, x), rtol=0, atol=1e-13)
+    assert incomplete_beta(alpha, beta, np.array([])).shape == (0,)
+
+
+@pytest.mark.parametrize("alpha,beta", SHAPES)
+def test_pdf_cdf_match_scipy(alpha, beta):
+    dist, ref = BetaDistribution(alpha, beta), stats.beta(alpha, beta)
+    x = np.linspace(0.01, 0.99, 99)
+    assert np.allclose(dist.pdf(x), ref.pdf(x), rtol=1e-12)
+    assert np.allclose(dist.logpdf(x), ref.logpdf(x), rtol=1e-12)
+    assert np.allclose(dist.cdf(x), ref.cdf(x), rtol=0, atol=1e-13)
+
+
+@pytest.mark.parametrize("alpha,beta", SHAPES)
+def test_inverse_cdf_matches_scipy(alpha, beta):
+    dist, ref = BetaDistribution(alpha, beta), stats.beta(alpha, beta)
+    p = np.concatenate(([0.0], np.linspace(0.01, 0.99, 99), [1.0]))
+    assert np.allclose(dist.inverse_cdf(p), ref.ppf(p), rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("alpha,beta", SHAPES)
+def test_inverse_cdf_tails(alpha, beta):
+    dist = BetaDistribution(alpha, beta)
+    p = np.array([1e-12, 1e-6])
+    assert np.allclose(dist.cdf(dist.inverse_cdf(p)), p, rtol=1e-10, atol=0)
+    assert 1 - dist.cdf(dist.inverse_cdf(1 - 1e-6)) == pytest.approx(1e-6, rel=1e-3)
+
+
+@pytest.mark.parametrize("alpha,beta", SHAPES)
+def test_moments_match_scipy(alpha, beta):
+    dist = BetaDistribution(alpha, beta)
+    mean, var, skew, kurt = stats.beta.stats(alpha, beta, moments='mvsk')
+    assert (dist.mean, dist.variance, dist.skewness, dist.kurtosis) == pytest.approx((mean, var, skew, kurt))
+
+
+@pytest.mark.parametrize("alpha,beta", [(2.0, 5.0), (0.5, 0.5), (0.1, 3.0), (30.0, 2.0)])
+def test_sample(alpha, beta):
+    samples = BetaDistribution(alpha, beta).sample(20000, rng=1)
+    assert np.all((samples >= 0) & (samples <= 1))
+    assert stats.kstest(samples, stats.beta(alpha, beta).cdf).pvalue > 0.001
+
+
+def test_pdf_at_boundaries():
+    assert np.allclose(BetaDistribution(1.0, 3.0).pdf([0.0, 1.0, 1.5]), [3.0, 0.0, 0.0])
+    assert np.allclose(BetaDistribution(3.0, 1.0).pdf([-0.5, 0.0, 1.0]), [0.0, 0.0, 3.0])
+
+
+def test_method_of_moments_beta():
+    data = BetaDistribution(2.0, 5.0).sample(200000, rng=2)
+    fitted = MethodOfMoments(data).fit(BetaDistribution)
+    assert isinstance(fitted, BetaDistribution)
+    assert fitted.alpha == pytest.approx(2.0, rel=0.05)
+    assert fitted.beta == pytest.approx(5.0, rel=0.05)
+
+
+def test_method_of_moments_beta_invalid_data():
+    with pytest.raises(ValueError):
+        MethodOfMoments([0.5, 1.5, 0.2]).fit(BetaDistribution)
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        BetaDistribution(0.0, 1.0)
+    with pytest.raises(ValueError):
+        BetaDistribution(1.0, -1.0)
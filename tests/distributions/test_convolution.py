@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.continuous.convolution import ConvolutionDistribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.uniform import UniformDistribution
+from sdatools.distributions.discrete.binomial import BinomialDistribution
+
+
+def test_normal_plus_exponential_matches_exponnorm():
+    z = ConvolutionDistribution([NormalDistribution(0.0, 1.0), ExponentialDistribution(2.0)])
+    x = np.linspace(-3.0, 5.0, 17)
+    assert np.allclose(z.cdf(x), stats.exponnorm.cdf(x, 0.5), atol=1e-5)
+    assert np.allclose(z.pdf(x), stats.exponnorm.pdf(x, 0.5), atol=1e-5)
+
+
+def test_sum_of_gammas_matches_closed_form():
+    z = ConvolutionDistribution([GammaDistribution(1.0, 1.0)] * 10)
+    x = np.linspace(2.0, 25.0, 12)
+    assert np.allclose(z.cdf(x), stats.gamma.cdf(x, 10), atol=1e-5)
+
+
+def test_long_tailed_sum_uses_range_of_sum():
+    # Truncating each of 50 exponentials far out must not spread the grid over the sum of their ranges
+    z = ConvolutionDistribution([ExponentialDistribution(1.0)] * 50)
+    x = stats.gamma.ppf([1e-6, 0.01, 0.5, 0.99, 1 - 1e-6], 50)
+    assert np.allclose(z.cdf(x), stats.gamma.cdf(x, 50), atol=1e-5)
+    assert z.grid.size <= 2 ** 16
+    assert z.grid[-1] < 200
+
+
+def test_irwin_hall():
+    z = ConvolutionDistribution([UniformDistribution(0.0, 1.0)] * 3)
+    assert np.allclose(z.cdf([0.5, 1.5, 2.5]), [1 / 48, 0.5, 47 / 48], atol=1e-6)
+    assert z.pdf(1.5) == pytest.approx(0.75, abs=1e-5)
+    assert z.domain == [0.0, 3.0]
+
+
+def test_inverse_cdf_round_trip():
+    z = ConvolutionDistribution([GammaDistribution(2.0, 1.0), GammaDistribution(3.0, 0.5)])
+    p = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    assert np.allclose(z.cdf(z.inverse_cdf(p)), p, atol=1e-6)
+
+
+def test_moments_are_additive():
+    x, y = GammaDistribution(2.0, 1.0), ExponentialDistribution(0.5)
+    z = ConvolutionDistribution([x, y])
+    assert z.mean == pytest.approx(x.mean + y.mean)
+    assert z.variance == pytest.approx(x.variance + y.variance)
+    k3 = x.skewness * x.variance ** 1.5 + y.skewness * y.variance ** 1.5
+    assert z.skewness == pytest.approx(k3 / z.variance ** 1.5)
+
+
+def test_discrete_component():
+    z = ConvolutionDistribution([NormalDistribution(0.0, 0.5), BinomialDistribution(2, 0.5)])
+    x = np.array([-0.5, 0.5, 1.5, 2.5])
+    expected = sum(q * stats.norm.cdf(x - k, scale=0.5) for k, q in enumerate([0.25, 0.5, 0.25]))
+    assert np.allclose(z.cdf(x), expected, atol=1e-4)
+
+
+def test_error_control():
+    z = ConvolutionDistribution([NormalDistribution(), ExponentialDistribution(1.0)], tol=1e-7)
+    assert z.error_estimate < 1e-7
+    assert z.truncation_error < 1e-9
+
+
+def test_nested_sums_are_flattened():
+    x, y, w = NormalDistribution(), ExponentialDistribution(1.0), GammaDistribution(2.0, 3.0)
+    z = ConvolutionDistribution([ConvolutionDistribution([x, y]), w])
+    assert z.components == (x, y, w)
+
+
+def test_sample_matches_cdf():
+    z = ConvolutionDistribution([NormalDistribution(), ExponentialDistribution(1.0)])
+    samples = z.sample(20000, rng=0)
+    assert stats.kstest(samples, z.cdf).pvalue > 0.001
+
+
+def test_equality_and_hash():
+    x = ConvolutionDistribution([NormalDistribution(), ExponentialDistribution(1.0)])
+    y = ConvolutionDistribution([NormalDistribution(), ExponentialDistribution(1.0)])
+    assert x == y
+    assert hash(x) == hash(y)
+
+
+def test_invalid_component():
+    with pytest.raises(TypeError):
+        ConvolutionDistribution([NormalDistribution(), 1.0])
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.discrete.bernoulli import BernoulliDistribution
+from sdatools.distributions.discrete.geometric import GeometricDistribution
+from sdatools.distributions.discrete.uniform import DiscreteUniformDistribution
+
+
+U = np.random.default_rng(0).random(10000)
+
+
+# (distribution, equivalent scipy distribution, values to test)
+CASES = [
+    (BernoulliDistribution(0.3), stats.bernoulli(0.3), np.arange(-1, 3)),
+    (GeometricDistribution(0.05), stats.geom(0.05, loc=-1), np.arange(-1, 300)),
+    (GeometricDistribution(0.8), stats.geom(0.8, loc=-1), np.arange(-1, 30)),
+    (DiscreteUniformDistribution(-3, 5), stats.randint(-3, 6), np.arange(-5, 8)),
+]
+
+
+@pytest.mark.parametrize("dist,ref,k", CASES)
+def test_pmf_cdf_match_scipy(dist, ref, k):
+    assert np.allclose(dist.pmf(k), ref.pmf(k), rtol=1e-12, atol=1e-300)
+    assert np.allclose(dist.cdf(k), ref.cdf(k), rtol=1e-12, atol=0)
+    assert dist.pmf(0.5) == 0.0
+
+
+@pytest.mark.parametrize("dist,ref,k", CASES)
+def test_inverse_cdf_matches_scipy(dist, ref, k):
+    q = dist.inverse_cdf(U)
+    assert q.dtype == np.int64
+    assert np.array_equal(q, ref.ppf(U).astype(np.int64))
+    # Smallest k with cdf(k) >= u
+    assert np.all(dist.cdf(q) >= U) and np.all(dist.cdf(q - 1) < U)
+
+
+@pytest.mark.parametrize("dist,ref,k", CASES)
+def test_moments_match_scipy(dist, ref, k):
+    mean, var, skew, kurt = ref.stats(moments='mvsk')
+    assert (dist.mean, dist.variance, dist.skewness, dist.kurtosis) == pytest.approx((mean, var, skew, kurt))
+
+
+@pytest.mark.parametrize("dist,ref,k", CASES)
+def test_sample_returns_int_array(dist, ref, k):
+    sample = dist.sample(20000, rng=1)
+    assert sample.dtype == np.int64 and sample.shape == (20000,)
+    assert np.array_equal(sample, dist.sample(20000, rng=1))
+    assert np.all(ref.pmf(sample) > 0)
+    assert np.mean(sample) == pytest.approx(dist.mean, abs=4 * dist.stddev / np.sqrt(20000))
+
+
+def test_geometric_sample_does_not_use_domain(monkeypatch):
+    dist = GeometricDistribution(1e-6)
+    monkeypatch.setattr(GeometricDistribution, "domain", property(lambda self: pytest.fail("domain was built")))
+    assert dist.sample(10, rng=0).min() >= 0
+
+
+def test_geometric_inverse_cdf_limits():
+    dist = GeometricDistribution(0.3)
+    assert dist.inverse_cdf(0.0) == 0
+    assert dist.inverse_cdf(1.0) == np.iinfo(np.int64).max
+    assert np.array_equal(GeometricDistribution(1.0).sample(5, rng=0), np.zeros(5))
+
+
+@pytest.mark.parametrize("p", [0.05, 0.8])
+def test_geometric_sf_and_truncation(p):
+    dist, ref = GeometricDistribution(p), stats.geom(p, loc=-1)
+    k = np.arange(-1, 2000)
+    assert np.allclose(dist.sf(k), ref.sf(k), rtol=1e-10, atol=0)
+    assert dist.sf(dist.domain[-1]) <= dist.tail_mass < dist.sf(dist.domain[-2])
+    assert len(GeometricDistribution(p, tail_mass=1e-6).domain) < len(dist.domain)
+    assert dist.expect() == 1.0
+    assert dist.expect(None, 1.5, 4) == pytest.approx(ref.cdf(4) - ref.cdf(1), rel=1e-14)
+    assert dist.expect(lambda x: x) == pytest.approx(dist.mean, rel=1e-12)
+
+
+def test_variance_reduction_uses_closed_form_inverse_cdf():
+    dist = DiscreteUniformDistribution(1, 6)
+    sample = dist.sample(600, method="stratified", rng=0)
+    assert np.array_equal(np.bincount(sample)[1:], np.full(6, 100))
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        BernoulliDistribution(1.5)
+    with pytest.raises(ValueError):
+        GeometricDistribution(0.0)
+    with pytest.raises(ValueError):
+        GeometricDistribution(0.5, tail_mass=0.0)
+    with pytest.raises(ValueError):
+        DiscreteUniformDistribution(3, 1)
+    with pytest.raises(ValueError):
+        DiscreteUniformDistribution(0.5, 2)
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from scipy import stats
+from scipy.optimize import check_grad
+from scipy.special import expit
+
+from sdatools.distributions.continuous.egb2 import EGB2Distribution
+from sdatools.parameter_estimation.maximum_likelihood import MaximumLikelihood, _egb2_negative_log_likelihood
+
+
+PARAMETERS = [(0.0, 1.0, 1.0, 1.0), (0.001, 0.01, 0.5, 2.0), (1.0, 2.0, 5.0, 0.3), (0.0, 1.0, 30.0, 40.0)]
+
+
+@pytest.mark.parametrize("mu,sigma,p,q", PARAMETERS)
+def test_pdf_cdf_match_beta_transform(mu, sigma, p, q):
+    dist, beta = EGB2Distribution(mu, sigma, p, q), stats.beta(p, q)
+    z = np.linspace(-8, 8, 161)
+    w = expit(z)
+    x = mu + sigma * z
+    assert np.allclose(dist.pdf(x), beta.pdf(w) * w * (1 - w) / sigma, rtol=1e-10)
+    assert np.allclose(dist.cdf(x), beta.cdf(w), rtol=1e-10, atol=1e-14)
+
+
+def test_logistic_special_case():
+    dist, ref = EGB2Distribution(0.5, 2.0), stats.logistic(0.5, 2.0)
+    x = np.linspace(-100, 100, 201)
+    assert np.allclose(dist.logpdf(x), ref.logpdf(x), rtol=1e-12)
+    assert np.allclose(dist.cdf(x), ref.cdf(x), rtol=1e-12, atol=0)
+    assert (dist.mean, dist.variance, dist.skewness, dist.kurtosis) == pytest.approx(ref.stats(moments='mvsk'))
+
+
+def test_logpdf_stable_in_tails_and_for_large_shapes():
+    dist = EGB2Distribution(0.0, 1.0, 2000.0, 3000.0)
+    logpdf = dist.logpdf(np.array([-1e4, -0.4, 0.0, 1e4]))
+    assert np.all(np.isfinite(logpdf))
+    # Tails are exponential with rates p (left) and q (right)
+    assert EGB2Distribution(0.0, 1.0, 2.0, 3.0).logpdf(-1000.0) - EGB2Distribution(0.0, 1.0, 2.0, 3.0).logpdf(-999.0) \
+        == pytest.approx(-2.0)
+
+
+@pytest.mark.parametrize("mu,sigma,p,q", PARAMETERS)
+def test_inverse_cdf_round_trip(mu, sigma, p, q):
+    dist = EGB2Distribution(mu, sigma, p, q)
+    u = np.array([1e-10, 1e-3, 0.2, 0.5, 0.8, 1 - 1e-6])
+    x = dist.inverse_cdf(u)
+    assert np.allclose(dist.cdf(x), u, rtol=1e-12, atol=0)
+    assert np.allclose(1 - dist.cdf(x[-1]), 1e-6, rtol=1e-8)
+
+
+@pytest.mark.parametrize("mu,sigma,p,q", PARAMETERS)
+def test_sample(mu, sigma, p, q):
+    dist = EGB2Distribution(mu, sigma, p, q)
+    samples = dist.sample(20000, rng=0)
+    assert stats.kstest(samples, dist.cdf).pvalue > 0.001
+
+
+def test_log_likelihood():
+    dist = EGB2Distribution(0.0, 0.01, 0.8, 1.2)
+    data = dist.sample(1000, rng=1)
+    assert dist.log_likelihood(data) == pytest.approx(np.sum(dist.logpdf(data)))
+
+
+def test_negative_log_likelihood_gradient():
+    data = EGB2Distribution(0.3, 0.5, 0.7, 2.0).sample(2000, rng=0)
+    f = lambda theta: _egb2_negative_log_likelihood(theta, data)[0]
+    grad = lambda theta: _egb2_negative_log_likelihood(theta, data)[1]
+    assert check_grad(f, grad, np.array([0.1, -0.5, 0.2, -0.3])) < 1e-6
+
+
+def test_maximum_likelihood_egb2():
+    true = EGB2Distribution(0.0005, 0.01, 0.6, 1.5)
+    data = true.sample(50000, rng=2)
+    fitted = MaximumLikelihood(data).fit(EGB2Distribution)
+    assert isinstance(fitted, EGB2Distribution)
+    assert fitted.log_likelihood(data) >= true.log_likelihood(data)
+    assert (fitted.p, fitted.q) == pytest.approx((0.6, 1.5), rel=0.15)
+    assert fitted.sigma == pytest.approx(0.01, rel=0.1)
+
+
+def test_maximum_likelihood_egb2_warns_if_not_converged():
+    data = EGB2Distribution(0.0, 1.0, 0.6, 1.5).sample(1000, rng=2)
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        MaximumLikelihood(data, max_iter=0).fit(EGB2Distribution)
+
+
+def test_affine_transform():
+    assert 2 * EGB2Distribution(1.0, 0.5, 0.7, 2.0) + 1 == EGB2Distribution(3.0, 1.0, 0.7, 2.0)
+    assert -EGB2Distribution(1.0, 0.5, 0.7, 2.0) == EGB2Distribution(-1.0, 0.5, 2.0, 0.7)
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        EGB2Distribution(sigma=0.0)
+    with pytest.raises(ValueError):
+        EGB2Distribution(p=-1.0)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.data_visualisation.histogram import Histogram
+from sdatools.distributions.continuous.empirical import EmpiricalDistribution
+from sdatools.distributions.continuous.kde import MAX_GRID_SIZE, KDEDistribution
+from sdatools.validation.goodness_of_fit.ks_test import KSTest
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).normal(1.0, 2.0, 5000)
+
+
+def test_empirical_cdf_and_quantiles():
+    x = EmpiricalDistribution([3.0, 1.0, 2.0, 2.0])
+    assert np.allclose(x.cdf([0.5, 1.0, 2.0, 2.5, 3.0]), [0.0, 0.25, 0.75, 0.75, 1.0])
+    assert np.allclose(x.inverse_cdf([0.0, 0.25, 0.26, 0.75, 1.0]), [1.0, 1.0, 2.0, 2.0, 3.0])
+    assert x.domain == [1.0, 3.0]
+
+
+def test_empirical_moments(data):
+    x = EmpiricalDistribution(data)
+    assert x.mean == pytest.approx(np.mean(data))
+    assert x.variance == pytest.approx(np.var(data))
+    assert x.skewness == pytest.approx(stats.skew(data))
+    assert x.kurtosis == pytest.approx(stats.kurtosis(data))
+
+
+def test_empirical_bootstrap_sample(data):
+    x = EmpiricalDistribution(data)
+    samples = x.sample(1000, rng=1)
+    assert np.all(np.isin(samples, data))
+
+
+def test_empirical_expect_is_sample_mean(data):
+    x = EmpiricalDistribution(data)
+    assert x.expect(np.cos) == pytest.approx(np.mean(np.cos(data)))
+    assert x.expect(lambda v: v - 2.0, lower=2.0) == pytest.approx(np.mean(np.maximum(data - 2.0, 0.0)))
+    assert x.expect(None, upper=1.0) == pytest.approx(x.cdf(1.0))
+    assert x.expect(None, lower=100.0) == 0.0
+
+
+def test_empirical_has_no_density(data):
+    with pytest.raises(NotImplementedError):
+        EmpiricalDistribution(data).pdf(0.0)
+
+
+def test_empirical_data_is_read_only(data):
+    x = EmpiricalDistribution(data)
+    with pytest.raises(ValueError):
+        x.data[0] = 0.0
+
+
+def test_kde_matches_direct_sum(data):
+    kde = KDEDistribution(data)
+    h = kde.bandwidth
+    x = np.linspace(-6.0, 8.0, 29)
+    direct = stats.norm.pdf((x[:, None] - data[None, :]) / h).mean(axis=1) / h
+    assert np.allclose(kde.pdf(x), direct, atol=1e-4)
+    direct_cdf = stats.norm.cdf((x[:, None] - data[None, :]) / h).mean(axis=1)
+    assert np.allclose(kde.cdf(x), direct_cdf, atol=1e-4)
+
+
+def test_kde_inverse_cdf_round_trip(data):
+    kde = KDEDistribution(data)
+    p = np.array([0.01, 0.5, 0.99])
+    assert np.allclose(kde.cdf(kde.inverse_cdf(p)), p, atol=1e-6)
+
+
+def test_kde_grid_is_sized_from_range_over_bandwidth(data):
+    kde = KDEDistribution(data)
+    assert np.diff(kde.grid)[0] == pytest.approx(kde.bandwidth / 32, rel=1e-2)
+    assert KDEDistribution(np.append(data, 1e9)).grid.size == MAX_GRID_SIZE
+    assert KDEDistribution(data, grid_size=1000).grid.size == 1000
+
+
+def test_kde_moments(data):
+    kde = KDEDistribution(data, bandwidth=0.5)
+    assert kde.mean == pytest.approx(np.mean(data))
+    assert kde.variance == pytest.approx(np.var(data) + 0.25)
+
+
+def test_kde_silverman_bandwidth(data):
+    sigma = np.std(data, ddof=1)
+    iqr = np.subtract(*np.percentile(data, [75, 25]))
+    assert KDEDistribution(data).bandwidth == pytest.approx(0.9 * min(sigma, iqr / 1.34) * len(data) ** -0.2)
+
+
+def test_ks_test_against_empirical(data):
+    ks = KSTest(np.random.default_rng(3).normal(1.0, 2.0, 500))
+    ks.test(dist=KDEDistribution(data))
+    assert ks.result == "PASS"
+
+
+def test_ks_test_and_histogram_overlay_for_empirical_distribution(data):
+    ks = KSTest(np.random.default_rng(3).normal(1.0, 2.0, 500))
+    ks.test(dist=EmpiricalDistribution(data))
+    assert ks.result == "PASS"
+
+    # No density: the overlay is the bin probability over the bin width, i.e. the density histogram
+    histogram = Histogram(data, bins=20)
+    histogram.overlay_pdf(EmpiricalDistribution(data))
+    heights = histogram._ax.patches[-1].get_data().values
+    assert np.allclose(heights, np.histogram(data, bins=20, density=True)[0])
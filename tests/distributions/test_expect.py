@@ -0,0 +1,265 @@
+from math import exp, pi, sqrt
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.core.types import ArrayLike
+from sdatools.distributions.abstract.continuous_distribution import ContinuousDistribution
+from sdatools.distributions.abstract.discrete_distribution import DiscreteDistribution
+from sdatools.distributions.continuous.beta import BetaDistribution
+from sdatools.distributions.continuous.egb2 import EGB2Distribution
+from sdatools.distributions.continuous.empirical import EmpiricalDistribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.uniform import UniformDistribution
+from sdatools.distributions.continuous.weibull import WeibullDistribution
+from sdatools.distributions.discrete.binomial import BinomialDistribution
+from sdatools.distributions.discrete.poisson import PoissonDistribution
+from sdatools.distributions.expectation.expect import expect, expectation_nodes
+
+
+class LogisticDistribution(ContinuousDistribution):
+    """
+    Logistic distribution defined only by its domain, pdf and cdf, so its moments come from the base class.
+    """
+
+    def __init__(self, mu: float = 0.0, s: float = 1.0):
+        self._mu = mu
+        self._s = s
+        self.pdf_calls = 0
+
+    def __repr__(self) -> str:
+        return f"LogisticDistribution(mu={self._mu}, s={self._s})"
+
+    def __hash__(self) -> int:
+        return hash((self._mu, self._s))
+
+    @property
+    def domain(self) -> list[float]:
+        return [float('-inf'), float('inf')]
+
+    def pdf(self, x: ArrayLike) -> ArrayLike:
+        self.pdf_calls += 1
+        z = np.abs(np.asarray(x, dtype=float) - self._mu) / self._s
+        return np.exp(-z) / (self._s * (1 + np.exp(-z)) ** 2)
+
+    def cdf(self, x: ArrayLike) -> ArrayLike:
+        return 1 / (1 + np.exp(-(np.asarray(x, dtype=float) - self._mu) / self._s))
+
+
+class FairDie(DiscreteDistribution):
+    """
+    Fair six-sided die defined only by its domain, pmf and cdf.
+    """
+
+    def __repr__(self) -> str:
+        return "FairDie()"
+
+    def __hash__(self) -> int:
+        return hash("FairDie")
+
+    @property
+    def domain(self) -> list[int]:
+        return [1, 2, 3, 4, 5, 6]
+
+    def pmf(self, k) -> float:
+        return 1 / 6 if k in self.domain else 0.0
+
+    def cdf(self, k) -> float:
+        return min(max(int(k), 0), 6) / 6
+
+
+# Default numeric moments
+
+def test_default_moments_of_continuous_distribution():
+    dist = LogisticDistribution(mu=2.0, s=0.5)
+    assert dist.mean == pytest.approx(2.0, abs=1e-12)
+    assert dist.variance == pytest.approx(0.25 * pi ** 2 / 3, rel=1e-10)
+    assert dist.stddev == pytest.approx(0.5 * pi / sqrt(3), rel=1e-10)
+    assert dist.skewness == pytest.approx(0.0, abs=1e-10)
+    assert dist.kurtosis == pytest.approx(1.2, rel=1e-8)
+
+
+def test_default_moments_of_discrete_distribution():
+    dist = FairDie()
+    assert dist.mean == pytest.approx(3.5)
+    assert dist.variance == pytest.approx(35 / 12)
+    assert dist.skewness == pytest.approx(0.0, abs=1e-12)
+    assert dist.kurtosis == pytest.approx(-222 / 175)
+
+
+def test_default_moments_are_cached_and_ignored_by_equality():
+    dist = LogisticDistribution(mu=1.0, s=2.0)
+    _ = dist.mean
+    calls = dist.pdf_calls
+    assert 1 <= calls <= 9  # One vectorised call per refinement level
+    _ = (dist.variance, dist.skewness, dist.kurtosis)
+    assert dist.pdf_calls == calls
+    other = LogisticDistribution(mu=1.0, s=2.0)
+    other.pdf_calls = dist.pdf_calls
+    assert dist == other
+
+
+@pytest.mark.parametrize("dist", [
+    NormalDistribution(1e6, 1.0),
+    GammaDistribution(3.0, 2.0),
+    BetaDistribution(2.0, 3.0),
+    EGB2Distribution(0.0, 1.0, 2.0, 0.5),
+    BinomialDistribution(20, 0.3),
+    PoissonDistribution(4.5),
+])
+def test_numeric_moments_match_closed_forms(dist):
+    numeric = dist._numeric_moments()
+    assert np.allclose(numeric, [dist.mean, dist.variance, dist.skewness, dist.kurtosis], rtol=1e-6, atol=1e-8)
+
+
+# Expectations
+
+def test_expect_probability_matches_cdf():
+    dist, ref = NormalDistribution(1.0, 2.0), stats.norm(1.0, 2.0)
+    assert dist.expect() == pytest.approx(1.0, abs=1e-12)
+    assert dist.expect(lower=0.0, upper=3.0) == pytest.approx(ref.cdf(3.0) - ref.cdf(0.0), abs=1e-12)
+    assert dist.expect(upper=-1.0) == pytest.approx(ref.cdf(-1.0), abs=1e-12)
+    assert dist.expect(lower=5.0, upper=5.0) == 0.0
+
+
+def test_expect_call_payoff_matches_closed_form():
+    """
+    E[max(X - K, 0)] = (mu - K) * Phi(d) + sigma * phi(d), with d = (mu - K) / sigma, for X ~ N(mu, sigma^2)
+    """
+    mu, sigma, strike = 0.5, 1.5, 1.0
+    d = (mu - strike) / sigma
+    expected = (mu - strike) * stats.norm.cdf(d) + sigma * stats.norm.pdf(d)
+    dist = NormalDistribution(mu, sigma)
+    assert dist.expect(lambda x: x - strike, lower=strike) == pytest.approx(expected, rel=1e-12)
+
+
+def test_expect_partial_moment_on_half_line_domain():
+    dist = WeibullDistribution(2.0, 1.5)
+    ref = stats.weibull_min(2.0, scale=1.5)
+    assert dist.expect(lambda x: x ** 2, upper=1.0) == pytest.approx(ref.expect(lambda x: x ** 2, ub=1.0), rel=1e-10)
+    assert dist.expect(lambda x: x, lower=2.0) == pytest.approx(ref.expect(lambda x: x, lb=2.0), rel=1e-10)
+
+
+def test_expect_with_array_valued_function():
+    dist = NormalDistribution(0.0, 1.0)
+    moments = dist.expect(lambda x: np.stack([x, x ** 2, x ** 4]))
+    assert np.allclose(moments, [0.0, 1.0, 3.0], atol=1e-12)
+
+
+def test_divergent_expectation_warns():
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        UniformDistribution(0.0, 1.0).expect(lambda x: 1 / x)
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        GammaDistribution(0.5, 1.0).expect(lambda x: 1 / x)
+
+
+def test_expectation_overflowing_in_the_bulk_warns():
+    # The integrand is infinite everywhere, not just at nodes next to a limit, so it must not be dropped
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        value = NormalDistribution(0.0, 1.0).expect(lambda x: np.exp(710.0 + 0 * x))
+    assert not np.isfinite(value)
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        GammaDistribution(2.0, 1.0).expect(lambda x: np.where((x > 1) & (x < 3), np.inf, x))
+
+
+def test_convergent_expectation_does_not_warn(recwarn):
+    assert GammaDistribution(1.5, 1.0).expect(lambda x: 1 / x) == pytest.approx(2.0, rel=1e-10)
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+def test_discrete_expect():
+    dist = BinomialDistribution(10, 0.4)
+    assert dist.expect(lambda k: k) == pytest.approx(4.0)
+    assert dist.expect(lower=3, upper=5) == pytest.approx(sum(dist.pmf(k) for k in (3, 4, 5)))
+    assert dist.expect(lower=11) == 0.0
+
+
+def test_poisson_pmf_matches_scipy():
+    dist = PoissonDistribution(4.5)
+    assert np.allclose([dist.pmf(k) for k in range(30)], stats.poisson(4.5).pmf(np.arange(30)), rtol=1e-12)
+
+
+# Matched quadrature rules (expectation/expect.py)
+
+@pytest.mark.parametrize("dist, g, expected", [
+    (NormalDistribution(0.3, 1.5), np.cos, np.cos(0.3) * exp(-1.5 ** 2 / 2)),
+    (NormalDistribution(-1.0, 0.2), lambda x: np.exp(2 * x), exp(-2.0 + 2 * 0.04)),
+    (LogNormalDistribution(0.1, 0.4), lambda x: x ** 2, exp(0.2 + 2 * 0.16)),
+    (LogNormalDistribution(0.5, 0.3), np.log, 0.5),
+    (GammaDistribution(2.5, 2.0), lambda x: np.exp(-x), (1 + 2.0) ** -2.5),
+    (GammaDistribution(0.5, 1.0), lambda x: x ** 3, 0.5 * 1.5 * 2.5),
+    (ExponentialDistribution(2.0), lambda x: np.exp(-x), 2.0 / 3.0),
+])
+def test_matched_rules_are_accurate_for_smooth_g(dist, g, expected):
+    assert expect(g, dist) == pytest.approx(expected, rel=1e-13)
+
+
+def test_matched_rules_are_exact_for_polynomials_of_degree_2n_minus_1():
+    n = 4
+    normal = stats.norm(1.0, 2.0)
+    expected = normal.moment(7) - normal.moment(6)
+    assert expect(lambda x: x ** 7 - x ** 6, NormalDistribution(1.0, 2.0), n=n) == pytest.approx(expected, rel=1e-13)
+    dist = GammaDistribution(3.0, 0.5)
+    assert expect(lambda x: x ** 7, dist, n=n) == pytest.approx(stats.gamma(3.0, scale=0.5).moment(7), rel=1e-13)
+
+
+def test_g_is_called_once_on_the_cached_nodes():
+    calls = []
+    def g(x):
+        calls.append(x)
+        return x ** 2
+    dist = ExponentialDistribution(0.5)
+    assert expect(g, dist, n=16) == pytest.approx(8.0, rel=1e-13)
+    assert expect(g, ExponentialDistribution(0.5), n=16) == pytest.approx(8.0, rel=1e-13)
+    assert len(calls) == 2 and calls[0].size == 16
+    # Equal distributions share one read-only node array
+    assert calls[0] is calls[1]
+    assert not calls[0].flags.writeable
+    x, w = expectation_nodes(dist, 16)
+    assert x is calls[0]
+    assert w.sum() == pytest.approx(1.0, rel=1e-14)
+
+
+@pytest.mark.parametrize("alpha", [160.0, 1000.0])
+def test_large_gamma_shapes_use_the_matched_rule(alpha):
+    dist = GammaDistribution(alpha, 0.5)
+    assert expectation_nodes(dist) is not None
+    assert expect(lambda x: x, dist) == pytest.approx(0.5 * alpha, rel=1e-12)
+    assert expect(lambda x: x ** 2, dist) == pytest.approx(0.25 * alpha * (alpha + 1), rel=1e-12)
+    assert dist.expect(lambda x: x) == pytest.approx(0.5 * alpha, rel=1e-10)
+
+
+def test_array_valued_g():
+    dist = NormalDistribution(0.0, 1.0)
+    result = expect(lambda x: np.stack((x, x ** 2, x ** 4)), dist)
+    assert result == pytest.approx([0.0, 1.0, 3.0], abs=1e-13)
+
+
+def test_subclasses_use_the_matched_rule():
+    class ShiftedNormal(NormalDistribution):
+        pass
+    dist = ShiftedNormal(2.0, 1.0)
+    assert expectation_nodes(dist) is not None
+    assert expect(lambda x: x, dist) == pytest.approx(2.0, rel=1e-14)
+
+
+def test_other_distributions_fall_back_to_dist_expect():
+    dist = WeibullDistribution(k=2.0, lam=1.0)
+    assert expectation_nodes(dist) is None
+    assert expect(np.sqrt, dist) == dist.expect(np.sqrt)
+
+
+def test_invalid_number_of_nodes():
+    with pytest.raises(ValueError):
+        expect(np.cos, NormalDistribution(), n=0)
+
+
+def test_empirical_distribution_averages_over_the_data():
+    data = np.random.default_rng(0).gamma(2.0, size=1000)
+    dist = EmpiricalDistribution(data)
+    assert expectation_nodes(dist, 8) is None
+    assert expect(np.sqrt, dist) == pytest.approx(np.mean(np.sqrt(data)))
+    assert np.allclose(expect(lambda x: np.array([x, x ** 2]), dist), [data.mean(), np.mean(data ** 2)])
@@ -0,0 +1,87 @@
+from fractions import Fraction
+from math import comb, factorial
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.continuous.irwin_hall import IrwinHallDistribution
+
+
+def exact_cdf(n, x):
+    x = Fraction(x)
+    return float(sum((-1) ** k * comb(n, k) * (x - k) ** n for k in range(int(x) + 1)) / factorial(n))
+
+
+def exact_pdf(n, x):
+    x = Fraction(x)
+    return float(sum((-1) ** k * comb(n, k) * (x - k) ** (n - 1) for k in range(int(x) + 1)) / factorial(n - 1))
+
+
+@pytest.mark.parametrize("n", [2, 3, 7, 20, 40])
+def test_exact_pdf_cdf_match_rational_arithmetic(n):
+    dist = IrwinHallDistribution(n)
+    assert dist.exact
+    x = np.linspace(0, n, 41)[1:-1]
+    assert np.allclose(dist.pdf(x), [exact_pdf(n, xi) for xi in x], rtol=1e-13, atol=0)
+    # Relative precision is kept in the lower tail
+    assert np.allclose(dist.cdf(x[:5]), [exact_cdf(n, xi) for xi in x[:5]], rtol=1e-13, atol=0)
+    assert np.allclose(dist.cdf(n - x), 1 - dist.cdf(x), rtol=0, atol=1e-15)
+    assert np.allclose(dist.cdf(x), [exact_cdf(n, xi) for xi in x], rtol=0, atol=1e-15)
+
+
+@pytest.mark.parametrize("n", [41, 60, 100])
+def test_edgeworth_error_bound(n):
+    dist = IrwinHallDistribution(n)
+    assert not dist.exact
+    x = np.linspace(0, n, 101)
+    error = np.abs(dist.cdf(x) - np.array([exact_cdf(n, xi) for xi in x]))
+    assert error.max() < 0.006 / n ** 3
+    assert np.allclose(dist.pdf(x), IrwinHallDistribution(n, exact_max_n=n).pdf(x), rtol=0, atol=0.006 / n ** 2)
+
+
+@pytest.mark.parametrize("n", [1, 5, 40, 41, 1000])
+def test_inverse_cdf(n):
+    dist = IrwinHallDistribution(n)
+    p = np.array([1e-12, 1e-3, 0.1, 0.5, 0.9, 1 - 1e-9])
+    tol = 1e-14 if dist.exact else 0.006 / n ** 3
+    assert np.allclose(dist.cdf(dist.inverse_cdf(p)), p, rtol=1e-12, atol=tol)
+    assert dist.inverse_cdf(0.0) == 0.0 and dist.inverse_cdf(1.0) == n
+
+
+def test_inverse_cdf_lower_tail_is_exact():
+    # F(x) = x^n / n! on [0, 1]
+    assert IrwinHallDistribution(10).inverse_cdf(1e-20) == pytest.approx((1e-20 * factorial(10)) ** 0.1, rel=1e-14)
+
+
+def test_moments():
+    dist = IrwinHallDistribution(12)
+    assert (dist.mean, dist.variance, dist.skewness, dist.kurtosis) == pytest.approx((6.0, 1.0, 0.0, -0.1))
+
+
+def test_outside_support():
+    dist = IrwinHallDistribution(3)
+    assert np.array_equal(dist.pdf([-1.0, 4.0]), [0.0, 0.0])
+    assert np.array_equal(dist.cdf([-1.0, 4.0]), [0.0, 1.0])
+
+
+@pytest.mark.parametrize("n", [1, 5, 41, 500])
+def test_sample(n):
+    dist = IrwinHallDistribution(n)
+    samples = dist.sample(20000, rng=1)
+    assert np.all((samples >= 0) & (samples <= n))
+    assert stats.kstest(samples, dist.cdf).pvalue > 0.001
+
+
+def test_sum_rule():
+    assert IrwinHallDistribution(3) + IrwinHallDistribution(4) == IrwinHallDistribution(7)
+    total = IrwinHallDistribution(3, exact_max_n=60) + IrwinHallDistribution(4, exact_max_n=5)
+    assert total == IrwinHallDistribution(7, exact_max_n=5)
+    assert not total.exact
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        IrwinHallDistribution(0)
+    with pytest.raises(ValueError):
+        IrwinHallDistribution(2.5)
@@ -1,6 +1,7 @@
 from math import sinh, sqrt, isfinite
 import numpy as np
 import pytest
+from scipy.stats import johnsonsu
 
 from sdatools.core.constants import EXP_LIMIT
 from sdatools.distributions.continuous.jsu import JohnsonSUDistribution
@@ -72,6 +73,12 @@ def test_skewness_finite(dist):
 def test_kurtosis_finite(dist):
     assert isfinite(dist.kurtosis)
 
+@pytest.mark.parametrize('dist', [jsu_dist1(), jsu_dist2(), jsu_dist3()])
+def test_moments_match_scipy(dist):
+    ref = johnsonsu(dist.gamma, dist.delta, loc=dist.xi, scale=dist.lam)
+    expected = [float(m) for m in ref.stats('mvsk')]
+    assert np.allclose([dist.mean, dist.variance, dist.skewness, dist.kurtosis], expected, rtol=1e-10)
+
 @pytest.mark.parametrize('dist', [jsu_dist1(), jsu_dist2(), jsu_dist3()])
 def test_variance_positive(dist):
     assert dist.variance > 0
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.continuous.jsu import JohnsonSUDistribution
+from sdatools.distributions.continuous.mixture import MixtureDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.skewnormal import SkewNormalDistribution
+
+
+@pytest.fixture
+def regimes():
+    return MixtureDistribution([NormalDistribution(0.01, 0.1), NormalDistribution(-0.02, 0.3)], [0.8, 0.2])
+
+
+def test_pdf_and_cdf(regimes):
+    x = np.linspace(-1.0, 1.0, 11)
+    expected_pdf = 0.8 * stats.norm.pdf(x, 0.01, 0.1) + 0.2 * stats.norm.pdf(x, -0.02, 0.3)
+    expected_cdf = 0.8 * stats.norm.cdf(x, 0.01, 0.1) + 0.2 * stats.norm.cdf(x, -0.02, 0.3)
+    assert np.allclose(regimes.pdf(x), expected_pdf, atol=1e-6)
+    assert np.allclose(regimes.cdf(x), expected_cdf, atol=1e-6)
+    assert np.isscalar(regimes.pdf(0.0))
+
+
+def test_logpdf_in_far_tail(regimes):
+    x = np.array([-20.0, 0.0, 20.0])
+    expected = np.logaddexp(np.log(0.8) + stats.norm.logpdf(x, 0.01, 0.1), np.log(0.2) + stats.norm.logpdf(x, -0.02, 0.3))
+    assert np.all(np.isfinite(regimes.logpdf(x)))
+    assert np.allclose(regimes.logpdf(x), expected)
+
+
+def test_inverse_cdf_round_trip(regimes):
+    p = np.array([0.001, 0.1, 0.5, 0.9, 0.999])
+    assert np.allclose(regimes.cdf(regimes.inverse_cdf(p)), p, atol=1e-6)
+
+
+def test_moments():
+    x = MixtureDistribution([NormalDistribution(0.0, 1.0), NormalDistribution(3.0, 0.5)], [0.6, 0.4])
+    samples = x.sample(400000, rng=0)
+    assert x.mean == pytest.approx(1.2)
+    assert x.variance == pytest.approx(0.6 * 1.0 + 0.4 * 0.25 + 0.6 * 1.2 ** 2 + 0.4 * 1.8 ** 2)
+    assert x.skewness == pytest.approx(stats.skew(samples), abs=0.02)
+    assert x.kurtosis == pytest.approx(stats.kurtosis(samples), abs=0.05)
+
+
+def test_sample_component_proportions():
+    x = MixtureDistribution([NormalDistribution(-10.0, 1.0), NormalDistribution(10.0, 1.0)], [0.3, 0.7])
+    samples = x.sample(100000, rng=1)
+    assert samples.shape == (100000,)
+    assert np.mean(samples < 0) == pytest.approx(0.3, abs=0.01)
+
+
+def test_mixed_families():
+    x = MixtureDistribution([JohnsonSUDistribution(0.5, 2.0), SkewNormalDistribution(0.0, 1.0, 3.0)], [0.5, 0.5])
+    samples = x.sample(20000, rng=2)
+    assert stats.kstest(samples, x.cdf).pvalue > 0.001
+
+
+def test_affine_map_is_mixture(regimes):
+    y = 2 * regimes + 1
+    assert isinstance(y, MixtureDistribution)
+    assert y.mean == pytest.approx(2 * regimes.mean + 1)
+    assert y.weights == regimes.weights
+
+
+def test_invalid_weights():
+    with pytest.raises(ValueError):
+        MixtureDistribution([NormalDistribution(), NormalDistribution(1.0)], [0.5, 0.6])
+    with pytest.raises(ValueError):
+        MixtureDistribution([NormalDistribution(), NormalDistribution(1.0)], [1.0])
+
+
+def test_component_logpdf_closed_forms():
+    x = np.linspace(-30.0, 30.0, 13)
+    assert np.allclose(NormalDistribution(1.0, 2.0).logpdf(x), stats.norm.logpdf(x, 1.0, 2.0))
+    assert np.allclose(SkewNormalDistribution(0.5, 1.5, -2.0).logpdf(x), stats.skewnorm.logpdf(x, -2.0, 0.5, 1.5))
+    assert np.allclose(JohnsonSUDistribution(0.3, 1.2, 0.1, 0.8).logpdf(x), stats.johnsonsu.logpdf(x, 0.3, 1.2, 0.1, 0.8))
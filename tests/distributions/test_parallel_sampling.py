@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.discrete.binomial import BinomialDistribution
+from sdatools.distributions.sampling.parallel import parallel_sample, spawn_seed_sequences
+
+
+@pytest.mark.parametrize('n_jobs', [2, 3])
+def test_parallel_sample_bit_identical_across_n_jobs(n_jobs):
+    dist = GammaDistribution(2.0, 1.5)
+    serial = parallel_sample(dist, 10_001, n_jobs=1, rng=123, chunk_size=1000)
+    parallel = parallel_sample(dist, 10_001, n_jobs=n_jobs, rng=123, chunk_size=1000)
+    assert np.array_equal(serial, parallel)
+
+
+def test_sample_n_jobs_reproducible():
+    dist = NormalDistribution(0, 1)
+    sample1 = dist.sample(5000, rng=7, n_jobs=1)
+    sample2 = dist.sample(5000, rng=7, n_jobs=2)
+    assert isinstance(sample1, np.ndarray)
+    assert np.array_equal(sample1, sample2)
+
+
+def test_chunks_use_independent_streams():
+    dist = NormalDistribution(0, 1)
+    sample = parallel_sample(dist, 2000, n_jobs=1, rng=0, chunk_size=1000)
+    assert not np.array_equal(sample[:1000], sample[1000:])
+
+
+def test_discrete_parallel_sample():
+    dist = BinomialDistribution(10, 0.5)
+    sample = dist.sample(3000, rng=5, n_jobs=2)
+    assert np.array_equal(sample, dist.sample(3000, rng=5, n_jobs=1))
+    assert sample.dtype == np.int64
+    assert np.all((sample >= 0) & (sample <= 10))
+
+
+def test_spawn_seed_sequences_from_seed():
+    children1 = spawn_seed_sequences(11, 3)
+    children2 = spawn_seed_sequences(11, 3)
+    assert [c.generate_state(1)[0] for c in children1] == [c.generate_state(1)[0] for c in children2]
+
+
+def test_parallel_sample_rejects_variance_reduction():
+    with pytest.raises(ValueError):
+        NormalDistribution().sample(100, method="lhs", n_jobs=2)
+
+
+def test_n_jobs_none_uses_a_single_stream():
+    # Any integer n_jobs, including 1, draws the chunked SeedSequence streams; None draws from rng directly
+    dist = NormalDistribution(0, 1)
+    assert np.array_equal(dist.sample(3000, rng=9), dist._sample(3000, np.random.default_rng(9)))
+    assert np.array_equal(dist.sample(3000, rng=9, n_jobs=1), parallel_sample(dist, 3000, n_jobs=1, rng=9))
+    assert not np.array_equal(dist.sample(3000, rng=9), dist.sample(3000, rng=9, n_jobs=1))
+
+
+def test_parallel_sample_is_not_copied_out_of_shared_memory():
+    sample = parallel_sample(NormalDistribution(0, 1), 4000, n_jobs=2, rng=1, chunk_size=1000)
+    assert not sample.flags.owndata and sample.base is not None
+    assert sample.flags.writeable
+    view = sample[10:20]
+    expected = view.copy()
+    del sample
+    assert np.array_equal(view, expected)
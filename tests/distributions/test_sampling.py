@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from sdatools.distributions.discrete.binomial import BinomialDistribution
@@ -39,7 +40,8 @@ def test_sample_poisson():
     assert len(sample) == sample_size
     
     # Check if all samples are non-negative integers
-    assert all(isinstance(x, int) and x >= 0 for x in sample)
+    assert np.issubdtype(sample.dtype, np.integer)
+    assert all(x >= 0 for x in sample)
 
 
 def test_sample_normal():
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.discrete.poisson import PoissonDistribution
+from sdatools.distributions.sampling.streaming import RunningMoments, RunningHistogram
+
+
+def test_sample_iter_chunk_sizes():
+    chunks = list(NormalDistribution().sample_iter(2500, chunk_size=1000, rng=0))
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+
+def test_sample_iter_reproducible():
+    dist = ExponentialDistribution(2.0)
+    stream1 = np.concatenate(list(dist.sample_iter(3000, chunk_size=700, rng=4)))
+    stream2 = np.concatenate(list(dist.sample_iter(3000, chunk_size=700, rng=4)))
+    assert np.array_equal(stream1, stream2)
+
+
+def test_sample_iter_discrete():
+    chunks = list(PoissonDistribution(3.0).sample_iter(100, chunk_size=30, rng=1))
+    assert sum(len(chunk) for chunk in chunks) == 100
+    assert all(np.all(chunk >= 0) for chunk in chunks)
+
+
+def test_sample_to_file(tmp_path):
+    path = str(tmp_path / "samples.npy")
+    dist = NormalDistribution(1, 2)
+    dist.sample_to_file(path, 5000, chunk_size=1024, rng=9)
+    on_disk = np.load(path, mmap_mode="r")
+    expected = np.concatenate(list(dist.sample_iter(5000, chunk_size=1024, rng=9)))
+    assert on_disk.shape == (5000,)
+    assert np.array_equal(on_disk, expected)
+
+
+def test_running_moments_match_full_data():
+    data = np.random.default_rng(0).gamma(2.0, 1.5, 10_001)
+    moments = RunningMoments()
+    for chunk in np.array_split(data, 7):
+        moments.update(chunk)
+    centred = data - data.mean()
+    variance = np.mean(centred ** 2)
+    assert moments.count == len(data)
+    assert np.isclose(moments.mean, data.mean())
+    assert np.isclose(moments.variance, variance)
+    assert np.isclose(moments.skewness, np.mean(centred ** 3) / variance ** 1.5)
+    assert np.isclose(moments.kurtosis, np.mean(centred ** 4) / variance ** 2 - 3)
+
+
+def test_running_histogram_matches_full_data():
+    data = np.random.default_rng(1).normal(size=5000)
+    edges = np.linspace(-4, 4, 21)
+    histogram = RunningHistogram(edges)
+    for chunk in np.array_split(data, 4):
+        histogram.update(chunk)
+    assert np.array_equal(histogram.counts, np.histogram(data, bins=edges)[0])
+
+
+def test_sample_iter_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        next(NormalDistribution().sample_iter(10, chunk_size=0))
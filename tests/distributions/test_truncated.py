@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.truncated import TruncatedDistribution
+
+
+def test_non_negative_normal():
+    x = TruncatedDistribution(NormalDistribution(), lower=0.0)
+    r = stats.truncnorm(0.0, np.inf)
+    grid = np.linspace(-1.0, 4.0, 11)
+    assert np.allclose(x.pdf(grid), r.pdf(grid), atol=1e-6)
+    assert np.allclose(x.cdf(grid), r.cdf(grid), atol=1e-6)
+    assert x.mean == pytest.approx(r.mean(), abs=1e-6)
+    assert x.variance == pytest.approx(r.var(), abs=1e-6)
+    assert x.skewness == pytest.approx(float(r.stats(moments='s')), abs=1e-5)
+    assert x.domain == [0.0, float('inf')]
+
+
+def test_two_sided_truncation():
+    x = TruncatedDistribution(NormalDistribution(1.0, 2.0), -1.0, 2.0)
+    r = stats.truncnorm(-1.0, 0.5, loc=1.0, scale=2.0)
+    p = np.array([0.0, 0.1, 0.5, 0.9, 1.0])
+    assert np.allclose(x.inverse_cdf(p), r.ppf(p), atol=1e-5)
+    assert x.kurtosis == pytest.approx(float(r.stats(moments='k')), abs=1e-5)
+
+
+def test_capped_gamma():
+    x = TruncatedDistribution(GammaDistribution(2.0, 1.0), upper=3.0)
+    assert x.mass == pytest.approx(stats.gamma.cdf(3.0, 2.0))
+    assert x.pdf(3.5) == 0.0
+    assert x.cdf(3.0) == pytest.approx(1.0)
+
+
+def test_sampling_with_tiny_mass_accepts_every_draw():
+    x = TruncatedDistribution(NormalDistribution(), lower=4.0)
+    samples = x.sample(100000, rng=0)
+    assert x.mass < 1e-4
+    assert samples.shape == (100000,)
+    assert samples.min() >= 4.0
+    assert samples.mean() == pytest.approx(stats.truncnorm(4.0, np.inf).mean(), abs=1e-2)
+
+
+@pytest.mark.parametrize("lower, upper", [(6.0, np.inf), (8.0, np.inf), (10.0, np.inf), (6.0, 7.0),
+                                          (-np.inf, -6.0), (-np.inf, -8.0), (-np.inf, -10.0), (-7.0, -6.0)])
+def test_far_tails_match_truncnorm(lower, upper):
+    x = TruncatedDistribution(NormalDistribution(), lower, upper)
+    r = stats.truncnorm(lower, upper)
+    assert x.mean == pytest.approx(r.mean(), abs=1e-6)
+    assert x.variance == pytest.approx(r.var(), rel=1e-5)
+    p = np.array([0.01, 0.3, 0.7, 0.99])
+    assert np.allclose(x.inverse_cdf(p), r.ppf(p), atol=1e-6)
+    samples = x.sample(100000, rng=0)
+    assert samples.min() >= lower and samples.max() <= upper
+    assert samples.min() == pytest.approx(r.ppf(1e-5), abs=1e-2 if np.isfinite(lower) else 0.5)
+    assert samples.max() == pytest.approx(r.ppf(1 - 1e-5), abs=1e-2 if np.isfinite(upper) else 0.5)
+    # No point mass at the bounds from quantiles clamped to them
+    assert np.unique(samples).size == samples.size
+
+
+def test_normal_survival_function():
+    x = NormalDistribution(1.0, 2.0)
+    grid = np.array([-20.0, 0.0, 5.0, 15.0, 21.0])
+    assert np.allclose(x.sf(grid), stats.norm.sf(grid, 1.0, 2.0), rtol=1e-6, atol=0)
+    assert np.allclose(x.isf(np.array([1e-20, 0.3])), stats.norm.isf([1e-20, 0.3], 1.0, 2.0))
+
+
+def test_logpdf():
+    x = TruncatedDistribution(NormalDistribution(), -1.0, 1.0)
+    grid = np.array([-2.0, 0.0, 0.5])
+    assert np.allclose(x.logpdf(grid), stats.truncnorm(-1.0, 1.0).logpdf(grid), atol=1e-6)
+
+
+def test_affine_map_is_truncated():
+    x = -2 * TruncatedDistribution(GammaDistribution(2.0, 1.0), 1.0, 3.0) + 1
+    assert isinstance(x, TruncatedDistribution)
+    assert (x.lower, x.upper) == (-5.0, -1.0)
+    assert x.cdf(-3.0) == pytest.approx(1 - TruncatedDistribution(GammaDistribution(2.0, 1.0), 1.0, 3.0).cdf(2.0))
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        TruncatedDistribution(NormalDistribution(), 1.0, 0.0)
+    with pytest.raises(ValueError):
+        TruncatedDistribution(GammaDistribution(2.0, 1.0), -2.0, -1.0)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.jsu import JohnsonSUDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.skewnormal import SkewNormalDistribution
+from sdatools.distributions.continuous.uniform import UniformDistribution
+from sdatools.distributions.discrete.binomial import BinomialDistribution
+from sdatools.distributions.sampling.variance_reduction import (
+    antithetic_uniforms,
+    stratified_uniforms,
+    latin_hypercube_uniforms,
+    latin_hypercube_sample,
+)
+
+
+METHODS = ["iid", "antithetic", "stratified", "lhs"]
+
+DISTRIBUTIONS = [
+    NormalDistribution(1, 2),
+    ExponentialDistribution(0.5),
+    GammaDistribution(2.5, 1.5),
+    JohnsonSUDistribution(0.5, 1.5, 0.0, 1.0),
+    LogNormalDistribution(0.0, 0.5),
+    SkewNormalDistribution(0.0, 1.0, 3.0),
+    UniformDistribution(-1, 3),
+]
+
+
+# Uniform designs
+
+def test_antithetic_uniforms_are_paired():
+    u = antithetic_uniforms(10, rng=0)
+    assert np.allclose(u[:5] + u[5:], 1.0)
+
+
+def test_antithetic_uniforms_odd_size():
+    assert len(antithetic_uniforms(7, rng=0)) == 7
+
+
+def test_stratified_uniforms_one_per_stratum():
+    n = 50
+    u = stratified_uniforms(n, rng=0)
+    assert np.array_equal(np.sort(np.floor(u * n)), np.arange(n))
+
+
+def test_stratified_uniforms_are_not_ordered_by_stratum():
+    u = stratified_uniforms(1000, rng=0)
+    assert not np.all(np.diff(u) > 0)
+    assert abs(u[:100].mean() - 0.5) < 0.1
+
+
+def test_latin_hypercube_margins_one_per_stratum():
+    n, dim = 40, 3
+    u = latin_hypercube_uniforms(n, dim, rng=0)
+    assert u.shape == (n, dim)
+    for j in range(dim):
+        assert np.array_equal(np.sort(np.floor(u[:, j] * n)), np.arange(n))
+
+
+# Distribution sampling
+
+@pytest.mark.parametrize('dist', DISTRIBUTIONS)
+@pytest.mark.parametrize('method', METHODS)
+def test_sample_is_array_and_reproducible(dist, method):
+    sample1 = dist.sample(101, method=method, rng=42)
+    sample2 = dist.sample(101, method=method, rng=np.random.default_rng(42))
+    assert isinstance(sample1, np.ndarray)
+    assert sample1.shape == (101,)
+    assert np.array_equal(sample1, sample2)
+
+
+@pytest.mark.parametrize('method', ["antithetic", "stratified", "lhs"])
+def test_variance_reduction_lowers_mean_estimator_noise(method):
+    dist = ExponentialDistribution(1.0)
+    rng = np.random.default_rng(1)
+    iid_means = [dist.sample(200, method="iid", rng=rng).mean() for _ in range(200)]
+    vr_means = [dist.sample(200, method=method, rng=rng).mean() for _ in range(200)]
+    assert np.std(vr_means) < np.std(iid_means)
+
+
+def test_unknown_sampling_method():
+    with pytest.raises(ValueError):
+        NormalDistribution().sample(10, method="sobol")
+
+
+def test_discrete_stratified_sample():
+    dist = BinomialDistribution(10, 0.3)
+    sample = dist.sample(1000, method="stratified", rng=0)
+    assert len(sample) == 1000
+    assert all(0 <= x <= 10 for x in sample)
+    assert abs(np.mean(sample) - dist.mean) < 0.01
+
+
+def test_latin_hypercube_sample_multiple_distributions():
+    dists = [NormalDistribution(0, 1), ExponentialDistribution(2.0), UniformDistribution(0, 10)]
+    sample = latin_hypercube_sample(dists, 500, rng=3)
+    assert sample.shape == (500, 3)
+    assert np.all(sample[:, 1] >= 0)
+    assert np.all((sample[:, 2] >= 0) & (sample[:, 2] <= 10))
+    assert np.array_equal(sample, latin_hypercube_sample(dists, 500, rng=3))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.continuous.weibull import WeibullDistribution
+from sdatools.distributions.sampling.parallel import parallel_sample
+
+
+PARAMETERS = [(0.5, 1.0), (1.0, 2.0), (1.5, 0.3), (3.6, 10.0), (20.0, 1.0)]
+
+
+@pytest.mark.parametrize("k,lam", PARAMETERS)
+def test_pdf_cdf_match_scipy(k, lam):
+    dist, ref = WeibullDistribution(k, lam), stats.weibull_min(k, scale=lam)
+    x = np.linspace(0.01, 3, 100) * lam
+    assert np.allclose(dist.pdf(x), ref.pdf(x), rtol=1e-12)
+    assert np.allclose(dist.logpdf(x), ref.logpdf(x), rtol=1e-12)
+    assert np.allclose(dist.cdf(x), ref.cdf(x), rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize("k,lam", PARAMETERS)
+def test_inverse_cdf_matches_scipy(k, lam):
+    dist, ref = WeibullDistribution(k, lam), stats.weibull_min(k, scale=lam)
+    p = np.concatenate(([0.0, 1e-12], np.linspace(0.01, 0.99, 99), [1 - 1e-12]))
+    assert np.allclose(dist.inverse_cdf(p), ref.ppf(p), rtol=1e-12, atol=0)
+    assert dist.inverse_cdf(1.0) == np.inf
+
+
+@pytest.mark.parametrize("k,lam", PARAMETERS)
+def test_moments_match_scipy(k, lam):
+    dist = WeibullDistribution(k, lam)
+    mean, var, skew, kurt = stats.weibull_min.stats(k, scale=lam, moments='mvsk')
+    assert (dist.mean, dist.variance, dist.skewness, dist.kurtosis) == pytest.approx((mean, var, skew, kurt), rel=1e-9)
+
+
+def test_outside_support():
+    dist = WeibullDistribution(2.0, 1.0)
+    assert np.array_equal(dist.pdf([-1.0, 0.0]), [0.0, 0.0])
+    assert np.array_equal(dist.cdf([-1.0, 0.0]), [0.0, 0.0])
+    assert dist.logpdf(-1.0) == -np.inf
+    assert WeibullDistribution(1.0, 2.0).pdf(0.0) == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("k,lam", PARAMETERS)
+def test_sample(k, lam):
+    samples = WeibullDistribution(k, lam).sample(20000, rng=1)
+    assert np.all(samples >= 0)
+    assert stats.kstest(samples, stats.weibull_min(k, scale=lam).cdf).pvalue > 0.001
+
+
+def test_sample_into_preallocated_buffer():
+    dist = WeibullDistribution(1.5, 2.0)
+    out = np.empty(1000)
+    dist._sample_into(out, np.random.default_rng(3))
+    assert np.array_equal(out, dist.sample(1000, rng=3))
+
+    # Non-contiguous and single precision buffers are filled through a temporary
+    strided = np.empty(2000)[::2]
+    dist._sample_into(strided, np.random.default_rng(3))
+    assert np.array_equal(strided, out)
+    single = np.empty(1000, dtype=np.float32)
+    dist._sample_into(single, np.random.default_rng(3))
+    assert np.allclose(single, out, rtol=1e-6)
+
+
+def test_parallel_sample_matches_serial():
+    dist = WeibullDistribution(0.8, 5.0)
+    serial = parallel_sample(dist, 50000, n_jobs=1, rng=4, chunk_size=8192)
+    assert np.array_equal(parallel_sample(dist, 50000, n_jobs=2, rng=4, chunk_size=8192), serial)
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        WeibullDistribution(0.0, 1.0)
+    with pytest.raises(ValueError):
+        WeibullDistribution(1.0, -1.0)
+    with pytest.raises(ValueError):
+        WeibullDistribution().inverse_cdf(1.5)
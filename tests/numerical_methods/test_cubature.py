@@ -0,0 +1,132 @@
+from math import exp, pi, sqrt
+import numpy as np
+import pytest
+
+from sdatools.numerical_methods.cubature.quasi_monte_carlo import QuasiMonteCarloIntegrator
+from sdatools.numerical_methods.cubature.sparse_grid import SparseGridIntegrator
+from sdatools.numerical_methods.quadrature.rules.composite import CompositeRule
+from sdatools.numerical_methods.quadrature.rules.gaussian import GaussHermiteRule
+from sdatools.numerical_methods.quadrature.rules.trapezium import TrapeziumRule
+
+
+def test_sparse_grid_is_exact_for_polynomials_of_total_degree_2L_minus_1():
+    d, level = 4, 3
+    x, w = SparseGridIntegrator().points_and_weights(-np.ones(d), np.ones(d), level)
+    # Monomials of total degree 4 and 5 over [-1, 1]^4, with exact integrals 2^4 * prod(1 / (k + 1)) for even k
+    assert np.sum(x[:, 0] ** 2 * x[:, 1] ** 2 * w) == pytest.approx(16 / 9, rel=1e-13)
+    assert np.sum(x[:, 3] ** 4 * w) == pytest.approx(16 / 5, rel=1e-13)
+    assert np.sum(x[:, 0] ** 2 * x[:, 1] ** 2 * x[:, 2] * w) == pytest.approx(0.0, abs=1e-13)
+
+
+def test_sparse_grid_is_far_smaller_than_the_tensor_product():
+    x, w = SparseGridIntegrator().points_and_weights(np.zeros(10), np.ones(10), 4)
+    assert len(np.unique(x, axis=0)) == len(x) == len(w)
+    assert len(x) < 2000 < 4 ** 10
+    assert w.sum() == pytest.approx(1.0, rel=1e-13)
+
+
+def test_sparse_grid_integrates_smooth_functions_in_several_dimensions():
+    d = 8
+    result = SparseGridIntegrator(rel_tol=1e-10).integrate(lambda x: np.exp(0.5 * x.sum(axis=1)), np.zeros(d), np.ones(d))
+    assert result.converged
+    assert result.value == pytest.approx((2 * (exp(0.5) - 1)) ** d, rel=1e-9)
+
+
+def test_sparse_grid_reuses_points_of_nested_rules():
+    calls = []
+    def f(x):
+        calls.append(np.array(x))
+        return np.cos(x[:, 0]) * np.cos(x[:, 1])
+
+    # Composite trapezium rules with 2^(i - 1) cells are nested, so every level only adds new points
+    rule = lambda i: CompositeRule(TrapeziumRule(), 2 ** (i - 1))
+    result = SparseGridIntegrator(rule, abs_tol=0.0, rel_tol=0.0, min_level=1, max_level=5).integrate(f, [0, 0], [1, 1])
+    points = np.concatenate(calls)
+    assert len(np.unique(points, axis=0)) == len(points) == result.evaluations
+    final, _ = SparseGridIntegrator(rule).points_and_weights([0, 0], [1, 1], 5)
+    assert result.evaluations == len(final)
+    assert result.value == pytest.approx(np.sin(1.0) ** 2, rel=1e-3)
+
+
+def test_sparse_grid_normal_expectation_with_correlation():
+    cov = np.array([[1.0, 0.5, 0.2], [0.5, 2.0, 0.3], [0.2, 0.3, 0.5]])
+    mean = np.array([0.1, -0.2, 0.3])
+    t = np.array([0.3, -0.1, 0.2])
+    result = SparseGridIntegrator(GaussHermiteRule, rel_tol=1e-12).expect_normal(lambda x: np.exp(x @ t), mean, cov)
+    assert result.converged
+    assert result.value == pytest.approx(exp(t @ mean + t @ cov @ t / 2), rel=1e-11)
+
+
+def test_sparse_grid_returns_an_array_for_array_valued_integrands():
+    result = SparseGridIntegrator().integrate(lambda x: np.stack((x[:, 0], x[:, 0] * x[:, 1])), [0, 0], [1, 2])
+    assert result.value == pytest.approx([1.0, 1.0], rel=1e-13)
+
+
+def test_sparse_grid_validates_inputs():
+    with pytest.raises(ValueError):
+        SparseGridIntegrator(min_level=0)
+    with pytest.raises(ValueError):
+        SparseGridIntegrator().integrate(np.sum, [0, 0], [1, 1, 1])
+    with pytest.raises(ValueError):
+        SparseGridIntegrator().expect_normal(np.sum, [0, 0], np.eye(2))
+    with pytest.raises(ValueError):
+        SparseGridIntegrator(GaussHermiteRule).expect_normal(np.sum, [0, 0], [[1, 2], [2, 1]])
+
+
+def test_sparse_grid_level_counts():
+    # The level 2 grid of d Gauss-Legendre factors has the centre plus two points on each axis
+    for d in (2, 3, 6):
+        x, _ = SparseGridIntegrator().points_and_weights(np.zeros(d), np.ones(d), 2)
+        assert len(x) == 2 * d + 1
+
+
+def test_qmc_estimate_is_within_its_standard_error():
+    d = 10
+    exact = (2 * (exp(0.5) - 1)) ** d
+    result = QuasiMonteCarloIntegrator(rel_tol=1e-5, rng=0).integrate(lambda x: np.exp(0.5 * x.sum(axis=1)), np.zeros(d), np.ones(d))
+    assert result.converged
+    assert result.error <= 1e-5 * exact
+    assert abs(result.value - exact) <= 5 * result.error
+
+
+def test_qmc_is_reproducible_and_evaluates_each_batch_in_one_call():
+    calls = []
+    def f(x):
+        calls.append(x.shape)
+        return np.sin(x).sum(axis=1)
+
+    integrator = QuasiMonteCarloIntegrator(abs_tol=0.0, rel_tol=0.0, randomisations=8, min_points=64, max_points=512, rng=42)
+    first = integrator.integrate(f, np.zeros(3), np.ones(3))
+    assert calls == [(8 * 64, 3), (8 * 64, 3), (8 * 128, 3), (8 * 256, 3)]
+    assert first.evaluations == 8 * 512
+    assert not first.converged
+    assert integrator.integrate(f, np.zeros(3), np.ones(3)) == first
+    assert first.value == pytest.approx(3 * (1 - np.cos(1.0)), rel=1e-5)
+
+
+def test_qmc_error_falls_faster_than_monte_carlo():
+    f = lambda x: np.prod(1 + 0.5 * (x - 0.5), axis=1)
+    small = QuasiMonteCarloIntegrator(abs_tol=0.0, rel_tol=0.0, min_points=2 ** 8, max_points=2 ** 8, rng=1)
+    large = QuasiMonteCarloIntegrator(abs_tol=0.0, rel_tol=0.0, min_points=2 ** 8, max_points=2 ** 14, rng=1)
+    ratio = small.integrate(f, np.zeros(5), np.ones(5)).error / large.integrate(f, np.zeros(5), np.ones(5)).error
+    # 64 times the points: plain Monte Carlo would reduce the error by a factor of 8
+    assert ratio > 16
+
+
+def test_qmc_normal_expectation_in_twenty_dimensions():
+    d = 20
+    cov = 0.5 * np.eye(d) + 0.5
+    result = QuasiMonteCarloIntegrator(rel_tol=1e-3, rng=7).expect_normal(lambda x: np.maximum(x.mean(axis=1), 0), np.zeros(d), cov)
+    # The mean of X is N(0, s^2), and E[max(Y, 0)] = s / sqrt(2 pi)
+    exact = sqrt(cov.sum()) / d / sqrt(2 * pi)
+    assert result.converged
+    assert abs(result.value - exact) <= 5 * result.error
+
+
+def test_qmc_validates_inputs():
+    with pytest.raises(ValueError):
+        QuasiMonteCarloIntegrator(min_points=100)
+    with pytest.raises(ValueError):
+        QuasiMonteCarloIntegrator(randomisations=1)
+    with pytest.raises(ValueError):
+        QuasiMonteCarloIntegrator().integrate(np.sum, [0, -np.inf], [1, 1])
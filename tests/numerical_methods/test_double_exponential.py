@@ -0,0 +1,96 @@
+from math import exp, pi, sqrt
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.numerical_methods.quadrature.double_exponential import DoubleExponentialIntegrator
+from sdatools.numerical_methods.quadrature.quadrature_engine import QuadratureResult
+
+
+@pytest.mark.parametrize("f,a,b,expected", [
+    (np.exp, 0.0, 1.0, exp(1.0) - 1),
+    (lambda x: x ** -0.9, 0.0, 1.0, 10.0),
+    (np.log, 0.0, 1.0, -1.0),
+    (stats.gamma(0.5).pdf, 0.0, np.inf, 1.0),
+    (lambda x: np.exp(-x), 1.0, np.inf, exp(-1.0)),
+    (lambda x: 1 / (1 + x * x), 0.0, np.inf, pi / 2),
+    (stats.norm.pdf, -np.inf, 0.0, 0.5),
+    (stats.norm.pdf, -np.inf, np.inf, 1.0),
+    (stats.cauchy.pdf, -np.inf, np.inf, 1.0),
+    (stats.t(1.5).pdf, -np.inf, np.inf, 1.0),
+])
+def test_converges_on_singular_and_infinite_domains(f, a, b, expected):
+    result = DoubleExponentialIntegrator().integrate(f, a, b)
+    assert isinstance(result, QuadratureResult)
+    assert result.converged
+    assert result.value == pytest.approx(expected, rel=1e-11, abs=1e-13)
+    assert result.evaluations < 600
+
+
+def test_each_level_evaluates_only_new_nodes():
+    calls = []
+    def f(x):
+        calls.append(np.array(x))
+        return 1 / (1 + x * x)
+
+    result = DoubleExponentialIntegrator(abs_tol=0.0, rel_tol=0.0, max_levels=4).integrate(f, -1.0, 1.0)
+    assert not result.converged
+    assert len(calls) == 5
+    nodes = np.concatenate(calls)
+    assert nodes.size == result.evaluations
+    # Nodes within rounding of the limits coincide in x, so check the interior ones are distinct
+    interior = nodes[np.abs(nodes) < 1 - 1e-12]
+    assert interior.size == len(np.unique(interior))
+    assert result.value == pytest.approx(pi / 2, rel=1e-14)
+
+
+def test_nodes_resolve_the_region_next_to_a_finite_limit():
+    calls = []
+    def f(x):
+        calls.append(np.array(x))
+        return np.ones_like(x)
+
+    DoubleExponentialIntegrator().integrate(f, 0.0, 1.0)
+    assert np.concatenate(calls).min() < 1e-200
+
+
+def test_centre_and_scale_of_infinite_transforms():
+    dist = stats.norm(1e3, 1e-2)
+    result = DoubleExponentialIntegrator().integrate(dist.pdf, -np.inf, np.inf, centre=1e3, scale=1e-2)
+    assert result.value == pytest.approx(1.0, rel=1e-12)
+    with pytest.raises(ValueError):
+        DoubleExponentialIntegrator().integrate(dist.pdf, -np.inf, np.inf, scale=0.0)
+
+
+def test_array_valued_integrands_and_reversed_limits():
+    integrator = DoubleExponentialIntegrator()
+    moments = integrator.integrate(lambda x: np.stack([x, x ** 2]) * stats.norm.pdf(x), -np.inf, np.inf).value
+    assert np.allclose(moments, [0.0, 1.0], atol=1e-13)
+    assert integrator.integrate(lambda x: np.sqrt(x), 1.0, 0.0).value == pytest.approx(-2 / 3, rel=1e-13)
+    assert integrator.integrate(np.exp, 2.0, 2.0) == QuadratureResult(0.0, 0.0, 0, True)
+
+
+def test_distribution_domains_can_be_passed_directly():
+    from sdatools.distributions.continuous.gamma import GammaDistribution
+    dist = GammaDistribution(0.3, 1.0)
+    result = DoubleExponentialIntegrator().integrate(lambda x: x * dist.pdf(x), *dist.domain)
+    assert result.value == pytest.approx(dist.mean, rel=1e-10)
+    assert sqrt(result.error) < 1e-5
+
+
+@pytest.mark.parametrize("f,a,b", [
+    (lambda x: np.full_like(x, np.inf), 0.0, 1.0),
+    (lambda x: np.where(np.abs(x - 0.5) < 0.01, np.nan, 1.0), 0.0, 1.0),
+    (lambda x: np.where(np.abs(x - 3.0) < 1.0, np.inf, np.exp(-x)), 0.0, np.inf),
+])
+def test_non_finite_values_in_the_bulk_are_not_dropped(f, a, b):
+    result = DoubleExponentialIntegrator().integrate(f, a, b)
+    assert not result.converged
+    assert not np.isfinite(result.value)
+
+
+def test_non_finite_values_at_a_singular_limit_are_dropped():
+    # The outermost nodes round onto x = 0, where the integrand is infinite
+    result = DoubleExponentialIntegrator().integrate(lambda x: 0.5 / np.sqrt(x), 0.0, 1.0)
+    assert result.converged
+    assert result.value == pytest.approx(1.0, rel=1e-12)
@@ -0,0 +1,90 @@
+from math import exp, gamma
+import numpy as np
+import pytest
+from scipy import special, stats
+
+from sdatools.numerical_methods.quadrature.rules.gaussian import GaussLegendreRule, GaussHermiteRule, GaussLaguerreRule
+from sdatools.numerical_methods.quadrature.rules.composite import CompositeRule
+
+
+# Nodes and weights
+
+@pytest.mark.parametrize("n", [1, 2, 5, 20, 64])
+def test_nodes_and_weights_match_scipy(n):
+    for rule, (x, w) in [(GaussLegendreRule(n), special.roots_legendre(n)),
+                         (GaussHermiteRule(n), special.roots_hermite(n)),
+                         (GaussLaguerreRule(n, 0.7), special.roots_genlaguerre(n, 0.7))]:
+        assert np.allclose(rule.nodes, x, rtol=1e-13, atol=1e-14)
+        # Relative accuracy of every weight, including the tiny weights of the outermost nodes
+        assert np.allclose(rule.weights, w, rtol=1e-11, atol=0)
+
+
+def test_nodes_are_cached_and_read_only():
+    rule = GaussHermiteRule(30)
+    assert rule.nodes is GaussHermiteRule(30).nodes
+    with pytest.raises(ValueError):
+        rule.weights[0] = 1.0
+
+
+# Exactness
+
+@pytest.mark.parametrize("n", [1, 3, 8])
+def test_gauss_legendre_exact_to_degree_2n_minus_1(n):
+    rule = GaussLegendreRule(n)
+    for degree in range(2 * n):
+        expected = (2.0 ** (degree + 1) - 1) / (degree + 1)
+        assert rule.integrate(lambda x: x ** degree, 1.0, 2.0) == pytest.approx(expected, rel=1e-13)
+
+
+@pytest.mark.parametrize("n", [1, 3, 8])
+def test_gauss_hermite_exact_to_degree_2n_minus_1(n):
+    rule = GaussHermiteRule(n)
+    for degree in range(2 * n):
+        # ∫ x^d exp(-x^2) dx = Gamma((d + 1) / 2) for even d, 0 for odd d
+        expected = gamma((degree + 1) / 2) if degree % 2 == 0 else 0.0
+        assert rule.integrate(lambda x: x ** degree, -np.inf, np.inf) == pytest.approx(expected, rel=1e-13, abs=1e-11)
+
+
+@pytest.mark.parametrize("n", [1, 3, 8])
+def test_gauss_laguerre_exact_to_degree_2n_minus_1(n):
+    rule = GaussLaguerreRule(n, alpha=1.5)
+    for degree in range(2 * n):
+        # ∫_a^inf x^d (x - a)^alpha exp(-(x - a)) dx with a = 0
+        assert rule.integrate(lambda x: x ** degree, 0.0, np.inf) == pytest.approx(gamma(degree + 2.5), rel=1e-12)
+
+
+# Expectations
+
+def test_normal_expectations_with_20_nodes():
+    rule = GaussHermiteRule(20)
+    mu, sigma = 0.5, 1.5
+    assert rule.expect(lambda x: np.exp(x), mu, sigma) == pytest.approx(exp(mu + sigma ** 2 / 2), rel=1e-13)
+    assert np.allclose(rule.expect(lambda x: np.stack([x, (x - mu) ** 2, (x - mu) ** 4]), mu, sigma),
+                       [mu, sigma ** 2, 3 * sigma ** 4], rtol=1e-13)
+
+
+def test_gamma_expectations_with_20_nodes():
+    k, theta = 3.5, 2.0
+    rule = GaussLaguerreRule(20, alpha=k - 1)
+    ref = stats.gamma(k, scale=theta)
+    assert rule.expect(lambda x: x, theta) == pytest.approx(ref.mean(), rel=1e-13)
+    assert rule.expect(lambda x: np.exp(-x), theta) == pytest.approx((1 + theta) ** -k, rel=1e-8)
+
+
+def test_composite_gauss_legendre():
+    composite_rule = CompositeRule(GaussLegendreRule(5), 4)
+    assert len(composite_rule.nodes) == 20
+    assert composite_rule.integrate(np.exp, 0.0, 4.0) == pytest.approx(exp(4.0) - 1, rel=1e-11)
+
+
+# Validation
+
+def test_invalid_rules_raise():
+    with pytest.raises(ValueError):
+        GaussLegendreRule(0)
+    with pytest.raises(ValueError):
+        GaussLaguerreRule(5, alpha=-1.0)
+    with pytest.raises(ValueError):
+        GaussHermiteRule(5).integrate(np.exp, 0.0, 1.0)
+    with pytest.raises(ValueError):
+        GaussLaguerreRule(5).integrate(np.exp, 0.0, 1.0)
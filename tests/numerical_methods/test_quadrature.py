@@ -1,5 +1,7 @@
-from math import isclose
+from math import isclose, cos
 from typing import Callable
+import numpy as np
+import pytest
 
 from sdatools.numerical_methods.quadrature.rules.trapezium import TrapeziumRule
 from sdatools.numerical_methods.quadrature.rules.simpson import SimpsonRule, Simpson38Rule
@@ -78,6 +80,110 @@ def test_composite_boole_rule_exact_on_linear_functions():
     check_composite_rules(rule=boole_rule, checking_function=check_quintic_functions)
 
 
+# Nodes, weights and vectorised evaluation
+
+@pytest.mark.parametrize("rule", [TrapeziumRule(), SimpsonRule(), Simpson38Rule(), BooleRule()])
+def test_reference_nodes_and_weights(rule):
+    """
+    Test that each rule has nodes spanning [-1, 1] and weights summing to the interval length
+    """
+    assert rule.nodes[0] == -1 and rule.nodes[-1] == 1
+    assert len(rule.nodes) == len(rule.weights) == rule.order + 1
+    assert isclose(rule.weights.sum(), 2.0)
+
+
+@pytest.mark.parametrize("rule", [TrapeziumRule(), SimpsonRule(), Simpson38Rule(), BooleRule()])
+def test_composite_rule_shares_endpoints_in_one_call(rule):
+    """
+    Test that a composite rule evaluates f once, on n * order + 1 distinct nodes
+    """
+    calls = []
+    def f(x):
+        calls.append(x)
+        return np.sin(x)
+
+    composite_rule = CompositeRule(rule=rule, num_subintervals=16)
+    integral = composite_rule.integrate(f, 0.0, 2.0)
+    assert len(calls) == 1
+    x = calls[0]
+    assert len(x) == 16 * rule.order + 1 and len(np.unique(x)) == len(x)
+    assert x[0] == 0.0 and x[-1] == 2.0
+    assert isclose(integral, 1 - cos(2.0), rel_tol=1e-2)
+
+
+def test_composite_rule_matches_sum_over_subintervals():
+    """
+    Test that the shared-node composite rule agrees with applying the rule to each subinterval in turn
+    """
+    boole_rule = BooleRule()
+    edges = np.linspace(-1.0, 3.0, 12)
+    expected = sum(boole_rule.integrate(np.exp, lo, hi) for lo, hi in zip(edges[:-1], edges[1:]))
+    assert isclose(CompositeRule(boole_rule, 11).integrate(np.exp, -1.0, 3.0), expected, rel_tol=1e-14)
+
+
+def test_integrate_array_valued_and_constant_functions():
+    """
+    Test that f may return one row per integrand, or a constant
+    """
+    composite_rule = CompositeRule(SimpsonRule(), 8)
+    integrals = composite_rule.integrate(lambda x: np.stack([np.ones_like(x), x, x ** 2]), 0.0, 3.0)
+    assert np.allclose(integrals, [3.0, 4.5, 9.0])
+    assert isclose(composite_rule.integrate(lambda x: 2.0, 0.0, 3.0), 6.0)
+
+
+# Batched and cumulative integration
+
+def test_integrate_batch_over_limits_and_parameters():
+    """
+    Test that integrate_batch matches integrate for each problem, with one call of f
+    """
+    calls = []
+    def f(x, s):
+        calls.append(x.shape)
+        return np.exp(-s * x)
+
+    rule = CompositeRule(BooleRule(), 16)
+    upper = np.linspace(0.5, 2.0, 7)
+    rates = np.array([[0.5], [1.0], [3.0]])
+    integrals = rule.integrate_batch(f, 0.0, upper, rates)
+    assert integrals.shape == (3, 7)
+    assert calls == [(21, len(rule.nodes))]
+    for i, s in enumerate(rates.ravel()):
+        for j, b in enumerate(upper):
+            assert isclose(integrals[i, j], rule.integrate(lambda x: np.exp(-s * x), 0.0, b), rel_tol=1e-14)
+            assert isclose(integrals[i, j], (1 - np.exp(-s * b)) / s, rel_tol=1e-6)
+
+
+def test_integrate_batch_with_constant_function():
+    """
+    Test that a constant integrand is broadcast over the batch
+    """
+    assert np.allclose(SimpsonRule().integrate_batch(lambda x: 1.0, [0.0, 1.0], [2.0, 4.0]), [2.0, 3.0])
+
+
+@pytest.mark.parametrize("rule", [TrapeziumRule(), SimpsonRule(), BooleRule(), CompositeRule(Simpson38Rule(), 3)])
+def test_integrate_cumulative_evaluates_grid_points_once(rule):
+    """
+    Test that integrate_cumulative gives the running integrals, evaluating each distinct node once
+    """
+    calls = []
+    def f(x):
+        calls.append(np.array(x))
+        return np.cos(x)
+
+    grid = np.linspace(0.0, 3.0, 61)
+    cumulative = rule.integrate_cumulative(f, grid)
+    assert cumulative[0] == 0.0
+    assert np.allclose(cumulative, np.sin(grid), atol=1e-3)
+    assert len(calls) == 1
+    assert len(np.unique(calls[0])) == calls[0].size == 60 * (len(rule.nodes) - 1) + 1
+
+
+def test_integrate_cumulative_rejects_short_grid():
+    with pytest.raises(ValueError):
+        SimpsonRule().integrate_cumulative(np.cos, [0.0])
+
+
 # Helper functions
 
 def check_linear_functions(rule: QuadratureRule):
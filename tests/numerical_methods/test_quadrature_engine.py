@@ -0,0 +1,120 @@
+from math import cos, exp, pi, sqrt
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.numerical_methods.quadrature.quadrature_engine import QuadratureEngine, QuadratureResult
+from sdatools.numerical_methods.quadrature.rules.gauss_kronrod import GaussKronrodRule
+
+
+# Gauss-Kronrod rule
+
+def test_gauss_kronrod_rule_exact_on_degree_22_polynomials():
+    rule = GaussKronrodRule()
+    for degree in range(23):
+        expected = (1 - (-1) ** (degree + 1)) / (degree + 1)
+        assert rule.integrate(lambda x: x ** degree, -1.0, 1.0) == pytest.approx(expected, abs=1e-14)
+
+
+def test_embedded_gauss_rule_is_7_point_gauss_legendre():
+    rule = GaussKronrodRule()
+    gauss_nodes, gauss_weights = np.polynomial.legendre.leggauss(7)
+    used = rule.gauss_weights > 0
+    assert np.allclose(rule.nodes[used], gauss_nodes, atol=1e-15)
+    assert np.allclose(rule.gauss_weights[used], gauss_weights, atol=1e-15)
+
+
+# Adaptive integration
+
+@pytest.mark.parametrize("f,a,b,expected", [
+    (np.sin, 0.0, 100.0, 1 - cos(100.0)),
+    (lambda x: np.exp(-((x - 0.3) / 1e-3) ** 2), 0.0, 1.0, sqrt(pi) * 1e-3),
+    (lambda x: x ** -0.5, 0.0, 1.0, 2.0),
+    (np.log, 0.0, 1.0, -1.0),
+    (stats.norm.pdf, -np.inf, np.inf, 1.0),
+    (stats.t(1.5).pdf, -np.inf, np.inf, 1.0),
+    (lambda x: np.exp(-x), 1.0, np.inf, exp(-1.0)),
+    (stats.norm.pdf, -np.inf, 0.0, 0.5),
+])
+def test_adaptive_integration_meets_tolerance(f, a, b, expected):
+    result = QuadratureEngine(abs_tol=1e-10, rel_tol=1e-10).integrate(f, a, b)
+    assert isinstance(result, QuadratureResult)
+    assert result.converged
+    assert result.error <= 1e-10 * max(1.0, abs(expected))
+    assert result.value == pytest.approx(expected, rel=1e-9, abs=1e-12)
+    assert result.evaluations % 15 == 0
+
+
+def test_adaptive_integration_uses_few_evaluations_on_smooth_integrands():
+    result = QuadratureEngine().integrate(np.exp, 0.0, 1.0)
+    assert result.evaluations == 15
+    assert result.value == pytest.approx(exp(1.0) - 1, rel=1e-14)
+
+
+def test_evaluation_budget_is_respected():
+    result = QuadratureEngine(abs_tol=1e-14, rel_tol=0.0, max_evaluations=200).integrate(lambda x: x ** -0.5, 0.0, 1.0)
+    assert not result.converged
+    assert result.evaluations <= 200
+    assert abs(result.value - 2.0) <= result.error
+
+
+def test_each_batch_is_one_vectorised_call():
+    calls = []
+    def f(x):
+        calls.append(x.size)
+        return np.abs(x - 0.3) ** 0.5
+    result = QuadratureEngine(batch_size=64).integrate(f, 0.0, 1.0)
+    assert sum(calls) == result.evaluations
+    assert len(calls) < result.evaluations // 30
+
+
+def test_reversed_and_empty_limits():
+    engine = QuadratureEngine()
+    assert engine.integrate(np.exp, 1.0, 0.0).value == pytest.approx(1 - exp(1.0), rel=1e-14)
+    assert engine.integrate(np.exp, 2.0, 2.0) == QuadratureResult(0.0, 0.0, 0, True)
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError):
+        QuadratureEngine(abs_tol=-1.0)
+    with pytest.raises(ValueError):
+        QuadratureEngine(batch_size=0)
+    with pytest.raises(ValueError):
+        QuadratureEngine(batch_size=8, min_batch_size=16)
+    with pytest.raises(ValueError):
+        QuadratureEngine(n_jobs=0)
+    with pytest.raises(ValueError):
+        QuadratureEngine(backend="mpi")
+
+
+# Parallel evaluation
+
+def test_parallel_result_does_not_depend_on_number_of_workers():
+    f = lambda x: np.abs(x - 0.3) ** 0.5 * np.exp(-x * x)
+    results = [QuadratureEngine(abs_tol=1e-12, rel_tol=1e-12, initial_subintervals=4, min_batch_size=4,
+                                n_jobs=n_jobs).integrate(f, -np.inf, np.inf) for n_jobs in (1, 2, 3, 4)]
+    assert results[0].converged
+    assert all(result == results[0] for result in results[1:])
+
+
+def test_parallel_batches_are_split_across_workers():
+    calls = []
+    def f(x):
+        calls.append(x.size)
+        return np.sin(x) ** 2
+    result = QuadratureEngine(abs_tol=1e-13, rel_tol=1e-13, initial_subintervals=4, min_batch_size=4,
+                              n_jobs=4).integrate(f, 0.0, 10.0)
+    assert sum(calls) == result.evaluations
+    # Every batch has at least 4 subintervals (8 after bisection), so each worker gets a whole number of them
+    assert set(calls) <= {15, 30, 45, 60}
+    assert result.value == pytest.approx(5 - np.sin(20.0) / 4, rel=1e-12)
+
+
+def test_process_backend_matches_serial_result():
+    pdf = NormalDistribution(mu=0.5, sigma=2.0).pdf
+    engine = dict(abs_tol=1e-12, rel_tol=1e-12, initial_subintervals=2, min_batch_size=2)
+    serial = QuadratureEngine(**engine).integrate(pdf, 0.0, np.inf)
+    parallel = QuadratureEngine(**engine, n_jobs=2, backend="process").integrate(pdf, 0.0, np.inf)
+    assert parallel == serial
+    assert serial.value == pytest.approx(stats.norm(0.5, 2.0).sf(0.0), rel=1e-10)
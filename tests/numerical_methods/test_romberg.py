@@ -0,0 +1,54 @@
+from math import exp, pi
+import numpy as np
+import pytest
+
+from sdatools.numerical_methods.quadrature.romberg import RombergIntegrator, RombergResult
+from sdatools.numerical_methods.quadrature.rules.trapezium import TrapeziumRule
+from sdatools.numerical_methods.quadrature.rules.composite import CompositeRule
+
+
+def test_romberg_converges_on_smooth_integrands():
+    result = RombergIntegrator(abs_tol=1e-12, rel_tol=1e-12).integrate(np.exp, 0.0, 1.0)
+    assert isinstance(result, RombergResult)
+    assert result.converged
+    assert result.value == pytest.approx(exp(1.0) - 1, rel=1e-14)
+    assert result.error <= 1e-12
+
+
+def test_each_level_evaluates_only_new_midpoints():
+    points = []
+    def f(x):
+        points.append(np.array(x))
+        return np.sin(x)
+
+    result = RombergIntegrator().integrate(f, 0.0, pi)
+    levels = result.table.shape[0] - 1
+    assert len(points) == levels + 1
+    assert result.evaluations == 2 ** levels + 1 == sum(p.size for p in points)
+    all_points = np.concatenate(points)
+    assert len(np.unique(all_points)) == all_points.size
+    assert result.value == pytest.approx(2.0, rel=1e-12)
+
+
+def test_first_column_is_composite_trapezium_rule():
+    result = RombergIntegrator(min_levels=5, max_levels=5, abs_tol=0.0, rel_tol=0.0).integrate(np.cos, 0.0, 2.0)
+    for k in range(6):
+        expected = CompositeRule(TrapeziumRule(), 2 ** k).integrate(np.cos, 0.0, 2.0)
+        assert result.table[k, 0] == pytest.approx(expected, rel=1e-14)
+    assert np.isnan(result.table[0, 1])
+    assert not result.converged
+
+
+def test_extrapolation_exact_for_polynomials():
+    # R(k, j) is exact for degree 2j + 1, so R(2, 2) integrates quintics exactly
+    result = RombergIntegrator(min_levels=2, max_levels=2).integrate(lambda x: x ** 5 - 2 * x ** 2, -1.0, 2.0)
+    assert result.table[2, 2] == pytest.approx(64 / 6 - 1 / 6 - 2 * 9 / 3, rel=1e-14)
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        RombergIntegrator().integrate(np.exp, 0.0, np.inf)
+    with pytest.raises(ValueError):
+        RombergIntegrator(min_levels=5, max_levels=4)
+    with pytest.raises(ValueError):
+        RombergIntegrator(rel_tol=-1.0)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sdatools.distributions.continuous.normal import NormalDistribution
+from sdatools.distributions.continuous.exponential import ExponentialDistribution
+from sdatools.distributions.continuous.lognormal import LogNormalDistribution
+from sdatools.distributions.continuous.gamma import GammaDistribution
+from sdatools.distributions.continuous.weibull import WeibullDistribution
+from sdatools.parameter_estimation.maximum_likelihood import MaximumLikelihood
+
+
+def test_maximum_likelihood_normal():
+    data = NormalDistribution(4, 3).sample(1000, rng=0)
+    fitted = MaximumLikelihood(data).fit(NormalDistribution)
+    assert fitted.mean == pytest.approx(np.mean(data))
+    assert fitted.stddev == pytest.approx(np.std(data))
+
+
+def test_maximum_likelihood_exponential():
+    fitted = MaximumLikelihood([1, 2, 3, 4, 5]).fit(ExponentialDistribution())
+    assert isinstance(fitted, ExponentialDistribution)
+    assert fitted.mean == pytest.approx(3)
+
+
+def test_maximum_likelihood_lognormal():
+    data = LogNormalDistribution(1.0, 0.5).sample(1000, rng=1)
+    fitted = MaximumLikelihood(data).fit(LogNormalDistribution)
+    mu, sigma = np.mean(np.log(data)), np.std(np.log(data))
+    assert (fitted.mu, fitted.sigma) == pytest.approx((mu, sigma))
+
+
+@pytest.mark.parametrize("k,lam", [(0.5, 1.0), (1.5, 2.0), (5.0, 100.0), (40.0, 1e-3)])
+def test_maximum_likelihood_weibull_matches_scipy(k, lam):
+    data = WeibullDistribution(k, lam).sample(5000, rng=2)
+    fitted = MaximumLikelihood(data).fit(WeibullDistribution)
+    k_ref, _, lam_ref = stats.weibull_min.fit(data, floc=0, method="MLE")
+    assert fitted.k == pytest.approx(k_ref, rel=1e-3)
+    assert fitted.lam == pytest.approx(lam_ref, rel=1e-3)
+    # The Newton solution is at least as good as scipy's numerical optimum
+    assert np.sum(fitted.logpdf(data)) >= np.sum(stats.weibull_min.logpdf(data, k_ref, scale=lam_ref)) - 1e-9
+    assert fitted.k == pytest.approx(k, rel=0.05)
+
+
+def test_maximum_likelihood_weibull_invalid_data():
+    with pytest.raises(ValueError):
+        MaximumLikelihood([1.0, -2.0, 3.0]).fit(WeibullDistribution)
+    with pytest.raises(ValueError):
+        MaximumLikelihood([2.0, 2.0, 2.0]).fit(WeibullDistribution)
+
+
+def test_maximum_likelihood_not_implemented():
+    with pytest.raises(NotImplementedError):
+        MaximumLikelihood([1.0, 2.0, 3.0]).fit(GammaDistribution)